@@ -0,0 +1,110 @@
+"""
+Benchmark ``RSS3Client`` end to end against the local stand-in server.
+
+For each page size and activity type, the typed ``fetch_*`` method is called ``--requests`` times and the report
+shows requests per second, errors, parse time per activity and the client's peak traced memory, which is measured
+on a separate, shorter pass because tracing slows the client down. The server runs in a separate process so it
+does not compete with the client for the GIL.
+
+Run with ``python -m benchmarks.bench_client --latency 0.01 --concurrency 8``.
+"""
+import argparse
+import inspect
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+from benchmarks.payloads import ACTIVITY_TYPES, PAGE_SIZES, load_fixture
+from rss3_dsl_sdk.client import RSS3Client
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+
+
+@contextmanager
+def stand_in_server(size: str, latency: float, jitter: float, error_rate: float) -> Iterator[str]:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.server", "--port", "0", "--size", size, "--latency", str(latency),
+         "--jitter", str(jitter), "--error-rate", str(error_rate), "--seed", "0"],
+        stdout=subprocess.PIPE, text=True
+    )
+    try:
+        line = process.stdout.readline()
+        if not line.startswith("listening on "):
+            raise RuntimeError("the stand-in server failed to start")
+        yield line[len("listening on "):].strip()
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def parse_time_per_activity(client: RSS3Client, tag: str, activity_type: str, size: str, repeat: int = 5) -> float:
+    model = inspect.signature(getattr(client, f"fetch_{tag}_{activity_type}_activities")).return_annotation
+    page = load_fixture(tag, activity_type, size)
+    body = json.dumps(page).encode()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        model.model_validate_json(body)
+    return (time.perf_counter() - start) / repeat / max(len(page["data"]), 1)
+
+
+def run(client: RSS3Client, tag: str, activity_type: str, requests: int, concurrency: int) -> Tuple[float, int]:
+    fetch = getattr(client, f"fetch_{tag}_{activity_type}_activities")
+
+    def call(_) -> int:
+        try:
+            fetch(ACCOUNT)
+            return 0
+        except Exception:
+            return -1
+
+    start = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(call, range(requests)))
+    else:
+        results = [call(i) for i in range(requests)]
+    elapsed = time.perf_counter() - start
+    return elapsed, sum(1 for result in results if result < 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", choices=list(PAGE_SIZES) + ["all"], default="all")
+    parser.add_argument("--types", nargs="*", default=None, help="tag/type pairs, e.g. social/post, default all")
+    parser.add_argument("--requests", type=int, default=50, help="requests per activity type")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    sizes: List[str] = list(PAGE_SIZES) if args.size == "all" else [args.size]
+    activity_types = [tuple(pair.split("/")) for pair in args.types] if args.types else ACTIVITY_TYPES
+
+    print(f"{'size':<8} {'activity type':<24} {'req/s':>9} {'errors':>7} {'parse us/act':>13} {'peak MiB':>9}")
+    for size in sizes:
+        with stand_in_server(size, args.latency, args.jitter, args.error_rate) as url:
+            with RSS3Client(base_url=url, pool_maxsize=max(args.concurrency, 1)) as client:
+                total_requests, total_elapsed, total_errors = 0, 0.0, 0
+                for tag, activity_type in activity_types:
+                    parse = parse_time_per_activity(client, tag, activity_type, size)
+                    elapsed, errors = run(client, tag, activity_type, args.requests, args.concurrency)
+                    tracemalloc.start()
+                    run(client, tag, activity_type, max(args.concurrency, 1), args.concurrency)
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+                    total_requests += args.requests
+                    total_elapsed += elapsed
+                    total_errors += errors
+                    print(f"{size:<8} {tag + '/' + activity_type:<24} {args.requests / elapsed:9.1f} {errors:7d} "
+                          f"{parse * 1e6:13.1f} {peak / 1024 / 1024:9.2f}")
+                print(f"{size:<8} {'total':<24} {total_requests / total_elapsed:9.1f} {total_errors:7d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Compare decoding a response page through ``json`` and keyword arguments with validating the raw bytes directly, and
+with scanning ``id``, ``timestamp`` and ``tag`` through lazy views and raw payloads.
+
+Run with ``python -m benchmarks.bench_decode``.
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from benchmarks.payloads import make_page_bytes
+from rss3_dsl_sdk.schemas.transaction import TransactionTransferActivities
+from rss3_dsl_sdk.views import LazyModel
+
+
+def decode_dict(body: bytes):
+    return TransactionTransferActivities(**json.loads(body))
+
+
+def decode_bytes(body: bytes):
+    return TransactionTransferActivities.model_validate_json(body)
+
+
+def scan_lazy(body: bytes):
+    view = LazyModel(TransactionTransferActivities, json.loads(body))
+    return [(activity.id, activity.timestamp, activity.tag) for activity in view.data]
+
+
+def scan_raw(body: bytes):
+    return [(activity["id"], activity["timestamp"], activity["tag"]) for activity in json.loads(body)["data"]]
+
+
+def measure(decode, body: bytes, repeat: int):
+    decode(body)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        decode(body)
+    elapsed = (time.perf_counter() - start) / repeat
+    tracemalloc.start()
+    decode(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--limit", type=int, default=100, help="activities per page")
+    parser.add_argument("--action-limit", type=int, default=20, help="actions per activity")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    body = make_page_bytes(limit=args.limit, action_limit=args.action_limit)
+    print(f"page: {len(body) / 1024:.0f} KiB, {args.limit} activities x {args.action_limit} actions")
+    results = {name: measure(decode, body, args.repeat)
+               for name, decode in (("json + Model(**dict)", decode_dict), ("model_validate_json", decode_bytes),
+                                    ("lazy view scan", scan_lazy), ("raw scan", scan_raw))}
+    for name, (elapsed, peak) in results.items():
+        print(f"{name:>22}: {elapsed * 1000:8.2f} ms/page  {elapsed * 1e6 / args.limit:8.1f} us/activity  "
+              f"peak {peak / 1024 / 1024:6.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Measure the per-call overhead of argument validation on a ``fetch_*``-shaped function with reused arguments.
+
+Run with ``python -m benchmarks.bench_validate_call``.
+"""
+import argparse
+import timeit
+from typing import Optional
+
+from pydantic import validate_call
+
+from rss3_dsl_sdk.schemas.base import ActivityFilter, PaginationOptions
+from rss3_dsl_sdk.schemas.enums import Platform
+from rss3_dsl_sdk.validation import fast_validate_call
+
+
+def fetch(account: str, filters: Optional[ActivityFilter] = None, pagination: Optional[PaginationOptions] = None):
+    return account
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    account = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+    filters = ActivityFilter(platform=[Platform.FARCASTER], success=True)
+    pagination = PaginationOptions(limit=100)
+    variants = {
+        "no validation": fetch,
+        "validate_call": validate_call(fetch),
+        "fast_validate_call": fast_validate_call(fetch),
+    }
+    baseline = None
+    for name, function in variants.items():
+        elapsed = timeit.timeit(lambda: function(account, filters=filters, pagination=pagination),
+                                number=args.number) / args.number
+        baseline = elapsed if baseline is None else baseline
+        print(f"{name:>20}: {elapsed * 1e6:6.2f} us/call  overhead {(elapsed - baseline) * 1e6:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+DSL response payloads shaped like real ``/decentralized/{account}`` pages: synthetic pages, and the fixture pages
+recorded in ``benchmarks/fixtures`` resized to small, typical and huge pages.
+"""
+import copy
+import json
+import os
+import random
+from typing import Dict, List, Optional, Tuple
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+ACTIVITY_TYPES: List[Tuple[str, str]] = [
+    ("collectible", "approval"), ("collectible", "burn"), ("collectible", "mint"), ("collectible", "trade"),
+    ("collectible", "transfer"),
+    ("exchange", "liquidity"), ("exchange", "staking"), ("exchange", "swap"),
+    ("metaverse", "burn"), ("metaverse", "mint"), ("metaverse", "trade"), ("metaverse", "transfer"),
+    ("social", "comment"), ("social", "delete"), ("social", "mint"), ("social", "post"), ("social", "profile"),
+    ("social", "proxy"), ("social", "revise"), ("social", "reward"), ("social", "share"),
+    ("transaction", "approval"), ("transaction", "bridge"), ("transaction", "burn"), ("transaction", "mint"),
+    ("transaction", "transfer"),
+]
+
+PAGE_SIZES: Dict[str, Optional[Tuple[int, int]]] = {
+    "small": (1, 1),
+    "typical": None,
+    "huge": (100, 20),
+}
+"""The ``(limit, action_limit)`` of each page size, ``None`` to keep the recorded page as-is."""
+
+
+def _address(rng: random.Random) -> str:
+    return "0x" + "".join(rng.choice("0123456789abcdef") for _ in range(40))
+
+
+def _token(rng: random.Random) -> dict:
+    return {
+        "address": _address(rng),
+        "value": str(rng.randrange(10 ** 24)),
+        "name": "Wrapped Ether",
+        "symbol": "WETH",
+        "decimals": 18,
+        "standard": "ERC-20",
+    }
+
+
+def make_metadata(tag: str, activity_type: str, rng: random.Random) -> dict:
+    if tag == "exchange" and activity_type == "swap":
+        return {"from": _token(rng), "to": _token(rng)}
+    if tag == "transaction" and activity_type == "bridge":
+        return {"action": "deposit", "source_network": "ethereum", "target_network": "optimism", "token": _token(rng)}
+    if tag == "social" and activity_type == "profile":
+        return {"action": 1, "profile_id": str(rng.randrange(10 ** 6)), "handle": "vitalik.eth", "bio": "hello"}
+    if tag == "social" and activity_type == "proxy":
+        return {"action": 1, "proxy_address": _address(rng)}
+    if tag == "social" and activity_type == "delete":
+        return {}
+    if tag == "social":
+        return {
+            "handle": "vitalik.eth",
+            "body": "gm " * rng.randrange(5, 60),
+            "profile_id": str(rng.randrange(10 ** 6)),
+            "publication_id": hex(rng.randrange(10 ** 12)),
+            "tags": ["ethereum", "rss3"],
+            "timestamp": 1700000000,
+        }
+    if tag == "rss":
+        return {"title": "Post", "description": "An RSS item", "pub_date": "2024-01-01T00:00:00Z",
+                "authors": [{"name": "author"}]}
+    return _token(rng)
+
+
+def make_activity(tag: str, activity_type: str, index: int, actions: int, rng: random.Random,
+                  timestamp: Optional[int] = None) -> dict:
+    return {
+        "id": "0x" + "".join(rng.choice("0123456789abcdef") for _ in range(64)),
+        "owner": ACCOUNT,
+        "network": "ethereum",
+        "index": index,
+        "from": ACCOUNT,
+        "to": _address(rng),
+        "tag": tag,
+        "type": activity_type,
+        "platform": "Uniswap",
+        "fee": {"address": None, "amount": str(rng.randrange(10 ** 15)), "decimal": 18},
+        "calldata": {
+            "raw": "0x" + "".join(rng.choice("0123456789abcdef") for _ in range(8 + 64 * rng.randrange(2, 12))),
+            "function_hash": "0xa9059cbb",
+            "parsed_function": "transfer",
+        },
+        "total_actions": actions,
+        "actions": [
+            {
+                "tag": tag,
+                "type": activity_type,
+                "platform": "Uniswap",
+                "from": ACCOUNT,
+                "to": _address(rng),
+                "metadata": make_metadata(tag, activity_type, rng),
+                "related_urls": [f"https://etherscan.io/tx/{index}"],
+            }
+            for _ in range(actions)
+        ],
+        "direction": "out",
+        "success": True,
+        "timestamp": timestamp if timestamp is not None else 1700000000 - index * 60,
+    }
+
+
+def make_page(tag: str = "transaction", activity_type: str = "transfer", limit: int = 100, action_limit: int = 10,
+              cursor: Optional[str] = "next", seed: int = 0) -> dict:
+    """
+    Build a response page.
+
+    :param tag: The tag of the activities.
+    :param activity_type: The type of the activities.
+    :param limit: The number of activities in the page.
+    :param action_limit: The number of actions per activity.
+    :param cursor: The cursor of the next page.
+    :param seed: The seed of the random generator, so pages are reproducible.
+    :return: The decoded JSON payload.
+    """
+    rng = random.Random(seed)
+    return {
+        "data": [make_activity(tag, activity_type, index, action_limit, rng) for index in range(limit)],
+        "meta": {"cursor": cursor} if cursor else None,
+    }
+
+
+def make_page_bytes(*args, **kwargs) -> bytes:
+    return json.dumps(make_page(*args, **kwargs)).encode()
+
+
+def fixture_path(tag: str, activity_type: str) -> str:
+    return os.path.join(FIXTURES_DIR, f"{tag}_{activity_type}.json")
+
+
+def load_fixture(tag: str, activity_type: str, size: str = "typical") -> dict:
+    """
+    Load a recorded page and resize it.
+
+    :param tag: The tag of the activities.
+    :param activity_type: The type of the activities.
+    :param size: One of :data:`PAGE_SIZES`.
+    :return: The decoded JSON payload.
+    """
+    with open(fixture_path(tag, activity_type)) as file:
+        page = json.load(file)
+    dimensions = PAGE_SIZES[size]
+    return page if dimensions is None else resize_page(page, *dimensions)
+
+
+def resize_page(page: dict, limit: int, action_limit: int) -> dict:
+    """
+    Resize a page by cycling its activities and their actions, giving each copy a distinct id.
+
+    :param page: The page to resize.
+    :param limit: The number of activities of the resized page.
+    :param action_limit: The number of actions per activity of the resized page.
+    :return: The resized page.
+    """
+    source = page["data"]
+    data = []
+    for index in range(limit if source else 0):
+        activity = copy.deepcopy(source[index % len(source)])
+        activity["id"] = f"{activity['id'][:-8]}{index:08x}"
+        actions = activity["actions"]
+        activity["actions"] = [copy.deepcopy(actions[i % len(actions)]) for i in range(action_limit if actions else 0)]
+        activity["total_actions"] = len(activity["actions"])
+        data.append(activity)
+    return {"data": data, "meta": page.get("meta")}
@@ -0,0 +1,44 @@
+"""
+Record one page per activity tag and type from a DSL node into ``benchmarks/fixtures``.
+
+Run with ``python -m benchmarks.record``. Pass ``--synthetic`` to write reproducible synthetic pages instead, for
+machines without network access.
+"""
+import argparse
+import json
+import os
+
+from benchmarks.payloads import ACCOUNT, ACTIVITY_TYPES, FIXTURES_DIR, fixture_path, make_page
+from rss3_dsl_sdk.client import RSS3Client
+from rss3_dsl_sdk.schemas.base import PaginationOptions
+from rss3_dsl_sdk.schemas.enums import ActivityTag, ActivityType
+from rss3_dsl_sdk.views import ResultMode
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="https://gi.rss3.io")
+    parser.add_argument("--account", default=ACCOUNT)
+    parser.add_argument("--limit", type=int, default=5, help="activities per page")
+    parser.add_argument("--action-limit", type=int, default=2, help="actions per activity")
+    parser.add_argument("--synthetic", action="store_true", help="write synthetic pages instead of recording")
+    args = parser.parse_args()
+
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    with RSS3Client(base_url=args.base_url, result_mode=ResultMode.RAW) as client:
+        for seed, (tag, activity_type) in enumerate(ACTIVITY_TYPES):
+            if args.synthetic:
+                page = make_page(tag, activity_type, limit=args.limit, action_limit=args.action_limit, seed=seed)
+            else:
+                page = client.fetch_activities(args.account, tag=ActivityTag(tag),
+                                               activity_type=ActivityType(activity_type),
+                                               pagination=PaginationOptions(limit=args.limit,
+                                                                            action_limit=args.action_limit))
+            with open(fixture_path(tag, activity_type), "w") as file:
+                json.dump(page, file)
+                file.write("\n")
+            print(f"{tag}/{activity_type}: {len(page['data'])} activities")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+A local stand-in for a DSL node that serves the recorded fixture pages, with configurable latency, jitter and error
+rate.
+
+Run with ``python -m benchmarks.server --port 8080 --latency 0.02 --jitter 0.01 --error-rate 0.01``.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.payloads import PAGE_SIZES, load_fixture
+
+DEFAULT_ACTIVITY_TYPE = ("transaction", "transfer")
+
+
+class StandInServer:
+    """
+    A threaded HTTP/1.1 server answering ``/decentralized/{account}`` with fixture pages.
+
+    Every feed is ``pages`` pages deep; the cursor of each page is the number of the next one.
+    """
+
+    def __init__(
+            self,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            size: str = "typical",
+            pages: int = 10,
+            latency: float = 0.0,
+            jitter: float = 0.0,
+            error_rate: float = 0.0,
+            error_status: int = 500,
+            seed: Optional[int] = None
+    ):
+        """
+        Initialize the server.
+
+        :param host: The interface to listen on.
+        :param port: The port to listen on, 0 for any free port.
+        :param size: The page size, one of :data:`benchmarks.payloads.PAGE_SIZES`.
+        :param pages: The number of pages of every feed.
+        :param latency: The mean delay in seconds before each response.
+        :param jitter: The maximum deviation in seconds from ``latency``, uniformly distributed.
+        :param error_rate: The probability of answering with ``error_status`` instead of a page.
+        :param error_status: The HTTP status of simulated errors.
+        :param seed: The seed of the random generator, for reproducible runs.
+        """
+        if size not in PAGE_SIZES:
+            raise ValueError(f"size must be one of {', '.join(PAGE_SIZES)}")
+        self.size = size
+        self.pages = pages
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._bodies: Dict[Tuple[str, str], bytes] = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                status, body = server.handle(self.path)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://{host}:{self.httpd.server_address[1]}"
+
+    def handle(self, path: str) -> Tuple[int, bytes]:
+        """
+        Answer a request.
+
+        :param path: The request path with its query string.
+        :return: The HTTP status and body.
+        """
+        with self._lock:
+            self.requests += 1
+            delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+        if delay:
+            time.sleep(delay)
+        if failed:
+            return self.error_status, json.dumps({"error": "simulated failure"}).encode()
+        parts = urlsplit(path)
+        if not parts.path.startswith("/decentralized/"):
+            return 404, json.dumps({"error": "not found"}).encode()
+        query = parse_qs(parts.query)
+        activity_type = (query["tag"][0], query["type"][0]) if "tag" in query and "type" in query \
+            else DEFAULT_ACTIVITY_TYPE
+        page = int(query.get("cursor", ["0"])[0])
+        cursor = json.dumps({"cursor": str(page + 1)} if page + 1 < self.pages else None).encode()
+        return 200, b'{"data":' + self._data(activity_type) + b',"meta":' + cursor + b'}'
+
+    def _data(self, activity_type: Tuple[str, str]) -> bytes:
+        body = self._bodies.get(activity_type)
+        if body is None:
+            body = json.dumps(load_fixture(*activity_type, size=self.size)["data"]).encode()
+            self._bodies[activity_type] = body
+        return body
+
+    def serve_forever(self):
+        self.httpd.serve_forever()
+
+    def start(self) -> "StandInServer":
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--size", choices=list(PAGE_SIZES), default="typical")
+    parser.add_argument("--pages", type=int, default=10, help="pages per feed")
+    parser.add_argument("--latency", type=float, default=0.0, help="mean response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="maximum deviation from the latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of an error response")
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    server = StandInServer(host=args.host, port=args.port, size=args.size, pages=args.pages, latency=args.latency,
+                           jitter=args.jitter, error_rate=args.error_rate, error_status=args.error_status,
+                           seed=args.seed)
+    print(f"listening on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
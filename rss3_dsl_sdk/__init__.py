@@ -1,2 +1,2 @@
 from rss3_dsl_sdk.client import RSS3Client
-
+from rss3_dsl_sdk.async_client import AsyncRSS3Client
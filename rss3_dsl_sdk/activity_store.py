@@ -0,0 +1,365 @@
+import json
+import sys
+import threading
+from array import array
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type
+
+from pydantic import BaseModel
+
+from rss3_dsl_sdk.schemas.enums import ActivityTag, ActivityType, Direction, Network
+from rss3_dsl_sdk.schemas.registry import TypedActivity
+from rss3_dsl_sdk.views import LazyModel, get_field
+
+_NESTED = ("fee", "calldata", "actions")
+_SEPARATORS = (",", ":")
+
+
+class _Interner:
+    """
+    Maps repeated values to small integer codes. Code 0 stands for ``None``.
+    """
+
+    __slots__ = ("values", "codes", "decode")
+
+    def __init__(self, decode: Optional[Type[Enum]] = None):
+        self.values: List[Any] = [None]
+        self.codes: Dict[Any, int] = {}
+        self.decode = decode
+
+    def code(self, value: Any) -> int:
+        if value is None:
+            return 0
+        if isinstance(value, Enum):
+            value = value.value
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(self.__decode(value))
+        return code
+
+    def __decode(self, value: str) -> Any:
+        if self.decode is None:
+            return sys.intern(value)
+        try:
+            return self.decode(value)
+        except ValueError:
+            return sys.intern(value)
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.codes) + sys.getsizeof(self.values) + \
+            sum(sys.getsizeof(value) for value in self.values if isinstance(value, str) and not isinstance(value, Enum))
+
+
+class _Strings:
+    """
+    Variable-length byte strings packed into a single buffer with an offset index.
+    """
+
+    __slots__ = ("data", "offsets")
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array("Q", [0])
+
+    def append(self, value: bytes):
+        self.data += value
+        self.offsets.append(len(self.data))
+
+    def __getitem__(self, row: int) -> bytes:
+        return bytes(self.data[self.offsets[row]:self.offsets[row + 1]])
+
+    def nbytes(self) -> int:
+        return len(self.data) + _array_nbytes(self.offsets)
+
+
+class ActivityRow:
+    """
+    A lightweight view over one activity of an :class:`ActivityStore`.
+
+    The scalar fields are read from the store's columns under the attribute names of
+    :class:`~rss3_dsl_sdk.schemas.base.Activity`. The nested ``fee``, ``calldata`` and ``actions`` are decoded on
+    each access, as :class:`~rss3_dsl_sdk.views.LazyModel` views where they are models, and :meth:`model_build`
+    materializes the full model.
+    """
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "ActivityStore", row: int):
+        self._store = store
+        self._row = row
+
+    @property
+    def id(self) -> str:
+        return self._store._ids[self._row].decode()
+
+    @property
+    def owner(self) -> Optional[str]:
+        return self._store._addresses.values[self._store._owners[self._row]]
+
+    @property
+    def network(self) -> Network:
+        return self._store._networks.values[self._store._network_codes[self._row]]
+
+    @property
+    def index(self) -> int:
+        return self._store._indexes[self._row]
+
+    @property
+    def from_(self) -> str:
+        return self._store._addresses.values[self._store._senders[self._row]]
+
+    @property
+    def to(self) -> str:
+        return self._store._addresses.values[self._store._recipients[self._row]]
+
+    @property
+    def tag(self) -> ActivityTag:
+        return self._store._tags.values[self._store._tag_codes[self._row]]
+
+    @property
+    def type(self) -> ActivityType:
+        return self._store._types.values[self._store._type_codes[self._row]]
+
+    @property
+    def platform(self) -> Optional[str]:
+        return self._store._platforms.values[self._store._platform_codes[self._row]]
+
+    @property
+    def total_actions(self) -> int:
+        return self._store._total_actions[self._row]
+
+    @property
+    def direction(self) -> Optional[Direction]:
+        return self._store._directions.values[self._store._direction_codes[self._row]]
+
+    @property
+    def status(self) -> bool:
+        return bool(self._store._statuses[self._row])
+
+    @property
+    def timestamp(self) -> int:
+        return self._store._timestamps[self._row]
+
+    @property
+    def model_payload(self) -> dict:
+        """
+        The activity as its JSON payload.
+        """
+        payload = {
+            "id": self.id,
+            "owner": self.owner,
+            "network": _value(self.network),
+            "index": self.index,
+            "from": self.from_,
+            "to": self.to,
+            "tag": _value(self.tag),
+            "type": _value(self.type),
+            "platform": self.platform,
+            "total_actions": self.total_actions,
+            "direction": _value(self.direction),
+            "success": self.status,
+            "timestamp": self.timestamp,
+        }
+        payload.update(self.__nested())
+        return payload
+
+    def model_build(self) -> BaseModel:
+        """
+        Materialize the activity as a model of the store.
+
+        :return: The model instance.
+        """
+        return self._store.model.model_validate(self.model_payload)
+
+    def __nested(self) -> dict:
+        return json.loads(self._store._nested[self._row])
+
+    def __getattr__(self, name: str) -> Any:
+        if name in _NESTED:
+            return getattr(LazyModel(self._store.model, self.__nested()), name)
+        raise AttributeError(f"'ActivityRow' object has no attribute {name!r}")
+
+    def __repr__(self) -> str:
+        return f"ActivityRow({self.id!r}, {_value(self.tag)}.{_value(self.type)}, timestamp={self.timestamp})"
+
+
+class ActivityStore:
+    """
+    An append-only, memory-compact store of activities.
+
+    Instead of a graph of pydantic objects per activity, the scalar fields are kept in typed columns
+    (:class:`array.array`), the networks, tags, types, directions and platforms as small integer codes, the owner,
+    sender and recipient addresses as codes into a table holding each distinct address once, and the ids in one
+    packed buffer. The nested fee, call data and actions are kept as compact JSON bytes and decoded only when read.
+    Rows are read through :class:`ActivityRow` views, and full models are materialized on demand.
+
+    Appends are serialized by a lock, so several threads may ingest pages into the same store.
+    """
+
+    def __init__(self, model: Type[BaseModel] = TypedActivity):
+        """
+        Initialize an empty store.
+
+        :param model: The activity model that rows are materialized into.
+        """
+        self.model = model
+        self._lock = threading.Lock()
+        self._ids = _Strings()
+        self._nested = _Strings()
+        self._timestamps = array("q")
+        self._indexes = array("q")
+        self._total_actions = array("l")
+        self._statuses = array("b")
+        self._owners = array("L")
+        self._senders = array("L")
+        self._recipients = array("L")
+        self._network_codes = array("B")
+        self._tag_codes = array("B")
+        self._type_codes = array("B")
+        self._direction_codes = array("B")
+        self._platform_codes = array("H")
+        self._addresses = _Interner()
+        self._networks = _Interner(Network)
+        self._tags = _Interner(ActivityTag)
+        self._types = _Interner(ActivityType)
+        self._directions = _Interner(Direction)
+        self._platforms = _Interner()
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __getitem__(self, row: int) -> ActivityRow:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("activity store index out of range")
+        return ActivityRow(self, row)
+
+    def __iter__(self) -> Iterator[ActivityRow]:
+        return (ActivityRow(self, row) for row in range(len(self)))
+
+    def add(self, activity: Any):
+        """
+        Append an activity.
+
+        :param activity: The activity, as a model, a :class:`~rss3_dsl_sdk.views.LazyModel` or a raw payload, so
+            pages fetched in any :class:`~rss3_dsl_sdk.views.ResultMode` can be ingested.
+        """
+        self.extend((activity,))
+
+    def add_page(self, page: Any):
+        """
+        Append the activities of a page.
+
+        :param page: The page returned by a ``fetch_*`` method, in any result mode.
+        """
+        self.extend(get_field(page, "data") or ())
+
+    def extend(self, activities: Iterable[Any]):
+        """
+        Append activities.
+
+        :param activities: The activities, e.g. from :meth:`~rss3_dsl_sdk.client.RSS3Client.iter_activities`.
+        """
+        with self._lock:
+            for activity in activities:
+                if isinstance(activity, LazyModel):
+                    activity = activity.model_payload
+                if isinstance(activity, dict):
+                    self.__append_payload(activity)
+                else:
+                    self.__append_model(activity)
+
+    def __append_model(self, activity: BaseModel):
+        self.__append(activity.id, activity.owner, activity.network, activity.index, activity.from_, activity.to,
+                      activity.tag, activity.type, activity.platform, activity.total_actions, activity.direction,
+                      activity.status, activity.timestamp,
+                      activity.model_dump_json(include=set(_NESTED), by_alias=True).encode())
+
+    def __append_payload(self, activity: dict):
+        nested = {name: activity[name] for name in _NESTED if name in activity}
+        self.__append(activity["id"], activity.get("owner"), activity["network"], activity["index"],
+                      activity["from"], activity["to"], activity["tag"], activity["type"], activity.get("platform"),
+                      activity["total_actions"], activity.get("direction"), activity["success"],
+                      activity["timestamp"], json.dumps(nested, separators=_SEPARATORS).encode())
+
+    def __append(self, activity_id: str, owner: Optional[str], network: Any, index: int, sender: str,
+                 recipient: str, tag: Any, activity_type: Any, platform: Optional[str], total_actions: int,
+                 direction: Any, status: bool, timestamp: int, nested: bytes):
+        # Every value is encoded and checked against its column before any column grows, so a malformed activity
+        # raises without leaving the columns at different lengths.
+        encoded_id = activity_id.encode()
+        row = [(column, array(column.typecode, (value,))) for column, value in (
+            (self._owners, self._addresses.code(owner)),
+            (self._network_codes, self._networks.code(network)),
+            (self._indexes, index),
+            (self._senders, self._addresses.code(sender)),
+            (self._recipients, self._addresses.code(recipient)),
+            (self._tag_codes, self._tags.code(tag)),
+            (self._type_codes, self._types.code(activity_type)),
+            (self._platform_codes, self._platforms.code(platform)),
+            (self._total_actions, total_actions),
+            (self._direction_codes, self._directions.code(direction)),
+            (self._statuses, bool(status)),
+            (self._timestamps, timestamp),
+        )]
+        self._ids.append(encoded_id)
+        self._nested.append(nested)
+        for column, value in row:
+            column.extend(value)
+
+    def materialize(self, row: int) -> BaseModel:
+        """
+        Build the full model of an activity.
+
+        :param row: The position of the activity.
+        :return: The model instance.
+        """
+        return self[row].model_build()
+
+    def column(self, name: str) -> List[Any]:
+        """
+        Read a scalar field of all activities at once, much faster than through the rows.
+
+        :param name: The attribute name of the field, e.g. ``"timestamp"``, ``"tag"`` or ``"from_"``.
+        :return: The values in insertion order.
+        """
+        if name == "id":
+            return [self._ids[row].decode() for row in range(len(self))]
+        if name == "status":
+            return [bool(status) for status in self._statuses]
+        numbers = {"timestamp": self._timestamps, "index": self._indexes, "total_actions": self._total_actions}
+        if name in numbers:
+            return numbers[name].tolist()
+        codes = {"owner": (self._owners, self._addresses), "from_": (self._senders, self._addresses),
+                 "to": (self._recipients, self._addresses), "network": (self._network_codes, self._networks),
+                 "tag": (self._tag_codes, self._tags), "type": (self._type_codes, self._types),
+                 "direction": (self._direction_codes, self._directions),
+                 "platform": (self._platform_codes, self._platforms)}
+        if name not in codes:
+            raise KeyError(f"{name!r} is not a scalar activity field")
+        column, interner = codes[name]
+        values = interner.values
+        return [values[code] for code in column]
+
+    def nbytes(self) -> int:
+        """
+        Estimate the memory held by the store.
+
+        :return: The number of bytes of the columns and the interned values.
+        """
+        columns = (self._timestamps, self._indexes, self._total_actions, self._statuses, self._owners,
+                   self._senders, self._recipients, self._network_codes, self._tag_codes, self._type_codes,
+                   self._direction_codes, self._platform_codes)
+        interners = (self._addresses, self._networks, self._tags, self._types, self._directions, self._platforms)
+        return sum(_array_nbytes(column) for column in columns) + self._ids.nbytes() + self._nested.nbytes() + \
+            sum(interner.nbytes() for interner in interners)
+
+
+def _array_nbytes(column: array) -> int:
+    return column.buffer_info()[1] * column.itemsize
+
+
+def _value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
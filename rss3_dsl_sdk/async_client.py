@@ -0,0 +1,716 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Iterable, List, Optional, Tuple, Type, Union
+
+from rss3_dsl_sdk.schemas.collectible import (
+    CollectibleApprovalActivities,
+    CollectibleBurnActivities,
+    CollectibleMintActivities,
+    CollectibleTradeActivities,
+    CollectibleTransferActivities
+)
+from rss3_dsl_sdk.client import ModelT, build_activity_params
+from rss3_dsl_sdk.schemas.base import PaginationOptions, ActivityFilter, Activities
+from rss3_dsl_sdk.schemas.enums import ActivityTag, ActivityType
+from rss3_dsl_sdk.schemas.exchange import (
+    ExchangeLiquidityActivities,
+    ExchangeStakingActivities,
+    ExchangeSwapActivities
+)
+from rss3_dsl_sdk.schemas.metaverse import (
+    MetaverseBurnActivities,
+    MetaverseMintActivities,
+    MetaverseTradeActivities,
+    MetaverseTransferActivities
+)
+from rss3_dsl_sdk.schemas.registry import TypedActivities
+from rss3_dsl_sdk.schemas.rss import (
+    RssFeedActivities
+)
+from rss3_dsl_sdk.schemas.social import (
+    SocialCommentActivities,
+    SocialDeleteActivities,
+    SocialMintActivities,
+    SocialPostActivities,
+    SocialReviseActivities,
+    SocialRewardActivities,
+    SocialShareActivities,
+    SocialProfileActivities,
+    SocialProxyActivities
+)
+from rss3_dsl_sdk.schemas.transaction import (
+    TransactionApprovalActivities,
+    TransactionBridgeActivities,
+    TransactionBurnActivities,
+    TransactionMintActivities,
+    TransactionTransferActivities
+)
+from rss3_dsl_sdk.balancer import EndpointPool, resolve_base_url
+from rss3_dsl_sdk.hedge import HedgePolicy
+from rss3_dsl_sdk.retry import RetryPolicy, TokenBucket
+from rss3_dsl_sdk.transport import DEFAULT_RETRY, AsyncPooledTransport, Timeout
+from rss3_dsl_sdk.validation import fast_validate_call
+
+
+class AsyncRSS3Client:
+    """
+    An asyncio client for interacting with the RSS3 Data Sub Layer (DSL) API.
+
+    It mirrors :class:`rss3_dsl_sdk.client.RSS3Client` with coroutine ``fetch_*`` methods that share one pool of
+    keep-alive connections. Requires the ``async`` extra (``pip install rss3-dsl-sdk[async]``).
+    """
+
+    def __init__(
+            self,
+            base_url: Union[str, List[str], EndpointPool] = "https://gi.rss3.io",
+            max_connections: int = 100,
+            max_keepalive_connections: int = 20,
+            keepalive_expiry: Optional[float] = 5.0,
+            timeout: Optional[Timeout] = None,
+            retry: Optional[RetryPolicy] = DEFAULT_RETRY,
+            rate_limit: Optional[TokenBucket] = None,
+            adaptive_concurrency: bool = True,
+            hedge: Optional[HedgePolicy] = None,
+            compression: bool = True
+    ):
+        """
+        Initialize the client with the base URL of the RSS3 DSL API.
+
+        :param base_url: The base URL of the API, or a list of the base URLs of several DSL nodes, which are then
+            balanced by latency with failover, or an :class:`~rss3_dsl_sdk.balancer.EndpointPool` to tune that.
+        :param max_connections: The maximum number of concurrent connections, which also bounds :meth:`gather`.
+        :param max_keepalive_connections: The maximum number of idle connections kept open.
+        :param keepalive_expiry: The number of seconds an idle connection is kept open.
+        :param timeout: The request timeout in seconds, either a single value or a ``(connect, read)`` tuple.
+        :param retry: How failed requests are retried, by default up to 3 times with jittered exponential backoff
+            that honors ``Retry-After``. ``None`` disables retries.
+        :param rate_limit: An optional :class:`~rss3_dsl_sdk.retry.TokenBucket` that bounds the request rate.
+        :param adaptive_concurrency: Whether to lower the number of requests in flight when the node throttles
+            (429 or 503) and raise it again, up to ``max_connections``, as requests succeed.
+        :param hedge: An optional :class:`~rss3_dsl_sdk.hedge.HedgePolicy`. Requests slower than a percentile of
+            recent latencies are then sent a second time and the first response wins, within an extra-load budget.
+        :param compression: Whether to ask the node for compressed responses, which are decompressed as they are
+            read. Install the ``compression`` extra to also accept Brotli and Zstandard.
+        """
+        self.base_url, self.endpoints = resolve_base_url(base_url)
+        self.max_connections = max_connections
+        self.transport = AsyncPooledTransport(max_connections=max_connections,
+                                              max_keepalive_connections=max_keepalive_connections,
+                                              keepalive_expiry=keepalive_expiry, timeout=timeout, retry=retry,
+                                              rate_limit=rate_limit, adaptive_concurrency=adaptive_concurrency,
+                                              hedge=hedge, endpoints=self.endpoints, compression=compression)
+
+    async def aclose(self):
+        """
+        Close the client and release its pooled connections.
+        """
+        await self.transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def gather(self, *aws: Awaitable, limit: Optional[int] = None, return_exceptions: bool = False) -> List:
+        """
+        Run awaitables concurrently with at most ``limit`` of them in flight, like :func:`asyncio.gather`.
+
+        :param aws: The awaitables to run, typically ``fetch_*`` coroutines of this client.
+        :param limit: The maximum number of awaitables in flight, ``max_connections`` by default.
+        :param return_exceptions: Whether to return exceptions as results instead of raising the first one.
+        :return: The results in the order of ``aws``.
+        """
+        semaphore = asyncio.Semaphore(limit or self.max_connections)
+
+        async def run(aw: Awaitable):
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=return_exceptions)
+
+    async def fetch_activities(
+            self,
+            account: str,
+            tag: Optional[ActivityTag] = None,
+            activity_type: Optional[ActivityType] = None,
+            pagination: Optional[PaginationOptions] = None,
+            filters: Optional[ActivityFilter] = None
+    ) -> TypedActivities:
+        """
+        Retrieve activities for a specific account.
+
+        The metadata of each action is parsed into the model of its tag and type, e.g. ``SocialPostMetadata``, and
+        kept as a dictionary for combinations without a model.
+
+        :param account: The account address.
+        :param pagination: Pagination options for the request.
+        :param filters: Filters to apply to the activity retrieval.
+        :param tag: Tag for the activities.
+        :param activity_type: Type for the activities.
+        :return: A dictionary containing the account activities.
+        """
+        return await self.__do_fetch_activities(TypedActivities, account, tag=tag, activity_type=activity_type,
+                                                pagination=pagination, filters=filters)
+
+    async def fetch_activities_bulk(
+            self,
+            accounts: Iterable[str],
+            tag: Optional[ActivityTag] = None,
+            activity_type: Optional[ActivityType] = None,
+            pagination: Optional[PaginationOptions] = None,
+            filters: Optional[ActivityFilter] = None,
+            limit: Optional[int] = None
+    ) -> AsyncIterator[Tuple[str, Union[Activities, Exception]]]:
+        """
+        Retrieve activities for many accounts with at most ``limit`` requests in flight.
+
+        Results are yielded in completion order as ``(account, result)`` pairs. A failing account yields the raised
+        exception as its result instead of interrupting the batch. Accounts are read lazily from ``accounts``.
+
+        :param accounts: The account addresses.
+        :param tag: Tag for the activities.
+        :param activity_type: Type for the activities.
+        :param pagination: Pagination options for each request.
+        :param filters: Filters to apply to the activity retrieval.
+        :param limit: The maximum number of requests in flight, ``max_connections`` by default.
+        :return: An async iterator over ``(account, activities or exception)`` pairs.
+        """
+        limit = limit or self.max_connections
+        accounts = iter(accounts)
+        pending = {}
+        try:
+            while True:
+                for account in accounts:
+                    task = asyncio.ensure_future(self.fetch_activities(account, tag=tag, activity_type=activity_type,
+                                                                       pagination=pagination, filters=filters))
+                    pending[task] = account
+                    if len(pending) >= limit:
+                        break
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    account = pending.pop(task)
+                    error = task.exception()
+                    yield account, error if error is not None else task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def __do_fetch_activities(self, model: Type[ModelT], account: str,
+                                    tag: Optional[ActivityTag] = None,
+                                    activity_type: Optional[ActivityType] = None,
+                                    pagination: Optional[PaginationOptions] = None,
+                                    filters: Optional[ActivityFilter] = None) -> ModelT:
+        url = f"{self.base_url}/decentralized/{account}"
+        params = build_activity_params(tag, activity_type, pagination, filters)
+        return await self.__get(model, url, params=params)
+
+    async def __get(self, model: Type[ModelT], url: str, params: Optional[dict] = None) -> ModelT:
+        response = await self.transport.get(url, params=params)
+        return model.model_validate_json(response.content)
+
+    @fast_validate_call
+    async def fetch_collectible_approval_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> CollectibleApprovalActivities:
+        """
+        Retrieve collectible approval activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the collectible approval activities.
+        """
+        return await self.__do_fetch_activities(CollectibleApprovalActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.APPROVAL)
+
+    @fast_validate_call
+    async def fetch_collectible_burn_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> CollectibleBurnActivities:
+        """
+        Retrieve collectible burn activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the collectible burn activities.
+        """
+        return await self.__do_fetch_activities(CollectibleBurnActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.BURN)
+
+    @fast_validate_call
+    async def fetch_collectible_mint_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> CollectibleMintActivities:
+        """
+        Retrieve collectible mint activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the collectible mint activities.
+        """
+        return await self.__do_fetch_activities(CollectibleMintActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.MINT)
+
+    @fast_validate_call
+    async def fetch_collectible_trade_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> CollectibleTradeActivities:
+        """
+        Retrieve collectible trade activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the collectible trade activities.
+        """
+        return await self.__do_fetch_activities(CollectibleTradeActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.TRADE)
+
+    @fast_validate_call
+    async def fetch_collectible_transfer_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> CollectibleTransferActivities:
+        """
+        Retrieve collectible transfer activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the collectible transfer activities.
+        """
+        return await self.__do_fetch_activities(CollectibleTransferActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.TRANSFER)
+
+    @fast_validate_call
+    async def fetch_exchange_liquidity_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> ExchangeLiquidityActivities:
+        """
+        Retrieve exchange liquidity activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the exchange liquidity activities.
+        """
+        return await self.__do_fetch_activities(ExchangeLiquidityActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.EXCHANGE, activity_type=ActivityType.LIQUIDITY)
+
+    @fast_validate_call
+    async def fetch_exchange_staking_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> ExchangeStakingActivities:
+        """
+        Retrieve exchange staking activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the exchange staking activities.
+        """
+        return await self.__do_fetch_activities(ExchangeStakingActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.EXCHANGE, activity_type=ActivityType.STAKING)
+
+    @fast_validate_call
+    async def fetch_exchange_swap_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> ExchangeSwapActivities:
+        """
+        Retrieve exchange swap activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the exchange swap activities.
+        """
+        return await self.__do_fetch_activities(ExchangeSwapActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.EXCHANGE, activity_type=ActivityType.SWAP)
+
+    @fast_validate_call
+    async def fetch_metaverse_burn_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> MetaverseBurnActivities:
+        """
+        Retrieve metaverse burn activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the metaverse burn activities.
+        """
+        return await self.__do_fetch_activities(MetaverseBurnActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.METAVERSE, activity_type=ActivityType.BURN)
+
+    @fast_validate_call
+    async def fetch_metaverse_mint_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> MetaverseMintActivities:
+        """
+        Retrieve metaverse mint activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the metaverse mint activities.
+        """
+        return await self.__do_fetch_activities(MetaverseMintActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.METAVERSE, activity_type=ActivityType.MINT)
+
+    @fast_validate_call
+    async def fetch_metaverse_trade_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> MetaverseTradeActivities:
+        """
+        Retrieve metaverse trade activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the metaverse trade activities.
+        """
+        return await self.__do_fetch_activities(MetaverseTradeActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.METAVERSE, activity_type=ActivityType.TRADE)
+
+    @fast_validate_call
+    async def fetch_metaverse_transfer_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> MetaverseTransferActivities:
+        """
+        Retrieve metaverse transfer activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the metaverse transfer activities.
+        """
+        return await self.__do_fetch_activities(MetaverseTransferActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.METAVERSE, activity_type=ActivityType.TRANSFER)
+
+    @fast_validate_call
+    async def fetch_social_comment_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> SocialCommentActivities:
+        """
+        Retrieve social comment activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the social comment activities.
+        """
+        return await self.__do_fetch_activities(SocialCommentActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.SOCIAL, activity_type=ActivityType.COMMENT)
+
+    @fast_validate_call
+    async def fetch_social_delete_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> SocialDeleteActivities:
+        """
+        Retrieve social delete activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the social delete activities.
+        """
+        return await self.__do_fetch_activities(SocialDeleteActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.SOCIAL, activity_type=ActivityType.DELETE)
+
+    @fast_validate_call
+    async def fetch_social_mint_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> SocialMintActivities:
+        """
+        Retrieve social mint activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the social mint activities.
+        """
+        return await self.__do_fetch_activities(SocialMintActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.SOCIAL, activity_type=ActivityType.MINT)
+
+    @fast_validate_call
+    async def fetch_social_post_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> SocialPostActivities:
+        """
+        Retrieve social post activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the social post activities.
+        """
+        return await self.__do_fetch_activities(SocialPostActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.SOCIAL, activity_type=ActivityType.POST)
+
+    @fast_validate_call
+    async def fetch_social_profile_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> SocialProfileActivities:
+        """
+        Retrieve social profile activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the social profile activities.
+        """
+        return await self.__do_fetch_activities(SocialProfileActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.SOCIAL, activity_type=ActivityType.PROFILE)
+
+    @fast_validate_call
+    async def fetch_social_proxy_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> SocialProxyActivities:
+        """
+        Retrieve social proxy activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the social proxy activities.
+        """
+        return await self.__do_fetch_activities(SocialProxyActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.SOCIAL, activity_type=ActivityType.PROXY)
+
+    @fast_validate_call
+    async def fetch_social_revise_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> SocialReviseActivities:
+        """
+        Retrieve social revise activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the social revise activities.
+        """
+
+        return await self.__do_fetch_activities(SocialReviseActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.SOCIAL, activity_type=ActivityType.REVISE)
+
+    @fast_validate_call
+    async def fetch_social_reward_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> SocialRewardActivities:
+        """
+        Retrieve social reward activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the social reward activities.
+        """
+        return await self.__do_fetch_activities(SocialRewardActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.SOCIAL, activity_type=ActivityType.REWARD)
+
+    @fast_validate_call
+    async def fetch_social_share_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> SocialShareActivities:
+        """
+        Retrieve social share activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the social share activities.
+        """
+        return await self.__do_fetch_activities(SocialShareActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.SOCIAL, activity_type=ActivityType.SHARE)
+
+    @fast_validate_call
+    async def fetch_transaction_approval_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> TransactionApprovalActivities:
+        """
+        Retrieve transaction approval activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the transaction approval activities.
+        """
+        return await self.__do_fetch_activities(TransactionApprovalActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.TRANSACTION, activity_type=ActivityType.APPROVAL)
+
+    @fast_validate_call
+    async def fetch_transaction_bridge_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> TransactionBridgeActivities:
+        """
+        Retrieve transaction bridge activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the transaction bridge activities.
+        """
+        return await self.__do_fetch_activities(TransactionBridgeActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.TRANSACTION, activity_type=ActivityType.BRIDGE)
+
+    @fast_validate_call
+    async def fetch_transaction_burn_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> TransactionBurnActivities:
+        """
+        Retrieve transaction burn activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the transaction burn activities.
+        """
+        return await self.__do_fetch_activities(TransactionBurnActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.TRANSACTION, activity_type=ActivityType.BURN)
+
+    @fast_validate_call
+    async def fetch_transaction_mint_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> TransactionMintActivities:
+        """
+        Retrieve transaction mint activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the transaction mint activities.
+        """
+        return await self.__do_fetch_activities(TransactionMintActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.TRANSACTION, activity_type=ActivityType.MINT)
+
+    @fast_validate_call
+    async def fetch_transaction_transfer_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None
+    ) -> TransactionTransferActivities:
+        """
+        Retrieve transaction transfer activities for a specific account.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the request.
+        :return: A dictionary containing the transaction transfer activities.
+        """
+        return await self.__do_fetch_activities(TransactionTransferActivities, account,
+                                                pagination=pagination, filters=filters,
+                                                tag=ActivityTag.TRANSACTION, activity_type=ActivityType.TRANSFER)
+
+    async def fetch_rss_activity_by_path(self, path: str) -> RssFeedActivities:
+        """
+        Retrieve RSS activity details by path.
+
+        :param path: The RSS path.
+        :return: A dictionary containing the RSS activity details.
+        """
+        url = f"{self.base_url}/rss/{path}"
+        return await self.__get(RssFeedActivities, url)
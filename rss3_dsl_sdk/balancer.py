@@ -0,0 +1,152 @@
+import threading
+import time
+from typing import List, Optional, Tuple, Union
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class Endpoint:
+    """
+    A DSL node with its measured latency, load and circuit-breaker state.
+    """
+
+    __slots__ = ("url", "latency", "in_flight", "failures", "state", "opened_at", "requests", "errors")
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.latency: Optional[float] = None
+        self.in_flight = 0
+        self.failures = 0
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.requests = 0
+        self.errors = 0
+
+    def __repr__(self) -> str:
+        latency = f"{self.latency * 1000:.1f}ms" if self.latency is not None else "unmeasured"
+        return f"Endpoint({self.url!r}, {self.state}, {latency}, in_flight={self.in_flight})"
+
+
+class EndpointPool:
+    """
+    Routes requests across several DSL nodes by latency and health.
+
+    Each request goes to the healthy node with the lowest exponentially weighted moving average (EWMA) latency,
+    weighted by its requests in flight; nodes that were not measured yet are tried first. A failure counts as a
+    latency of ``failure_penalty`` seconds, so retries move to other nodes. After ``failure_threshold``
+    consecutive failures (connection errors, timeouts, 429 or 5xx responses) a node's circuit opens and it receives
+    no traffic for ``cooldown`` seconds. Then a single probe request is let through: if it succeeds the node is
+    back in rotation, otherwise the circuit opens again. If every circuit is open, the node
+    that failed longest ago is tried rather than failing the request outright.
+    """
+
+    def __init__(self, urls: List[str], alpha: float = 0.3, failure_threshold: int = 5, cooldown: float = 30.0,
+                 failure_penalty: float = 5.0):
+        """
+        Initialize the pool.
+
+        :param urls: The base URLs of the nodes.
+        :param alpha: The weight of the newest latency in the EWMA.
+        :param failure_threshold: The number of consecutive failures that open a node's circuit.
+        :param cooldown: The number of seconds an open circuit stays open before it is probed.
+        :param failure_penalty: The latency in seconds that a failure adds to the EWMA.
+        """
+        if not urls:
+            raise ValueError("at least one endpoint URL is required")
+        self.endpoints = [Endpoint(url) for url in urls]
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failure_penalty = failure_penalty
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def choose(self) -> Endpoint:
+        """
+        Pick the node of the next request and count the request as in flight on it.
+
+        :return: The chosen node, to be passed back to :meth:`release` when the request is done.
+        """
+        with self._lock:
+            now = time.monotonic()
+            chosen = None
+            for endpoint in self.endpoints:
+                if endpoint.state == OPEN and now - endpoint.opened_at >= self.cooldown:
+                    endpoint.state = HALF_OPEN
+                    chosen = endpoint
+                    break
+            if chosen is None:
+                closed = [endpoint for endpoint in self.endpoints if endpoint.state == CLOSED]
+                if closed:
+                    chosen = min(closed, key=lambda endpoint: (endpoint.latency or 0.0) * (endpoint.in_flight + 1))
+                else:
+                    chosen = min(self.endpoints, key=lambda endpoint: endpoint.opened_at)
+            chosen.in_flight += 1
+            chosen.requests += 1
+            return chosen
+
+    def release(self, endpoint: Endpoint):
+        """
+        Count a request on a node as no longer in flight.
+
+        A probe released without a recorded outcome, e.g. because it was cancelled, opens the circuit again, so the
+        node is probed anew after the cooldown instead of staying half-open.
+
+        :param endpoint: The node returned by :meth:`choose`, after its outcome was recorded.
+        """
+        with self._lock:
+            endpoint.in_flight -= 1
+            if endpoint.state == HALF_OPEN:
+                endpoint.state = OPEN
+                endpoint.opened_at = time.monotonic()
+
+    def record_success(self, endpoint: Endpoint, latency: float):
+        """
+        Record a successful request, closing the node's circuit.
+
+        :param endpoint: The node that answered.
+        :param latency: The latency of the request in seconds.
+        """
+        with self._lock:
+            self._observe(endpoint, latency)
+            endpoint.failures = 0
+            endpoint.state = CLOSED
+
+    def record_failure(self, endpoint: Endpoint):
+        """
+        Record a failed request, opening the node's circuit after too many consecutive failures or a failed probe.
+
+        :param endpoint: The node that failed.
+        """
+        with self._lock:
+            self._observe(endpoint, self.failure_penalty)
+            endpoint.failures += 1
+            endpoint.errors += 1
+            if endpoint.state == HALF_OPEN or endpoint.failures >= self.failure_threshold:
+                endpoint.state = OPEN
+                endpoint.opened_at = time.monotonic()
+
+    def _observe(self, endpoint: Endpoint, latency: float):
+        endpoint.latency = latency if endpoint.latency is None \
+            else self.alpha * latency + (1 - self.alpha) * endpoint.latency
+
+
+def resolve_base_url(base_url: Union[str, List[str], EndpointPool]) -> Tuple[str, Optional[EndpointPool]]:
+    """
+    Split the ``base_url`` argument of a client into the prefix of its request URLs and its endpoint pool.
+
+    :param base_url: A single base URL, a list of them or an :class:`EndpointPool`.
+    :return: The base URL and ``None`` for a single node, or an empty prefix and the pool for several nodes, whose
+        request URLs are then paths resolved by the transport.
+    """
+    if isinstance(base_url, str):
+        return base_url, None
+    if not isinstance(base_url, EndpointPool):
+        if len(base_url) == 1:
+            return base_url[0], None
+        base_url = EndpointPool(list(base_url))
+    return "", base_url
@@ -0,0 +1,310 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+
+
+def cache_key(url: str, params: Optional[dict] = None) -> str:
+    """
+    Build a cache key from a request URL and its normalized query parameters.
+
+    :param url: The request URL.
+    :param params: The normalized query parameters, as built by ``build_activity_params``.
+    :return: A string that is equal for equal requests.
+    """
+    return json.dumps([url, params or {}], sort_keys=True, separators=(",", ":"))
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    size: int
+    expires_at: Optional[float] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at is None or self.expires_at > time.time()
+
+    def validators(self) -> dict:
+        """
+        Build the conditional request headers that revalidate this entry.
+
+        :return: A dictionary of ``If-None-Match`` and ``If-Modified-Since`` headers, empty without validators.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class BaseCache:
+    """
+    The interface of response caches used by :class:`rss3_dsl_sdk.client.RSS3Client`.
+
+    Head-of-feed pages expire after ``ttl`` and are then revalidated with the server when it sent an ``ETag`` or
+    ``Last-Modified`` header. Historical pages, which are addressed by a cursor or an ``until_timestamp`` and only
+    hold activities older than ``immutable_after`` seconds, never change and are kept without expiry. Subclasses
+    implement :meth:`get_entry` and :meth:`put_entry`.
+    """
+
+    store_models = False
+
+    def __init__(self, ttl: Optional[float] = 60.0, immutable_after: Optional[float] = 86400.0):
+        """
+        Initialize the cache policy.
+
+        :param ttl: The number of seconds a head-of-feed entry stays fresh, or ``None`` to never expire entries.
+        :param immutable_after: The age in seconds after which activities are treated as immutable, or ``None`` to
+            expire all entries after ``ttl``.
+        """
+        self.ttl = ttl
+        self.immutable_after = immutable_after
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """
+        Look up an entry, fresh or stale.
+
+        :param key: The cache key.
+        :return: The entry, or ``None`` if the key is not cached.
+        """
+        raise NotImplementedError
+
+    def put_entry(self, key: str, entry: CacheEntry):
+        """
+        Store an entry, replacing any previous entry for the key.
+
+        :param key: The cache key.
+        :param entry: The entry to store.
+        """
+        raise NotImplementedError
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """
+        Look up an entry and count a hit if it is fresh, or a miss otherwise.
+
+        :param key: The cache key.
+        :return: The entry, fresh or stale, or ``None`` if the key is not cached.
+        """
+        entry = self.get_entry(key)
+        if entry is not None and entry.fresh:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entry
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a fresh value.
+
+        :param key: The cache key.
+        :return: The cached value, or ``None`` on a miss.
+        """
+        entry = self.lookup(key)
+        return entry.value if entry is not None and entry.fresh else None
+
+    def set(self, key: str, value: Any, size: int, immutable: bool = False, etag: Optional[str] = None,
+            last_modified: Optional[str] = None):
+        """
+        Store a value.
+
+        :param key: The cache key.
+        :param value: The value to cache.
+        :param size: The size of the response body in bytes.
+        :param immutable: Whether the value never changes and must not expire.
+        :param etag: The ``ETag`` header of the response.
+        :param last_modified: The ``Last-Modified`` header of the response.
+        """
+        expires_at = None if immutable or self.ttl is None else time.time() + self.ttl
+        self.put_entry(key, CacheEntry(value, size, expires_at, etag, last_modified))
+
+    def revalidate(self, key: str, entry: CacheEntry):
+        """
+        Mark a stale entry as fresh again after the server confirmed it is unchanged.
+
+        :param key: The cache key.
+        :param entry: The stale entry.
+        """
+        self.revalidations += 1
+        self.set(key, entry.value, entry.size, etag=entry.etag, last_modified=entry.last_modified)
+
+    def is_historical(self, params: Optional[dict], newest_timestamp: Optional[int]) -> bool:
+        """
+        Tell whether a response belongs to the immutable history of a feed.
+
+        :param params: The normalized query parameters of the request.
+        :param newest_timestamp: The timestamp of the newest activity in the response, if any.
+        :return: Whether the response can be cached without expiry.
+        """
+        if self.immutable_after is None or not params:
+            return False
+        horizon = time.time() - self.immutable_after
+        until_timestamp = params.get("until_timestamp")
+        if until_timestamp is not None and until_timestamp < horizon:
+            return True
+        return params.get("cursor") is not None and newest_timestamp is not None and newest_timestamp < horizon
+
+    def clear(self):
+        """
+        Remove all entries. The counters are kept.
+        """
+        raise NotImplementedError
+
+
+class ResponseCache(BaseCache):
+    """
+    A thread-safe in-memory response cache with TTL expiry and LRU eviction.
+
+    The cache either stores raw response bodies, which are parsed again on every hit, or the parsed models, which
+    are returned as-is and must be treated as read-only by callers.
+    """
+
+    def __init__(
+            self,
+            ttl: Optional[float] = 60.0,
+            max_entries: Optional[int] = 1024,
+            max_bytes: Optional[int] = None,
+            store_models: bool = False,
+            immutable_after: Optional[float] = 86400.0
+    ):
+        """
+        Initialize an empty cache.
+
+        :param ttl: The number of seconds a head-of-feed entry stays fresh, or ``None`` to never expire entries.
+        :param max_entries: The maximum number of entries, or ``None`` for no limit.
+        :param max_bytes: The maximum total size of the cached response bodies, or ``None`` for no limit.
+        :param store_models: Whether to cache parsed models instead of raw response bodies.
+        :param immutable_after: The age in seconds after which activities are treated as immutable, or ``None`` to
+            expire all entries after ``ttl``.
+        """
+        super().__init__(ttl=ttl, immutable_after=immutable_after)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.store_models = store_models
+        self.evictions = 0
+        self.size_bytes = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not entry.fresh and not entry.validators():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put_entry(self, key: str, entry: CacheEntry):
+        if self.max_bytes is not None and entry.size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self.size_bytes += entry.size
+            while ((self.max_entries is not None and len(self._entries) > self.max_entries)
+                   or (self.max_bytes is not None and self.size_bytes > self.max_bytes)):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def _remove(self, key: str):
+        self.size_bytes -= self._entries.pop(key).size
+
+
+class SQLiteCache(BaseCache):
+    """
+    A persistent response cache stored in a SQLite database, which survives process restarts.
+
+    Raw response bodies are stored, so hits are parsed again. Stale entries are kept for revalidation until they
+    are evicted, least recently used first, beyond ``max_bytes``.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            ttl: Optional[float] = 60.0,
+            max_bytes: Optional[int] = None,
+            immutable_after: Optional[float] = 86400.0
+    ):
+        """
+        Open or create the cache database.
+
+        :param path: The path of the SQLite database file.
+        :param ttl: The number of seconds a head-of-feed entry stays fresh, or ``None`` to never expire entries.
+        :param max_bytes: The maximum total size of the cached response bodies, or ``None`` for no limit.
+        :param immutable_after: The age in seconds after which activities are treated as immutable, or ``None`` to
+            expire all entries after ``ttl``.
+        """
+        super().__init__(ttl=ttl, immutable_after=immutable_after)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, expires_at REAL, "
+            "etag TEXT, last_modified TEXT, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, size, expires_at, etag, last_modified FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return CacheEntry(bytes(row[0]), *row[1:])
+
+    def put_entry(self, key: str, entry: CacheEntry):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, entry.value, entry.size, entry.expires_at, entry.etag, entry.last_modified, time.time())
+            )
+            if self.max_bytes is not None:
+                self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        self._connection.close()
+
+    def _evict(self):
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._connection.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
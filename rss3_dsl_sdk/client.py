@@ -1,7 +1,12 @@
-from typing import Optional
+import copy
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import closing
+from enum import Enum
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Union
 
-import requests
-from pydantic import validate_call
+from pydantic import BaseModel
 
 from rss3_dsl_sdk.schemas.collectible import (
     CollectibleApprovalActivities,
@@ -10,7 +15,7 @@ from rss3_dsl_sdk.schemas.collectible import (
     CollectibleTradeActivities,
     CollectibleTransferActivities
 )
-from rss3_dsl_sdk.schemas.base import PaginationOptions, ActivityFilter, Activities
+from rss3_dsl_sdk.schemas.base import PaginationOptions, ActivityFilter, Activities, Activity
 from rss3_dsl_sdk.schemas.enums import ActivityTag, ActivityType
 from rss3_dsl_sdk.schemas.exchange import (
     ExchangeLiquidityActivities,
@@ -23,6 +28,7 @@ from rss3_dsl_sdk.schemas.metaverse import (
     MetaverseTradeActivities,
     MetaverseTransferActivities
 )
+from rss3_dsl_sdk.schemas.registry import ActivityKind, TypedActivities, activities_type, split_by_type
 from rss3_dsl_sdk.schemas.rss import (
     RssFeedActivities
 )
@@ -44,6 +50,99 @@ from rss3_dsl_sdk.schemas.transaction import (
     TransactionMintActivities,
     TransactionTransferActivities
 )
+from rss3_dsl_sdk.cache import BaseCache, CacheEntry, cache_key
+from rss3_dsl_sdk.coalesce import SingleFlight
+from rss3_dsl_sdk.prefetch import read_ahead
+from rss3_dsl_sdk.stores import BaseStateStore, Checkpoint, Watermark
+from rss3_dsl_sdk.streaming import ActivityStream
+from rss3_dsl_sdk.balancer import EndpointPool, resolve_base_url
+from rss3_dsl_sdk.hedge import HedgePolicy
+from rss3_dsl_sdk.metrics import Observer, RequestMetrics, as_callbacks
+from rss3_dsl_sdk.retry import RetryPolicy, TokenBucket
+from rss3_dsl_sdk.transport import DEFAULT_RETRY, BaseTransport, PooledTransport, Timeout
+from rss3_dsl_sdk.validation import fast_validate_call
+from rss3_dsl_sdk.views import LazyModel, ResultMode, get_field
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+
+def build_activity_params(
+        tag: Union[ActivityTag, List[ActivityTag], None] = None,
+        activity_type: Union[ActivityType, List[ActivityType], None] = None,
+        pagination: Optional[PaginationOptions] = None,
+        filters: Optional[ActivityFilter] = None
+) -> dict:
+    """
+    Build the normalized query parameters of an activity request.
+
+    Unset parameters are dropped, enums are replaced by their values and booleans are lowercased, so the result
+    encodes the same way with any HTTP library.
+
+    :param tag: Tag for the activities, or a list of tags.
+    :param activity_type: Type for the activities, or a list of types.
+    :param pagination: Pagination options for the request.
+    :param filters: Filters to apply to the activity retrieval.
+    :return: A dictionary of query parameters.
+    """
+    if pagination is None:
+        pagination = PaginationOptions()
+    params = {
+        "limit": pagination.limit,
+        "action_limit": pagination.action_limit,
+        "cursor": pagination.cursor,
+        "since_timestamp": filters.since_timestamp if filters else None,
+        "until_timestamp": filters.until_timestamp if filters else None,
+        "success": filters.success if filters else None,
+        "direction": filters.direction if filters else None,
+        "network": filters.network if filters else None,
+        "tag": _as_list(tag),
+        "type": _as_list(activity_type),
+        "platform": filters.platform if filters else None
+    }
+    return {key: _normalize_param(value) for key, value in params.items() if value is not None}
+
+
+def feed_key(
+        account: str,
+        tag: Union[ActivityTag, List[ActivityTag], None] = None,
+        activity_type: Union[ActivityType, List[ActivityType], None] = None,
+        filters: Optional[ActivityFilter] = None
+) -> str:
+    """
+    Build a key that identifies the activity feed of an account, independent of pagination.
+
+    :param account: The account address.
+    :param tag: Tag for the activities, or a list of tags.
+    :param activity_type: Type for the activities, or a list of types.
+    :param filters: Filters to apply to the activity retrieval.
+    :return: A string that is equal for equal feeds.
+    """
+    params = build_activity_params(tag, activity_type, filters=filters)
+    return cache_key(account, {name: value for name, value in params.items()
+                               if name not in ("limit", "action_limit", "cursor")})
+
+
+def _count_activities(metrics: RequestMetrics, result):
+    activities = get_field(result, "data")
+    if isinstance(activities, list):
+        metrics.activities = len(activities)
+        metrics.actions = sum(len(get_field(activity, "actions") or ()) for activity in activities)
+
+
+def _as_list(value):
+    if isinstance(value, list):
+        return value or None
+    return [value] if value else None
+
+
+def _normalize_param(value):
+    if isinstance(value, list):
+        return [_normalize_param(item) for item in value]
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
 
 
 class RSS3Client:
@@ -51,13 +150,109 @@ class RSS3Client:
     A client for interacting with the RSS3 Data Sub Layer (DSL) API.
     """
 
-    def __init__(self, base_url: str = "https://gi.rss3.io"):
+    def __init__(
+            self,
+            base_url: Union[str, List[str], EndpointPool] = "https://gi.rss3.io",
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            pool_block: bool = False,
+            keep_alive: bool = True,
+            timeout: Optional[Timeout] = None,
+            cache: Optional[BaseCache] = None,
+            result_mode: ResultMode = ResultMode.MODEL,
+            retry: Optional[RetryPolicy] = DEFAULT_RETRY,
+            rate_limit: Optional[TokenBucket] = None,
+            adaptive_concurrency: bool = True,
+            hedge: Optional[HedgePolicy] = None,
+            coalesce: bool = False,
+            compression: bool = True,
+            transport: Optional[BaseTransport] = None,
+            observers: Optional[List[Observer]] = None
+    ):
         """
         Initialize the client with the base URL of the RSS3 DSL API.
 
-        :param base_url: The base URL of the API.
+        The client owns a pool of keep-alive connections that is shared by all ``fetch_*`` methods. Call
+        :meth:`close` or use the client as a context manager to release it.
+
+        :param base_url: The base URL of the API, or a list of the base URLs of several DSL nodes, which are then
+            balanced by latency with failover, or an :class:`~rss3_dsl_sdk.balancer.EndpointPool` to tune that.
+        :param pool_connections: The number of per-host connection pools to keep.
+        :param pool_maxsize: The maximum number of connections kept open per host.
+        :param pool_block: Whether to block instead of exceeding ``pool_maxsize`` connections per host. Only matters
+            without ``adaptive_concurrency``, which already bounds the requests in flight.
+        :param keep_alive: Whether to keep connections open between requests.
+        :param timeout: The request timeout in seconds, either a single value or a ``(connect, read)`` tuple.
+        :param cache: An optional cache for responses, keyed on the request URL and normalized parameters, such as
+            an in-memory :class:`~rss3_dsl_sdk.cache.ResponseCache` or a persistent
+            :class:`~rss3_dsl_sdk.cache.SQLiteCache`.
+        :param result_mode: How responses are returned. With :attr:`ResultMode.LAZY` the ``fetch_*`` and ``iter_*``
+            methods return :class:`~rss3_dsl_sdk.views.LazyModel` views instead of models, and with
+            :attr:`ResultMode.RAW` the decoded JSON payloads.
+        :param retry: How failed requests are retried, by default up to 3 times with jittered exponential backoff
+            that honors ``Retry-After``. ``None`` disables retries.
+        :param rate_limit: An optional :class:`~rss3_dsl_sdk.retry.TokenBucket` that bounds the request rate.
+        :param adaptive_concurrency: Whether to lower the number of requests in flight when the node throttles
+            (429 or 503) and raise it again, up to ``pool_maxsize``, as requests succeed. The limit applies to all
+            requests of the client together, across every node of ``base_url``, so with several nodes raise
+            ``pool_maxsize`` to the total concurrency wanted.
+        :param hedge: An optional :class:`~rss3_dsl_sdk.hedge.HedgePolicy`. Requests slower than a percentile of
+            recent latencies are then sent a second time and the first response wins, within an extra-load budget.
+        :param coalesce: Whether identical requests made by several threads at the same time share one network
+            round trip and parse. Coalesced callers receive the same result object, so only enable it when results
+            are not mutated. The counters are kept by :attr:`single_flight`.
+        :param compression: Whether to ask the node for compressed responses, which are decompressed as they are
+            read. Install the ``compression`` extra to also accept Brotli and Zstandard.
+        :param transport: An optional :class:`~rss3_dsl_sdk.transport.BaseTransport` that sends the requests, such
+            as an :class:`~rss3_dsl_sdk.transport.HTTP2Transport` or a
+            :class:`~rss3_dsl_sdk.transport.ReplayTransport`. The connection, retry, rate limit, concurrency,
+            hedging and compression options are then taken from the transport, and the client closes it on
+            :meth:`close`.
+        :param observers: Optional :class:`~rss3_dsl_sdk.metrics.BaseObserver` instances, such as a
+            :class:`~rss3_dsl_sdk.metrics.MetricsAggregator`, or functions, notified with the
+            :class:`~rss3_dsl_sdk.metrics.RequestMetrics` of every request: its phase timings, response size,
+            activity and action counts, cache hit and retries. Coalesced callers share the leader's request, which is
+            reported once. Without observers nothing is measured.
+        """
+        self.base_url, self.endpoints = resolve_base_url(base_url)
+        self.cache = cache
+        self.result_mode = ResultMode(result_mode)
+        self.single_flight = SingleFlight() if coalesce else None
+        self.observers = as_callbacks(observers)
+        if transport is None:
+            transport = PooledTransport(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                        pool_block=pool_block, keep_alive=keep_alive, timeout=timeout, retry=retry,
+                                        rate_limit=rate_limit, adaptive_concurrency=adaptive_concurrency,
+                                        hedge=hedge, endpoints=self.endpoints, compression=compression)
+        elif transport.endpoints is None:
+            transport.endpoints = self.endpoints
+        self.transport = transport
+
+    def close(self):
+        """
+        Close the client and release its pooled connections.
+        """
+        self.transport.close()
+
+    def with_result_mode(self, result_mode: ResultMode) -> "RSS3Client":
         """
-        self.base_url = base_url
+        Get a view of this client that returns responses in another mode.
+
+        The returned client shares the connection pool and cache of this client, so it is cheap to create for a
+        single call, e.g. ``client.with_result_mode(ResultMode.RAW).fetch_activities(account)``.
+
+        :param result_mode: How responses are returned.
+        :return: A client sharing this client's resources.
+        """
+        client = copy.copy(self)
+        client.result_mode = ResultMode(result_mode)
+        return client
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def fetch_activities(
             self,
@@ -66,10 +261,13 @@ class RSS3Client:
             activity_type: Optional[ActivityType] = None,
             pagination: Optional[PaginationOptions] = None,
             filters: Optional[ActivityFilter] = None
-    ) -> Activities:
+    ) -> TypedActivities:
         """
         Retrieve activities for a specific account.
 
+        The metadata of each action is parsed into the model of its tag and type, e.g. ``SocialPostMetadata``, and
+        kept as a dictionary for combinations without a model.
+
         :param account: The account address.
         :param pagination: Pagination options for the request.
         :param filters: Filters to apply to the activity retrieval.
@@ -77,35 +275,554 @@ class RSS3Client:
         :param activity_type: Type for the activities.
         :return: A dictionary containing the account activities.
         """
-        response_json = self.__do_fetch_activities(account, tag, activity_type, filters, pagination)
-        return Activities(**response_json)
+        return self.__do_fetch_activities(TypedActivities, account, tag=tag, activity_type=activity_type,
+                                          pagination=pagination, filters=filters)
+
+    def fetch_activities_by_types(
+            self,
+            account: str,
+            activity_types: List[ActivityKind],
+            pagination: Optional[PaginationOptions] = None,
+            filters: Optional[ActivityFilter] = None
+    ) -> Dict[ActivityKind, Activities]:
+        """
+        Retrieve activities of several tags and types for a specific account in a single request.
+
+        The activities are split by their tag and type and each group is returned as its typed model, e.g.
+        ``SocialPostActivities`` for ``(ActivityTag.SOCIAL, ActivityType.POST)``. Every requested pair is present in
+        the result, with empty ``data`` if the page held none of its activities, and every group shares the ``meta``
+        of the response, so the cursor pages through the combined feed. The API matches tags and types separately,
+        so activities of pairs that were not requested, e.g. transaction mints when asking for social mints and
+        transaction transfers, are dropped.
+
+        :param account: The account address.
+        :param activity_types: The ``(tag, type)`` pairs to retrieve.
+        :param pagination: Pagination options for the request.
+        :param filters: Filters to apply to the activity retrieval.
+        :return: A dictionary mapping each ``(tag, type)`` pair to its activities.
+        """
+        activity_types = [(ActivityTag(tag), ActivityType(activity_type)) for tag, activity_type in activity_types]
+        tags = list(dict.fromkeys(tag for tag, _ in activity_types))
+        types = list(dict.fromkeys(activity_type for _, activity_type in activity_types))
+        payload = self.with_result_mode(ResultMode.RAW).__do_fetch_activities(
+            Activities, account, tag=tags, activity_type=types, pagination=pagination, filters=filters
+        )
+        groups = split_by_type(payload, activity_types)
+        if self.result_mode is ResultMode.RAW:
+            return groups
+        if self.result_mode is ResultMode.LAZY:
+            return {kind: LazyModel(activities_type(*kind), group) for kind, group in groups.items()}
+        return {kind: activities_type(*kind).model_validate(group) for kind, group in groups.items()}
+
+    def fetch_activities_bulk(
+            self,
+            accounts: Iterable[str],
+            tag: Optional[ActivityTag] = None,
+            activity_type: Optional[ActivityType] = None,
+            pagination: Optional[PaginationOptions] = None,
+            filters: Optional[ActivityFilter] = None,
+            max_workers: Optional[int] = None
+    ) -> Iterator[Tuple[str, Union[Activities, Exception]]]:
+        """
+        Retrieve activities for many accounts on a bounded pool of worker threads.
+
+        Results are yielded in completion order as ``(account, result)`` pairs. A failing account yields the raised
+        exception as its result instead of interrupting the batch. Accounts are read lazily from ``accounts``, so at
+        most ``2 * max_workers`` requests are queued at a time.
+
+        :param accounts: The account addresses.
+        :param tag: Tag for the activities.
+        :param activity_type: Type for the activities.
+        :param pagination: Pagination options for each request.
+        :param filters: Filters to apply to the activity retrieval.
+        :param max_workers: The number of concurrent requests, the connection pool size by default.
+        :return: An iterator over ``(account, activities or exception)`` pairs.
+        """
+        max_workers = max_workers or self.transport.pool_maxsize
+        accounts = iter(accounts)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rss3-bulk")
+        pending = {}
+        try:
+            while True:
+                for account in accounts:
+                    future = executor.submit(self.fetch_activities, account, tag=tag, activity_type=activity_type,
+                                             pagination=pagination, filters=filters)
+                    pending[future] = account
+                    if len(pending) >= 2 * max_workers:
+                        break
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    account = pending.pop(future)
+                    try:
+                        yield account, future.result()
+                    except Exception as error:
+                        yield account, error
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def iter_activities(
+            self,
+            account: str,
+            tag: Optional[ActivityTag] = None,
+            activity_type: Optional[ActivityType] = None,
+            pagination: Optional[PaginationOptions] = None,
+            filters: Optional[ActivityFilter] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0,
+            stream: bool = False
+    ) -> Iterator[Activity]:
+        """
+        Iterate over activities for a specific account, following the pagination cursor.
+
+        Pages are fetched lazily as the iterator is consumed, so at most one page is held in memory at a time. With
+        ``prefetch`` set, up to that many further pages are fetched on a background thread while the current one is
+        consumed. With ``stream`` set, pages are read like by :meth:`stream_activities`, so each activity is yielded
+        as soon as it is received and at most one activity is held in memory at a time.
 
-    def __do_fetch_activities(self, account: str,
+        :param account: The account address.
+        :param tag: Tag for the activities.
+        :param activity_type: Type for the activities.
+        :param pagination: Pagination options for the first request.
+        :param filters: Filters to apply to the activity retrieval.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :param stream: Whether to parse each page while it is received. It cannot be combined with ``prefetch``,
+            since the cursor of the next page is only known once the current one was received.
+        :return: An iterator over the account activities.
+        """
+        if stream and prefetch:
+            raise ValueError("stream and prefetch cannot be combined")
+        return self.__iter_activities(TypedActivities, account, tag=tag, activity_type=activity_type, filters=filters,
+                                      pagination=pagination, max_items=max_items, max_pages=max_pages,
+                                      stop_before_timestamp=stop_before_timestamp, prefetch=prefetch, stream=stream)
+
+    def stream_activities(
+            self,
+            account: str,
+            tag: Optional[ActivityTag] = None,
+            activity_type: Optional[ActivityType] = None,
+            pagination: Optional[PaginationOptions] = None,
+            filters: Optional[ActivityFilter] = None
+    ) -> ActivityStream:
+        """
+        Retrieve a page of activities for a specific account, parsing each activity as soon as it is received.
+
+        The ``data`` array of the response is split into activities while the body is read from the connection and
+        each one is validated on its own, so the first activity is available before the page is fully downloaded
+        and the whole body is never held in memory. The page's ``meta``, which follows the activities, is available
+        on the stream once it is exhausted. Streamed requests bypass the cache and are neither coalesced nor hedged.
+
+        :param account: The account address.
+        :param tag: Tag for the activities.
+        :param activity_type: Type for the activities.
+        :param pagination: Pagination options for the request.
+        :param filters: Filters to apply to the activity retrieval.
+        :return: An iterable over the activities, with the ``meta`` and ``cursor`` of the page once exhausted. Close
+            it, or use it as a context manager, to release the connection when stopping early.
+        """
+        return self.__stream_activities(TypedActivities, account, tag=tag, activity_type=activity_type,
+                                        pagination=pagination, filters=filters)
+
+    def sync_activities(
+            self,
+            account: str,
+            store: BaseStateStore,
+            tag: Optional[ActivityTag] = None,
+            activity_type: Optional[ActivityType] = None,
+            pagination: Optional[PaginationOptions] = None,
+            filters: Optional[ActivityFilter] = None,
+            max_pages: Optional[int] = None,
+            key: Optional[str] = None
+    ) -> List[Activity]:
+        """
+        Retrieve the activities of an account that are new since its last sync.
+
+        The store keeps a watermark per feed: the newest timestamp seen and the ids of the activities at it. Pages
+        are requested from that timestamp on and followed by cursor until the watermark is reached, so a sync
+        without news costs a single request. Activities at the watermark timestamp are checked against the stored
+        ids. The watermark is advanced only once all new activities were retrieved, so a failed sync is retried in
+        full. A sync that stops at ``max_pages`` before reaching the watermark keeps it and stores the cursor of its
+        next page, from which the next sync continues, so no activity is skipped or returned twice; the first sync
+        of a feed retrieves its history this way over several calls.
+
+        :param account: The account address.
+        :param store: The store of the feed watermarks, e.g. a :class:`~rss3_dsl_sdk.stores.SQLiteStateStore`.
+        :param tag: Tag for the activities.
+        :param activity_type: Type for the activities.
+        :param pagination: Pagination options for the first request.
+        :param filters: Filters to apply to the activity retrieval.
+        :param max_pages: The maximum number of pages to fetch.
+        :param key: The watermark key of the feed, by default built from the account, tag, type and filters.
+        :return: The new activities, newest first.
+        """
+        key = key or f"watermark:{feed_key(account, tag, activity_type, filters)}"
+        state = store.get(key)
+        watermark = Watermark.from_dict(state) if state else Watermark(0)
+        if watermark.timestamp:
+            since = max(watermark.timestamp, filters.since_timestamp or 0) if filters else watermark.timestamp
+            filters = (filters or ActivityFilter()).model_copy(update={"since_timestamp": since})
+        if watermark.cursor is not None:
+            pagination = (pagination or PaginationOptions()).model_copy(update={"cursor": watermark.cursor})
+        activities = []
+        cursor = None
+        for page in self.__iter_pages(TypedActivities, account, tag=tag, activity_type=activity_type,
+                                      pagination=pagination, filters=filters, max_pages=max_pages):
+            data = get_field(page, "data") or ()
+            for activity in data:
+                timestamp = get_field(activity, "timestamp")
+                if timestamp < watermark.timestamp:
+                    break
+                if timestamp == watermark.timestamp and get_field(activity, "id") in watermark.ids:
+                    continue
+                activities.append(activity)
+            else:
+                meta = get_field(page, "meta")
+                cursor = get_field(meta, "cursor") if meta and data else None
+                continue
+            cursor = None
+            break
+        seen = ((get_field(activity, "timestamp"), get_field(activity, "id")) for activity in activities)
+        newest = (watermark.newest or Watermark(watermark.timestamp, watermark.ids)).advance(seen)
+        if cursor is not None:
+            store.set(key, Watermark(watermark.timestamp, watermark.ids, cursor, newest).to_dict())
+        elif activities or watermark.cursor is not None:
+            store.set(key, newest.to_dict())
+        return activities
+
+    def resume_activities(
+            self,
+            account: str,
+            store: BaseStateStore,
+            tag: Optional[ActivityTag] = None,
+            activity_type: Optional[ActivityType] = None,
+            pagination: Optional[PaginationOptions] = None,
+            filters: Optional[ActivityFilter] = None,
+            key: Optional[str] = None
+    ) -> Iterator[Activity]:
+        """
+        Iterate over activities for a specific account, durably checkpointing the cursor so that an interrupted
+        crawl resumes where it stopped.
+
+        A checkpoint is committed to the store once every activity of a page was consumed, with the cursor of the
+        next page and the ids of the committed page. A restarted crawl continues from the committed cursor and
+        skips the committed ids until it met them again, so pages that shifted between runs emit nothing twice.
+        Closing the iterator, or leaving the loop, in the middle of a page commits the cursor of that page with the
+        ids already yielded, so a resumed crawl continues right after them. Delivery is still at least once: after
+        a crash the activities of a page that was only partly consumed are yielded again. Once the feed is
+        exhausted the checkpoint is marked done and further calls yield nothing; delete the key from the store to
+        start over.
+
+        With both ``tag`` and ``activity_type`` set, activities are parsed into their typed model, e.g.
+        ``TransactionTransferActivities`` for transaction transfers.
+
+        :param account: The account address.
+        :param store: The store of the crawl checkpoints.
+        :param tag: Tag for the activities.
+        :param activity_type: Type for the activities.
+        :param pagination: Pagination options for each request. Its cursor is replaced by the checkpoint's.
+        :param filters: Filters to apply to the activity retrieval.
+        :param key: The checkpoint key of the crawl, by default built from the account, tag, type and filters.
+        :return: An iterator over the account activities.
+        """
+        key = key or f"checkpoint:{feed_key(account, tag, activity_type, filters)}"
+        state = store.get(key)
+        checkpoint = Checkpoint.from_dict(state) if state else Checkpoint()
+        if checkpoint.done:
+            return
+        model = activities_type(tag, activity_type) if tag and activity_type else TypedActivities
+        pagination = (pagination or PaginationOptions()).model_copy(update={"cursor": checkpoint.cursor})
+        pages = self.__iter_pages(model, account, tag=tag, activity_type=activity_type, pagination=pagination,
+                                  filters=filters)
+        seen = carried = checkpoint.ids
+        page_cursor = checkpoint.cursor
+        with closing(pages):
+            for page in pages:
+                data = get_field(page, "data")
+                meta = get_field(page, "meta")
+                cursor = get_field(meta, "cursor") if meta else None
+                ids = []
+                for activity in data:
+                    activity_id = get_field(activity, "id")
+                    ids.append(activity_id)
+                    if activity_id not in seen:
+                        try:
+                            yield activity
+                        except GeneratorExit:
+                            store.set(key, Checkpoint(page_cursor, seen | frozenset(ids)).to_dict())
+                            raise
+                # The ids of the checkpoint stay in the dedupe set until the walk met them again, since new
+                # activities may have pushed them onto a later page.
+                carried = carried.difference(ids)
+                seen = frozenset(ids).union(carried) or seen
+                page_cursor = cursor
+                store.set(key, Checkpoint(cursor, seen, done=not cursor or not data).to_dict())
+
+    def crawl_activities(
+            self,
+            account: str,
+            since_timestamp: int,
+            until_timestamp: Optional[int] = None,
+            tag: Optional[ActivityTag] = None,
+            activity_type: Optional[ActivityType] = None,
+            pagination: Optional[PaginationOptions] = None,
+            filters: Optional[ActivityFilter] = None,
+            shards: Optional[int] = None,
+            max_workers: Optional[int] = None,
+            min_shard_seconds: int = 3600
+    ) -> List[Activity]:
+        """
+        Retrieve all activities of an account in a time range by walking shards of the range concurrently.
+
+        The range is split into ``shards`` equal time shards whose cursors are walked on a bounded pool of worker
+        threads. Shard sizes adapt to the activity density: when the first page of a shard is full, the rest of the
+        shard is split in two narrower shards, down to ``min_shard_seconds``, so dense periods are walked in
+        parallel while sparse ones cost a single request. Shard boundaries overlap by one second, and the merged
+        activities are deduplicated by id and returned newest first, like the cursor walk of :meth:`iter_activities`.
+
+        :param account: The account address.
+        :param since_timestamp: The start of the time range.
+        :param until_timestamp: The end of the time range, now by default.
+        :param tag: Tag for the activities.
+        :param activity_type: Type for the activities.
+        :param pagination: Pagination options for each request.
+        :param filters: Filters to apply to the activity retrieval. Their time range is replaced by each shard's.
+        :param shards: The number of initial shards, ``max_workers`` by default.
+        :param max_workers: The number of concurrent requests, the connection pool size by default.
+        :param min_shard_seconds: The duration below which a shard is walked sequentially instead of split, at
+            least one second.
+        :return: The activities of the range, newest first.
+        :raises ValueError: If ``min_shard_seconds`` is below one second.
+        """
+        if min_shard_seconds < 1:
+            raise ValueError("min_shard_seconds must be at least 1")
+        if until_timestamp is None:
+            until_timestamp = int(time.time())
+        max_workers = max_workers or self.transport.pool_maxsize
+        shards = max(1, min(shards or max_workers, (until_timestamp - since_timestamp) // min_shard_seconds))
+        width = (until_timestamp - since_timestamp) / shards
+        bounds = [since_timestamp + round(width * index) for index in range(shards)] + [until_timestamp]
+        ranges = list(zip(bounds[:-1], bounds[1:]))
+        filters = filters or ActivityFilter()
+        activities = {}
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rss3-crawl")
+        pending = set()
+        try:
+            while ranges or pending:
+                for since, until in ranges:
+                    pending.add(executor.submit(self.__crawl_shard, account, since, until, tag, activity_type,
+                                                pagination, filters, min_shard_seconds))
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                ranges = []
+                for future in done:
+                    shard, splits = future.result()
+                    for activity in shard:
+                        activities.setdefault(get_field(activity, "id"), activity)
+                    ranges.extend(splits)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return sorted(activities.values(), key=lambda activity: get_field(activity, "timestamp"), reverse=True)
+
+    def __crawl_shard(self, account: str, since: int, until: int,
+                      tag: Optional[ActivityTag],
+                      activity_type: Optional[ActivityType],
+                      pagination: Optional[PaginationOptions],
+                      filters: ActivityFilter,
+                      min_shard_seconds: int) -> Tuple[List[Activity], List[Tuple[int, int]]]:
+        filters = filters.model_copy(update={"since_timestamp": since, "until_timestamp": until})
+        pages = self.__iter_pages(TypedActivities, account, tag=tag, activity_type=activity_type,
+                                  pagination=pagination, filters=filters)
+        activities = []
+        with closing(pages):
+            for page in pages:
+                data = get_field(page, "data")
+                activities.extend(data)
+                meta = get_field(page, "meta")
+                if not data or not meta or not get_field(meta, "cursor"):
+                    break
+                oldest = min(get_field(activity, "timestamp") for activity in data)
+                middle = (since + oldest) // 2
+                # Both halves must be narrower than the rest of the shard, or a shard whose first page ends in a
+                # busy second would be split back into itself forever; such a shard is walked by cursor instead.
+                if oldest - since >= 2 * min_shard_seconds and since < middle < oldest:
+                    return activities, [(middle, oldest), (since, middle)]
+        return activities, []
+
+    def __iter_activities(self, model: Type[Activities], account: str,
+                          tag: Optional[ActivityTag] = None,
+                          activity_type: Optional[ActivityType] = None,
+                          pagination: Optional[PaginationOptions] = None,
+                          filters: Optional[ActivityFilter] = None,
+                          max_items: Optional[int] = None,
+                          max_pages: Optional[int] = None,
+                          stop_before_timestamp: Optional[int] = None,
+                          prefetch: int = 0,
+                          stream: bool = False) -> Iterator[Activity]:
+        iter_pages = self.__iter_streamed_pages if stream else self.__iter_pages
+        pages = iter_pages(model, account, tag=tag, activity_type=activity_type, filters=filters,
+                           pagination=pagination, max_pages=max_pages)
+        if prefetch:
+            pages = read_ahead(pages, depth=prefetch)
+        count = 0
+        with closing(pages):
+            for page in pages:
+                for activity in page if stream else get_field(page, "data"):
+                    if stop_before_timestamp is not None and get_field(activity, "timestamp") < stop_before_timestamp:
+                        return
+                    yield activity
+                    count += 1
+                    if max_items is not None and count >= max_items:
+                        return
+
+    def __iter_pages(self, model: Type[Activities], account: str,
+                     tag: Optional[ActivityTag] = None,
+                     activity_type: Optional[ActivityType] = None,
+                     pagination: Optional[PaginationOptions] = None,
+                     filters: Optional[ActivityFilter] = None,
+                     max_pages: Optional[int] = None) -> Iterator[Activities]:
+        pagination = pagination or PaginationOptions()
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            page = self.__do_fetch_activities(model, account, tag=tag, activity_type=activity_type,
+                                              pagination=pagination, filters=filters)
+            pages += 1
+            meta = get_field(page, "meta")
+            cursor = get_field(meta, "cursor") if meta else None
+            has_data = bool(get_field(page, "data"))
+            yield page
+            del page
+            if not cursor or not has_data:
+                return
+            pagination = pagination.model_copy(update={"cursor": cursor})
+
+    def __iter_streamed_pages(self, model: Type[Activities], account: str,
                               tag: Optional[ActivityTag] = None,
                               activity_type: Optional[ActivityType] = None,
                               pagination: Optional[PaginationOptions] = None,
-                              filters: Optional[ActivityFilter] = None) -> dict:
-        if pagination is None:
-            pagination = PaginationOptions()
+                              filters: Optional[ActivityFilter] = None,
+                              max_pages: Optional[int] = None) -> Iterator[ActivityStream]:
+        pagination = pagination or PaginationOptions()
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            with self.__stream_activities(model, account, tag=tag, activity_type=activity_type,
+                                          pagination=pagination, filters=filters) as page:
+                pages += 1
+                yield page
+            if not page.cursor or not page.count:
+                return
+            pagination = pagination.model_copy(update={"cursor": page.cursor})
+
+    def __stream_activities(self, model: Type[Activities], account: str,
+                            tag: Optional[ActivityTag] = None,
+                            activity_type: Optional[ActivityType] = None,
+                            pagination: Optional[PaginationOptions] = None,
+                            filters: Optional[ActivityFilter] = None) -> ActivityStream:
+        url = f"{self.base_url}/decentralized/{account}"
+        params = build_activity_params(tag, activity_type, pagination, filters)
+        metrics = RequestMetrics(url, params) if self.observers else None
+        start = time.perf_counter()
+        try:
+            response = self.transport.get(url, params=params, metrics=metrics, stream=True)
+        except Exception as error:
+            if metrics is not None:
+                metrics.error = error
+                metrics.total = time.perf_counter() - start
+                self.__notify(metrics)
+            raise
+        if metrics is None:
+            return ActivityStream(self.transport.iter_content(response), model, self.result_mode)
+        metrics.total = time.perf_counter() - start
+
+        def on_close(finished: RequestMetrics):
+            finished.wire_bytes = self.transport.wire_bytes(response)
+            self.__notify(finished)
+
+        return ActivityStream(self.transport.iter_content(response), model, self.result_mode, metrics=metrics,
+                              on_close=on_close)
+
+    def __notify(self, metrics: RequestMetrics):
+        for observer in self.observers:
+            observer(metrics)
+
+    def __do_fetch_activities(self, model: Type[ModelT], account: str,
+                              tag: Union[ActivityTag, List[ActivityTag], None] = None,
+                              activity_type: Union[ActivityType, List[ActivityType], None] = None,
+                              pagination: Optional[PaginationOptions] = None,
+                              filters: Optional[ActivityFilter] = None) -> ModelT:
         url = f"{self.base_url}/decentralized/{account}"
-        params = {
-            "limit": pagination.limit,
-            "action_limit": pagination.action_limit,
-            "cursor": pagination.cursor,
-            "since_timestamp": filters.since_timestamp if filters else None,
-            "until_timestamp": filters.until_timestamp if filters else None,
-            "success": filters.success if filters else None,
-            "direction": filters.direction if filters else None,
-            "network": filters.network if filters else None,
-            "tag": [tag] if tag else None,
-            "type": [activity_type] if activity_type else None,
-            "platform": filters.platform if filters else None
-        }
-        response = requests.get(url, params=params)
-        response_json = response.json()
-        return response_json
-
-    @validate_call
+        params = build_activity_params(tag, activity_type, pagination, filters)
+        return self.__get(model, url, params=params)
+
+    def __get(self, model: Type[ModelT], url: str, params: Optional[dict] = None) -> ModelT:
+        if self.single_flight is None:
+            return self.__get_uncoalesced(model, url, params)
+        key = f"{self.result_mode.value}:{model.__name__}:{cache_key(url, params)}"
+        return self.single_flight.do(key, lambda: self.__get_uncoalesced(model, url, params))
+
+    def __get_uncoalesced(self, model: Type[ModelT], url: str, params: Optional[dict] = None) -> ModelT:
+        if not self.observers:
+            return self.__fetch(model, url, params)
+        metrics = RequestMetrics(url, params)
+        start = time.perf_counter()
+        try:
+            result = self.__fetch(model, url, params, metrics)
+            _count_activities(metrics, result)
+            return result
+        except Exception as error:
+            metrics.error = error
+            raise
+        finally:
+            metrics.total = time.perf_counter() - start
+            self.__notify(metrics)
+
+    def __fetch(self, model: Type[ModelT], url: str, params: Optional[dict] = None,
+                metrics: Optional[RequestMetrics] = None) -> ModelT:
+        if self.cache is None:
+            return self.__decode(model, self.transport.get(url, params=params, metrics=metrics).content, metrics)
+        key = cache_key(url, params)
+        if self.cache.store_models:
+            key = f"{self.result_mode.value}:{model.__name__}:{key}"
+        entry = self.cache.lookup(key)
+        if entry is not None and entry.fresh:
+            if metrics is not None:
+                metrics.cache_hit = True
+            return self.__from_cache(model, entry, metrics)
+        response = self.transport.get(url, params=params, headers=entry.validators() if entry else None,
+                                      metrics=metrics)
+        if entry is not None and response.status_code == 304:
+            self.cache.revalidate(key, entry)
+            if metrics is not None:
+                metrics.cache_hit = metrics.revalidated = True
+            return self.__from_cache(model, entry, metrics)
+        result = self.__decode(model, response.content, metrics)
+        newest_timestamp = max((get_field(activity, "timestamp") for activity in get_field(result, "data") or ()),
+                               default=None)
+        self.cache.set(key, result if self.cache.store_models else response.content, size=len(response.content),
+                       immutable=self.cache.is_historical(params, newest_timestamp),
+                       etag=response.headers.get("ETag"), last_modified=response.headers.get("Last-Modified"))
+        return result
+
+    def __from_cache(self, model: Type[ModelT], entry: CacheEntry, metrics: Optional[RequestMetrics] = None) -> ModelT:
+        return entry.value if self.cache.store_models else self.__decode(model, entry.value, metrics)
+
+    def __decode(self, model: Type[ModelT], content: bytes, metrics: Optional[RequestMetrics] = None) -> ModelT:
+        start = time.perf_counter() if metrics is not None else 0.0
+        if self.result_mode is ResultMode.MODEL:
+            result = model.model_validate_json(content)
+            if metrics is not None:
+                metrics.validate = time.perf_counter() - start
+            return result
+        payload = json.loads(content)
+        if metrics is not None:
+            metrics.decode = time.perf_counter() - start
+        return LazyModel(model, payload) if self.result_mode is ResultMode.LAZY else payload
+
+    @fast_validate_call
     def fetch_collectible_approval_activities(
             self,
             account: str,
@@ -120,11 +837,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the collectible approval activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.APPROVAL)
-        return CollectibleApprovalActivities(**activities)
+        return self.__do_fetch_activities(CollectibleApprovalActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.APPROVAL)
 
-    @validate_call
+    @fast_validate_call
     def fetch_collectible_burn_activities(
             self,
             account: str,
@@ -139,11 +856,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the collectible burn activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.BURN)
-        return CollectibleBurnActivities(**activities)
+        return self.__do_fetch_activities(CollectibleBurnActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.BURN)
 
-    @validate_call
+    @fast_validate_call
     def fetch_collectible_mint_activities(
             self,
             account: str,
@@ -158,11 +875,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the collectible mint activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.MINT)
-        return CollectibleMintActivities(**activities)
+        return self.__do_fetch_activities(CollectibleMintActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.MINT)
 
-    @validate_call
+    @fast_validate_call
     def fetch_collectible_trade_activities(
             self,
             account: str,
@@ -177,11 +894,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the collectible trade activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.TRADE)
-        return CollectibleTradeActivities(**activities)
+        return self.__do_fetch_activities(CollectibleTradeActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.TRADE)
 
-    @validate_call
+    @fast_validate_call
     def fetch_collectible_transfer_activities(
             self,
             account: str,
@@ -196,12 +913,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the collectible transfer activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.COLLECTIBLE,
-                                                activity_type=ActivityType.TRANSFER)
-        return CollectibleTransferActivities(**activities)
+        return self.__do_fetch_activities(CollectibleTransferActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.TRANSFER)
 
-    @validate_call
+    @fast_validate_call
     def fetch_exchange_liquidity_activities(
             self,
             account: str,
@@ -216,11 +932,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the exchange liquidity activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.EXCHANGE, activity_type=ActivityType.LIQUIDITY)
-        return ExchangeLiquidityActivities(**activities)
+        return self.__do_fetch_activities(ExchangeLiquidityActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.EXCHANGE, activity_type=ActivityType.LIQUIDITY)
 
-    @validate_call
+    @fast_validate_call
     def fetch_exchange_staking_activities(
             self,
             account: str,
@@ -235,11 +951,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the exchange staking activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.EXCHANGE, activity_type=ActivityType.STAKING)
-        return ExchangeStakingActivities(**activities)
+        return self.__do_fetch_activities(ExchangeStakingActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.EXCHANGE, activity_type=ActivityType.STAKING)
 
-    @validate_call
+    @fast_validate_call
     def fetch_exchange_swap_activities(
             self,
             account: str,
@@ -254,11 +970,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the exchange swap activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.EXCHANGE, activity_type=ActivityType.SWAP)
-        return ExchangeSwapActivities(**activities)
+        return self.__do_fetch_activities(ExchangeSwapActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.EXCHANGE, activity_type=ActivityType.SWAP)
 
-    @validate_call
+    @fast_validate_call
     def fetch_metaverse_burn_activities(
             self,
             account: str,
@@ -273,11 +989,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the metaverse burn activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.METAVERSE, activity_type=ActivityType.BURN)
-        return MetaverseBurnActivities(**activities)
+        return self.__do_fetch_activities(MetaverseBurnActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.METAVERSE, activity_type=ActivityType.BURN)
 
-    @validate_call
+    @fast_validate_call
     def fetch_metaverse_mint_activities(
             self,
             account: str,
@@ -292,12 +1008,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the metaverse mint activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.METAVERSE,
-                                                activity_type=ActivityType.MINT)
-        return MetaverseMintActivities(**activities)
+        return self.__do_fetch_activities(MetaverseMintActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.METAVERSE, activity_type=ActivityType.MINT)
 
-    @validate_call
+    @fast_validate_call
     def fetch_metaverse_trade_activities(
             self,
             account: str,
@@ -312,11 +1027,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the metaverse trade activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.METAVERSE, activity_type=ActivityType.TRADE)
-        return MetaverseTradeActivities(**activities)
+        return self.__do_fetch_activities(MetaverseTradeActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.METAVERSE, activity_type=ActivityType.TRADE)
 
-    @validate_call
+    @fast_validate_call
     def fetch_metaverse_transfer_activities(
             self,
             account: str,
@@ -331,11 +1046,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the metaverse transfer activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.METAVERSE, activity_type=ActivityType.TRANSFER)
-        return MetaverseTransferActivities(**activities)
+        return self.__do_fetch_activities(MetaverseTransferActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.METAVERSE, activity_type=ActivityType.TRANSFER)
 
-    @validate_call
+    @fast_validate_call
     def fetch_social_comment_activities(
             self,
             account: str,
@@ -350,11 +1065,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the social comment activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters, tag=ActivityTag.SOCIAL,
-                                                activity_type=ActivityType.COMMENT)
-        return SocialCommentActivities(**activities)
+        return self.__do_fetch_activities(SocialCommentActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.SOCIAL, activity_type=ActivityType.COMMENT)
 
-    @validate_call
+    @fast_validate_call
     def fetch_social_delete_activities(
             self,
             account: str,
@@ -369,11 +1084,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the social delete activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters, tag=ActivityTag.SOCIAL,
-                                                activity_type=ActivityType.DELETE)
-        return SocialDeleteActivities(**activities)
+        return self.__do_fetch_activities(SocialDeleteActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.SOCIAL, activity_type=ActivityType.DELETE)
 
-    @validate_call
+    @fast_validate_call
     def fetch_social_mint_activities(
             self,
             account: str,
@@ -388,11 +1103,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the social mint activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters, tag=ActivityTag.SOCIAL,
-                                                activity_type=ActivityType.MINT)
-        return SocialMintActivities(**activities)
+        return self.__do_fetch_activities(SocialMintActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.SOCIAL, activity_type=ActivityType.MINT)
 
-    @validate_call
+    @fast_validate_call
     def fetch_social_post_activities(
             self,
             account: str,
@@ -407,11 +1122,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the social post activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters, tag=ActivityTag.SOCIAL,
-                                                activity_type=ActivityType.POST)
-        return SocialPostActivities(**activities)
+        return self.__do_fetch_activities(SocialPostActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.SOCIAL, activity_type=ActivityType.POST)
 
-    @validate_call
+    @fast_validate_call
     def fetch_social_profile_activities(
             self,
             account: str,
@@ -426,11 +1141,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the social profile activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters, tag=ActivityTag.SOCIAL,
-                                                activity_type=ActivityType.PROFILE)
-        return SocialProfileActivities(**activities)
+        return self.__do_fetch_activities(SocialProfileActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.SOCIAL, activity_type=ActivityType.PROFILE)
 
-    @validate_call
+    @fast_validate_call
     def fetch_social_proxy_activities(
             self,
             account: str,
@@ -445,11 +1160,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the social proxy activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters, tag=ActivityTag.SOCIAL,
-                                                activity_type=ActivityType.PROXY)
-        return SocialProxyActivities(**activities)
+        return self.__do_fetch_activities(SocialProxyActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.SOCIAL, activity_type=ActivityType.PROXY)
 
-    @validate_call
+    @fast_validate_call
     def fetch_social_revise_activities(
             self,
             account: str,
@@ -466,11 +1181,11 @@ class RSS3Client:
         :return: A dictionary containing the social revise activities.
         """
 
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters, tag=ActivityTag.SOCIAL,
-                                                activity_type=ActivityType.REVISE)
-        return SocialReviseActivities(**activities)
+        return self.__do_fetch_activities(SocialReviseActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.SOCIAL, activity_type=ActivityType.REVISE)
 
-    @validate_call
+    @fast_validate_call
     def fetch_social_reward_activities(
             self,
             account: str,
@@ -485,11 +1200,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the social reward activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters, tag=ActivityTag.SOCIAL,
-                                                activity_type=ActivityType.REWARD)
-        return SocialRewardActivities(**activities)
+        return self.__do_fetch_activities(SocialRewardActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.SOCIAL, activity_type=ActivityType.REWARD)
 
-    @validate_call
+    @fast_validate_call
     def fetch_social_share_activities(
             self,
             account: str,
@@ -504,11 +1219,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the social share activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters, tag=ActivityTag.SOCIAL,
-                                                activity_type=ActivityType.SHARE)
-        return SocialShareActivities(**activities)
+        return self.__do_fetch_activities(SocialShareActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.SOCIAL, activity_type=ActivityType.SHARE)
 
-    @validate_call
+    @fast_validate_call
     def fetch_transaction_approval_activities(
             self,
             account: str,
@@ -523,11 +1238,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the transaction approval activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.TRANSACTION, activity_type=ActivityType.APPROVAL)
-        return TransactionApprovalActivities(**activities)
+        return self.__do_fetch_activities(TransactionApprovalActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.TRANSACTION, activity_type=ActivityType.APPROVAL)
 
-    @validate_call
+    @fast_validate_call
     def fetch_transaction_bridge_activities(
             self,
             account: str,
@@ -542,11 +1257,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the transaction bridge activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.TRANSACTION, activity_type=ActivityType.BRIDGE)
-        return TransactionBridgeActivities(**activities)
+        return self.__do_fetch_activities(TransactionBridgeActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.TRANSACTION, activity_type=ActivityType.BRIDGE)
 
-    @validate_call
+    @fast_validate_call
     def fetch_transaction_burn_activities(
             self,
             account: str,
@@ -561,11 +1276,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the transaction burn activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.TRANSACTION, activity_type=ActivityType.BURN)
-        return TransactionBurnActivities(**activities)
+        return self.__do_fetch_activities(TransactionBurnActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.TRANSACTION, activity_type=ActivityType.BURN)
 
-    @validate_call
+    @fast_validate_call
     def fetch_transaction_mint_activities(
             self,
             account: str,
@@ -580,11 +1295,11 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the transaction mint activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.TRANSACTION, activity_type=ActivityType.MINT)
-        return TransactionMintActivities(**activities)
+        return self.__do_fetch_activities(TransactionMintActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.TRANSACTION, activity_type=ActivityType.MINT)
 
-    @validate_call
+    @fast_validate_call
     def fetch_transaction_transfer_activities(
             self,
             account: str,
@@ -599,9 +1314,763 @@ class RSS3Client:
         :param pagination: Pagination options for the request.
         :return: A dictionary containing the transaction transfer activities.
         """
-        activities = self.__do_fetch_activities(account, pagination=pagination, filters=filters,
-                                                tag=ActivityTag.TRANSACTION, activity_type=ActivityType.TRANSFER)
-        return TransactionTransferActivities(**activities)
+        return self.__do_fetch_activities(TransactionTransferActivities, account,
+                                          pagination=pagination, filters=filters,
+                                          tag=ActivityTag.TRANSACTION, activity_type=ActivityType.TRANSFER)
+
+    @fast_validate_call
+    def iter_collectible_approval_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over collectible approval activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the collectible approval activities.
+        """
+        return self.__iter_activities(CollectibleApprovalActivities, account,
+                                      tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.APPROVAL,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_collectible_burn_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over collectible burn activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the collectible burn activities.
+        """
+        return self.__iter_activities(CollectibleBurnActivities, account,
+                                      tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.BURN,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_collectible_mint_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over collectible mint activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the collectible mint activities.
+        """
+        return self.__iter_activities(CollectibleMintActivities, account,
+                                      tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.MINT,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_collectible_trade_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over collectible trade activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the collectible trade activities.
+        """
+        return self.__iter_activities(CollectibleTradeActivities, account,
+                                      tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.TRADE,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_collectible_transfer_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over collectible transfer activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the collectible transfer activities.
+        """
+        return self.__iter_activities(CollectibleTransferActivities, account,
+                                      tag=ActivityTag.COLLECTIBLE, activity_type=ActivityType.TRANSFER,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_exchange_liquidity_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over exchange liquidity activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the exchange liquidity activities.
+        """
+        return self.__iter_activities(ExchangeLiquidityActivities, account,
+                                      tag=ActivityTag.EXCHANGE, activity_type=ActivityType.LIQUIDITY,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_exchange_staking_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over exchange staking activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the exchange staking activities.
+        """
+        return self.__iter_activities(ExchangeStakingActivities, account,
+                                      tag=ActivityTag.EXCHANGE, activity_type=ActivityType.STAKING,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_exchange_swap_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over exchange swap activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the exchange swap activities.
+        """
+        return self.__iter_activities(ExchangeSwapActivities, account,
+                                      tag=ActivityTag.EXCHANGE, activity_type=ActivityType.SWAP,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_metaverse_burn_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over metaverse burn activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the metaverse burn activities.
+        """
+        return self.__iter_activities(MetaverseBurnActivities, account,
+                                      tag=ActivityTag.METAVERSE, activity_type=ActivityType.BURN,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_metaverse_mint_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over metaverse mint activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the metaverse mint activities.
+        """
+        return self.__iter_activities(MetaverseMintActivities, account,
+                                      tag=ActivityTag.METAVERSE, activity_type=ActivityType.MINT,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_metaverse_trade_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over metaverse trade activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the metaverse trade activities.
+        """
+        return self.__iter_activities(MetaverseTradeActivities, account,
+                                      tag=ActivityTag.METAVERSE, activity_type=ActivityType.TRADE,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_metaverse_transfer_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over metaverse transfer activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the metaverse transfer activities.
+        """
+        return self.__iter_activities(MetaverseTransferActivities, account,
+                                      tag=ActivityTag.METAVERSE, activity_type=ActivityType.TRANSFER,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_social_comment_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over social comment activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the social comment activities.
+        """
+        return self.__iter_activities(SocialCommentActivities, account,
+                                      tag=ActivityTag.SOCIAL, activity_type=ActivityType.COMMENT,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_social_delete_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over social delete activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the social delete activities.
+        """
+        return self.__iter_activities(SocialDeleteActivities, account,
+                                      tag=ActivityTag.SOCIAL, activity_type=ActivityType.DELETE,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_social_mint_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over social mint activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the social mint activities.
+        """
+        return self.__iter_activities(SocialMintActivities, account,
+                                      tag=ActivityTag.SOCIAL, activity_type=ActivityType.MINT,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_social_post_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over social post activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the social post activities.
+        """
+        return self.__iter_activities(SocialPostActivities, account,
+                                      tag=ActivityTag.SOCIAL, activity_type=ActivityType.POST,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_social_profile_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over social profile activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the social profile activities.
+        """
+        return self.__iter_activities(SocialProfileActivities, account,
+                                      tag=ActivityTag.SOCIAL, activity_type=ActivityType.PROFILE,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_social_proxy_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over social proxy activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the social proxy activities.
+        """
+        return self.__iter_activities(SocialProxyActivities, account,
+                                      tag=ActivityTag.SOCIAL, activity_type=ActivityType.PROXY,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_social_revise_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over social revise activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the social revise activities.
+        """
+        return self.__iter_activities(SocialReviseActivities, account,
+                                      tag=ActivityTag.SOCIAL, activity_type=ActivityType.REVISE,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_social_reward_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over social reward activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the social reward activities.
+        """
+        return self.__iter_activities(SocialRewardActivities, account,
+                                      tag=ActivityTag.SOCIAL, activity_type=ActivityType.REWARD,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_social_share_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over social share activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the social share activities.
+        """
+        return self.__iter_activities(SocialShareActivities, account,
+                                      tag=ActivityTag.SOCIAL, activity_type=ActivityType.SHARE,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_transaction_approval_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over transaction approval activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the transaction approval activities.
+        """
+        return self.__iter_activities(TransactionApprovalActivities, account,
+                                      tag=ActivityTag.TRANSACTION, activity_type=ActivityType.APPROVAL,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_transaction_bridge_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over transaction bridge activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the transaction bridge activities.
+        """
+        return self.__iter_activities(TransactionBridgeActivities, account,
+                                      tag=ActivityTag.TRANSACTION, activity_type=ActivityType.BRIDGE,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_transaction_burn_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over transaction burn activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the transaction burn activities.
+        """
+        return self.__iter_activities(TransactionBurnActivities, account,
+                                      tag=ActivityTag.TRANSACTION, activity_type=ActivityType.BURN,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_transaction_mint_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over transaction mint activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the transaction mint activities.
+        """
+        return self.__iter_activities(TransactionMintActivities, account,
+                                      tag=ActivityTag.TRANSACTION, activity_type=ActivityType.MINT,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
+
+    @fast_validate_call
+    def iter_transaction_transfer_activities(
+            self,
+            account: str,
+            filters: Optional[ActivityFilter] = None,
+            pagination: Optional[PaginationOptions] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            stop_before_timestamp: Optional[int] = None,
+            prefetch: int = 0
+    ) -> Iterator[Activity]:
+        """
+        Iterate over transaction transfer activities for a specific account, following the pagination cursor.
+
+        :param account: The account address.
+        :param filters: Additional filters to apply to the activity retrieval.
+        :param pagination: Pagination options for the first request.
+        :param max_items: The maximum number of activities to yield.
+        :param max_pages: The maximum number of pages to fetch.
+        :param stop_before_timestamp: Stop at the first activity older than this timestamp.
+        :param prefetch: The number of pages to fetch ahead on a background thread, 0 to disable.
+        :return: An iterator over the transaction transfer activities.
+        """
+        return self.__iter_activities(TransactionTransferActivities, account,
+                                      tag=ActivityTag.TRANSACTION, activity_type=ActivityType.TRANSFER,
+                                      filters=filters, pagination=pagination, max_items=max_items,
+                                      max_pages=max_pages, stop_before_timestamp=stop_before_timestamp,
+                                      prefetch=prefetch)
 
     def fetch_rss_activity_by_path(self, path: str) -> RssFeedActivities:
         """
@@ -611,6 +2080,4 @@ class RSS3Client:
         :return: A dictionary containing the RSS activity details.
         """
         url = f"{self.base_url}/rss/{path}"
-        response = requests.get(url)
-        response_json = response.json()
-        return RssFeedActivities(**response_json)
+        return self.__get(RssFeedActivities, url)
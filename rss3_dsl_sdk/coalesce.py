@@ -0,0 +1,69 @@
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "followers")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Coalesces identical calls that are in flight at the same time across threads.
+
+    The first caller of a key, the leader, runs the function; callers of the same key that arrive before it
+    returns wait and receive the leader's result, or its exception, instead of running the function again. Once the
+    leader returns, the next call of the key runs the function anew, so results are never reused like a cache.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, _Call] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of keys whose leader is running.
+        """
+        return len(self._in_flight)
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """
+        Run ``func`` unless a call of ``key`` is already in flight, in which case wait for its result.
+
+        :param key: The key that identifies equal calls.
+        :param func: The function to run.
+        :return: The result of ``func``, as returned to the leader.
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._in_flight.get(key)
+            if call is not None:
+                self.coalesced += 1
+                call.followers += 1
+                leader = False
+            else:
+                call = self._in_flight[key] = _Call()
+                leader = True
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,39 @@
+from typing import Any, Optional
+
+
+class RSS3Error(Exception):
+    """
+    The base class of the errors raised by the SDK.
+    """
+
+
+class APIError(RSS3Error):
+    """
+    A DSL node answered with an error status, after any retries were exhausted.
+    """
+
+    def __init__(self, status_code: int, url: str, body: str = "", retry_after: Optional[str] = None):
+        """
+        Initialize the error.
+
+        :param status_code: The HTTP status of the response.
+        :param url: The requested URL.
+        :param body: The response body, truncated.
+        :param retry_after: The ``Retry-After`` header of the response, if any.
+        """
+        super().__init__(f"{status_code} error from {url}: {body}" if body else f"{status_code} error from {url}")
+        self.status_code = status_code
+        self.url = url
+        self.body = body
+        self.retry_after = retry_after
+
+    @classmethod
+    def from_response(cls, response: Any) -> "APIError":
+        """
+        Build the error of a ``requests`` or ``httpx`` response.
+
+        :param response: The HTTP response.
+        :return: The error.
+        """
+        return cls(response.status_code, str(response.url), response.text[:500],
+                   retry_after=response.headers.get("Retry-After"))
@@ -0,0 +1,104 @@
+import threading
+from collections import deque
+from typing import NamedTuple, Optional
+
+
+class HedgePolicy(NamedTuple):
+    """
+    When a duplicate of a slow request is sent.
+
+    A request that has not answered after the ``percentile`` of recent latencies, bounded by ``min_delay`` and
+    ``max_delay``, is sent a second time and the first response wins. Hedging starts once ``min_samples``
+    latencies were observed, and at most ``budget`` extra requests per request are sent, so a slow node receives
+    at most ``1 + budget`` times its normal load.
+    """
+
+    percentile: float = 95.0
+    budget: float = 0.1
+    min_delay: float = 0.005
+    max_delay: Optional[float] = None
+    min_samples: int = 20
+    window: int = 1000
+
+
+class Hedger:
+    """
+    The latency window, budget and counters that drive hedged requests of a transport.
+
+    The hedging delay is recomputed from the window every 16 recorded latencies rather than on every request.
+    """
+
+    def __init__(self, policy: HedgePolicy):
+        """
+        Initialize the hedger.
+
+        :param policy: The hedging policy.
+        """
+        self.policy = policy
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._latencies = deque(maxlen=policy.window)
+        self._lock = threading.Lock()
+        self._threshold: Optional[float] = None
+        self._stale = 0
+
+    def record(self, latency: float):
+        """
+        Record the latency of a completed request.
+
+        :param latency: The latency in seconds.
+        """
+        with self._lock:
+            self._latencies.append(latency)
+            self._stale += 1
+
+    def delay(self) -> Optional[float]:
+        """
+        Count a new request and get how long to wait before hedging it.
+
+        :return: The delay in seconds, or ``None`` while too few latencies were observed.
+        """
+        with self._lock:
+            self.requests += 1
+            if len(self._latencies) < self.policy.min_samples:
+                return None
+            if self._threshold is None or self._stale >= 16:
+                self._threshold = _percentile(sorted(self._latencies), self.policy.percentile)
+                self._stale = 0
+            delay = max(self.policy.min_delay, self._threshold)
+        return delay if self.policy.max_delay is None else min(delay, self.policy.max_delay)
+
+    def try_hedge(self) -> bool:
+        """
+        Take a hedge from the budget.
+
+        :return: Whether the budget allowed the hedge.
+        """
+        with self._lock:
+            if self.hedges + 1 > self.policy.budget * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def won(self):
+        """
+        Record that a hedge answered before the original request.
+        """
+        with self._lock:
+            self.hedge_wins += 1
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Get a percentile of the recent latencies.
+
+        :param percentile: The percentile, between 0 and 100.
+        :return: The latency in seconds, or ``None`` if none was recorded.
+        """
+        with self._lock:
+            ordered = sorted(self._latencies)
+        return _percentile(ordered, percentile) if ordered else None
+
+
+def _percentile(ordered: list, percentile: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
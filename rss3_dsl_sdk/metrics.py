@@ -0,0 +1,232 @@
+import bisect
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+PHASES = ("connect", "ttfb", "download", "decode", "validate", "total")
+
+LATENCY_BUCKETS = tuple(0.001 * 2 ** exponent for exponent in range(17))
+SIZE_BUCKETS = tuple(256 * 4 ** exponent for exponent in range(10))
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+class RequestMetrics:
+    """
+    The timings and sizes of one request made by a client, passed to its observers once the request is done.
+
+    Phases are in seconds and ``None`` when they did not happen or could not be measured:
+
+    - ``connect``: opening a new connection, including TLS. Measured by :class:`~rss3_dsl_sdk.transport.HTTP2Transport`
+      only; with other transports it is part of ``ttfb``.
+    - ``ttfb``: from sending the request to receiving the response headers.
+    - ``download``: reading the response body.
+    - ``decode``: parsing the JSON body, in :attr:`~rss3_dsl_sdk.client.ResultMode.LAZY` and
+      :attr:`~rss3_dsl_sdk.client.ResultMode.RAW` modes.
+    - ``validate``: building the models. In :attr:`~rss3_dsl_sdk.client.ResultMode.MODEL` mode pydantic parses the
+      JSON while validating, so this includes parsing.
+    - ``total``: the whole call, including retries and waiting for rate limits.
+
+    ``response_bytes`` is the size of the decompressed body and ``wire_bytes`` the size transferred, which is
+    smaller when the node compressed the response with ``content_encoding``.
+    """
+
+    __slots__ = ("url", "params", "status_code", "connect", "ttfb", "download", "decode", "validate", "total",
+                 "response_bytes", "wire_bytes", "content_encoding", "activities", "actions", "cache_hit",
+                 "revalidated", "retries", "error")
+
+    def __init__(self, url: str, params: Optional[dict] = None):
+        self.url = url
+        self.params = params
+        self.status_code: Optional[int] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.download: Optional[float] = None
+        self.decode: Optional[float] = None
+        self.validate: Optional[float] = None
+        self.total: Optional[float] = None
+        self.response_bytes = 0
+        self.wire_bytes = 0
+        self.content_encoding: Optional[str] = None
+        self.activities = 0
+        self.actions = 0
+        self.cache_hit = False
+        self.revalidated = False
+        self.retries = 0
+        self.error: Optional[BaseException] = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__ if name != "params")
+        return f"RequestMetrics({fields})"
+
+
+class Timings:
+    """
+    The transfer phases of a single HTTP exchange, filled in by a transport.
+    """
+
+    __slots__ = ("connect", "ttfb", "download")
+
+    def __init__(self):
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.download: Optional[float] = None
+
+
+class BaseObserver:
+    """
+    The base class of objects notified of the requests made by a client.
+    """
+
+    def on_request(self, metrics: RequestMetrics):
+        """
+        Handle a finished request, successful or not.
+
+        :param metrics: The metrics of the request.
+        """
+        raise NotImplementedError
+
+
+Observer = Union[BaseObserver, Callable[[RequestMetrics], None]]
+
+
+def as_callbacks(observers: Optional[Sequence[Observer]]) -> List[Callable[[RequestMetrics], None]]:
+    """
+    Turn observers and plain callbacks into a list of callbacks.
+
+    :param observers: The observers, which are :class:`BaseObserver` instances or functions taking the metrics.
+    :return: The callbacks.
+    """
+    return [observer.on_request if isinstance(observer, BaseObserver) else observer for observer in observers or ()]
+
+
+class Histogram:
+    """
+    A thread-safe histogram over fixed bucket upper bounds, compatible with Prometheus-style cumulative buckets.
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        """
+        Initialize an empty histogram.
+
+        :param bounds: The sorted upper bounds of the buckets. Values above the last bound fall in an overflow bucket.
+        """
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        """
+        Add a value.
+
+        :param value: The value.
+        """
+        with self._lock:
+            self.counts[bisect.bisect_left(self.bounds, value)] += 1
+            self.count += 1
+            self.sum += value
+
+    def quantile(self, quantile: float) -> Optional[float]:
+        """
+        Estimate a quantile by linear interpolation within its bucket.
+
+        :param quantile: The quantile, between 0 and 1.
+        :return: The estimate, or ``None`` if the histogram is empty. Quantiles in the overflow bucket are reported
+            as the last bound.
+        """
+        with self._lock:
+            if not self.count:
+                return None
+            rank = quantile * self.count
+            seen = 0
+            for index, count in enumerate(self.counts):
+                if count and seen + count >= rank:
+                    if index == len(self.bounds):
+                        return self.bounds[-1]
+                    lower = self.bounds[index - 1] if index else 0.0
+                    return lower + (self.bounds[index] - lower) * (rank - seen) / count
+                seen += count
+            return self.bounds[-1]
+
+    def to_dict(self) -> dict:
+        """
+        Export the histogram.
+
+        :return: A dictionary with the count, sum, p50, p90 and p99 estimates, and the cumulative count of each
+            bucket keyed on its upper bound, ``"+Inf"`` for the overflow bucket.
+        """
+        quantiles = {f"p{int(q * 100)}": self.quantile(q) for q in (0.5, 0.9, 0.99)}
+        with self._lock:
+            buckets, cumulative = {}, 0
+            for bound, count in zip(self.bounds + ("+Inf",), self.counts):
+                cumulative += count
+                buckets[bound] = cumulative
+            return dict(count=self.count, sum=self.sum, **quantiles, buckets=buckets)
+
+
+class MetricsAggregator(BaseObserver):
+    """
+    An observer aggregating request metrics into counters and histograms, to export to a metrics pipeline.
+    """
+
+    def __init__(self, latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+                 size_buckets: Sequence[float] = SIZE_BUCKETS):
+        """
+        Initialize empty metrics.
+
+        :param latency_buckets: The upper bounds in seconds of the buckets of the phase histograms.
+        :param size_buckets: The upper bounds in bytes of the buckets of the response size histogram.
+        """
+        self.latency_buckets = tuple(latency_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Clear all metrics.
+        """
+        with self._lock:
+            self.counters: Dict[str, int] = dict.fromkeys(
+                ("requests", "errors", "cache_hits", "revalidations", "retries", "response_bytes", "wire_bytes",
+                 "activities", "actions"), 0)
+            self.phases = {phase: Histogram(self.latency_buckets) for phase in PHASES}
+            self.response_bytes = Histogram(self.size_buckets)
+            self.activities = Histogram(COUNT_BUCKETS)
+
+    def on_request(self, metrics: RequestMetrics):
+        with self._lock:
+            counters, phases, sizes, activities = self.counters, self.phases, self.response_bytes, self.activities
+            counters["requests"] += 1
+            counters["errors"] += metrics.error is not None
+            counters["cache_hits"] += metrics.cache_hit
+            counters["revalidations"] += metrics.revalidated
+            counters["retries"] += metrics.retries
+            counters["response_bytes"] += metrics.response_bytes
+            counters["wire_bytes"] += metrics.wire_bytes
+            counters["activities"] += metrics.activities
+            counters["actions"] += metrics.actions
+        for phase in PHASES:
+            value = getattr(metrics, phase)
+            if value is not None:
+                phases[phase].observe(value)
+        if metrics.status_code is not None and not metrics.revalidated:
+            sizes.observe(metrics.response_bytes)
+        if metrics.error is None:
+            activities.observe(metrics.activities)
+
+    def snapshot(self) -> dict:
+        """
+        Export the metrics.
+
+        :return: A dictionary with the ``counters`` and the ``phases``, ``response_bytes`` and ``activities``
+            histograms, as exported by :meth:`Histogram.to_dict`.
+        """
+        with self._lock:
+            counters, phases, sizes, activities = dict(self.counters), self.phases, self.response_bytes, self.activities
+        return {
+            "counters": counters,
+            "phases": {phase: histogram.to_dict() for phase, histogram in phases.items()},
+            "response_bytes": sizes.to_dict(),
+            "activities": activities.to_dict(),
+        }
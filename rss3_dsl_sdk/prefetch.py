@@ -0,0 +1,65 @@
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar('T')
+
+_DONE = object()
+_POLL_INTERVAL = 0.1
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def read_ahead(iterable: Iterable[T], depth: int = 1) -> Iterator[T]:
+    """
+    Consume an iterable on a background thread, staying up to ``depth`` items ahead of the caller.
+
+    Each item is produced while the caller is still processing the previous ones, which hides the latency of
+    producing it. Errors raised by the iterable are re-raised to the caller in order, and closing the returned
+    iterator stops the background thread.
+
+    :param iterable: The iterable to consume, such as a page generator.
+    :param depth: The maximum number of items produced ahead of the caller.
+    :return: An iterator over the items of ``iterable``.
+    """
+    if depth < 1:
+        raise ValueError("depth must be at least 1")
+    items = queue.Queue()
+    permits = threading.Semaphore(depth)
+    stopped = threading.Event()
+
+    def produce():
+        iterator = iter(iterable)
+        try:
+            while not stopped.is_set():
+                if not permits.acquire(timeout=_POLL_INTERVAL):
+                    continue
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    items.put(_DONE)
+                    return
+                items.put(item)
+        except BaseException as error:
+            items.put(_Failure(error))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    worker = threading.Thread(target=produce, name="rss3-read-ahead", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            permits.release()
+            yield item
+    finally:
+        stopped.set()
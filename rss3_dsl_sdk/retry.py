@@ -0,0 +1,216 @@
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import NamedTuple, Optional, Tuple
+
+THROTTLE_STATUSES = (429, 503)
+
+
+class RetryPolicy(NamedTuple):
+    """
+    When and how long to wait before a failed request is sent again.
+
+    Connection errors, timeouts and responses with a status in ``statuses`` are retried up to ``max_retries``
+    times. The delay before retry ``n`` is drawn uniformly from ``[0, min(max_backoff, backoff_factor * 2 ** n)]``
+    ("full jitter"), so clients that failed together do not retry in lockstep, unless the response carries a
+    ``Retry-After`` header, which is honored up to ``max_backoff``.
+    """
+
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Get the number of seconds to wait before a retry.
+
+        :param attempt: The number of the failed attempt, starting at 0.
+        :param retry_after: The ``Retry-After`` header of the failed response, if any.
+        :return: The delay in seconds.
+        """
+        seconds = parse_retry_after(retry_after) if retry_after else None
+        if seconds is None:
+            seconds = random.uniform(0, self.backoff_factor * 2 ** attempt)
+        return min(seconds, self.max_backoff)
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header given either in seconds or as an HTTP date.
+
+    :param value: The header value.
+    :return: The number of seconds to wait, or ``None`` if the value is malformed.
+    """
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    A thread-safe token-bucket rate limiter allowing ``rate`` requests per second on average, in bursts of up to
+    ``burst`` requests.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initialize a full bucket.
+
+        :param rate: The number of tokens added per second.
+        :param burst: The capacity of the bucket, ``rate`` rounded up by default.
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate + 0.999))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token, going into debt if the bucket is empty.
+
+        :return: The number of seconds to wait before the token may be used.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self):
+        """
+        Take a token, sleeping until it is available.
+        """
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        """
+        Take a token, sleeping asynchronously until it is available.
+        """
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class AIMDLimiter:
+    """
+    A concurrency limit that adapts to throttling with additive increase and multiplicative decrease.
+
+    Every successful response raises the limit by ``increase / limit``, i.e. by about ``increase`` per round of
+    ``limit`` requests, and a throttled response (429 or 503) multiplies it by ``decrease``. The limit is cut at most
+    once per round: throttled responses are ignored until ``limit`` responses completed since the last cut, since
+    the requests that were already in flight when the node started throttling would otherwise cut it again and again
+    for a single overload. The number of requests in flight converges to what the node accepts without manual
+    tuning.
+    """
+
+    def __init__(self, maximum: int, minimum: int = 1, initial: Optional[float] = None, increase: float = 1.0,
+                 decrease: float = 0.5):
+        """
+        Initialize the limiter.
+
+        :param maximum: The upper bound of the limit, usually the connection pool size.
+        :param minimum: The lower bound of the limit.
+        :param initial: The starting limit, ``maximum`` by default.
+        :param increase: The additive increase per round of successful requests.
+        :param decrease: The factor applied to the limit on throttling.
+        """
+        self.maximum = maximum
+        self.minimum = minimum
+        self.increase = increase
+        self.decrease = decrease
+        self._limit = float(initial if initial is not None else maximum)
+        self._in_flight = 0
+        self._since_cut = maximum
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """
+        The current number of requests allowed in flight.
+        """
+        return max(self.minimum, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of requests in flight.
+        """
+        return self._in_flight
+
+    def acquire(self):
+        """
+        Wait until a request may be sent and count it as in flight.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    def release(self):
+        """
+        Count a request as finished.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def on_success(self):
+        """
+        Record a response that was not throttled.
+        """
+        with self._condition:
+            self._since_cut += 1
+            limit = self.limit
+            self._limit = min(self.maximum, self._limit + self.increase / self._limit)
+            if self.limit > limit:
+                self._condition.notify(self.limit - limit)
+
+    def on_throttle(self):
+        """
+        Record a throttled response, cutting the limit unless it was cut less than a round ago.
+        """
+        with self._condition:
+            self._since_cut += 1
+            if self._since_cut >= self.limit:
+                self._limit = max(self.minimum, self._limit * self.decrease)
+                self._since_cut = 0
+
+
+class AsyncAIMDLimiter(AIMDLimiter):
+    """
+    An :class:`AIMDLimiter` whose waiting is done on the event loop.
+    """
+
+    def __init__(self, maximum: int, minimum: int = 1, initial: Optional[float] = None, increase: float = 1.0,
+                 decrease: float = 0.5):
+        super().__init__(maximum, minimum=minimum, initial=initial, increase=increase, decrease=decrease)
+        self._async_condition: Optional[asyncio.Condition] = None
+
+    async def acquire_async(self):
+        """
+        Wait until a request may be sent and count it as in flight.
+        """
+        if self._async_condition is None:
+            self._async_condition = asyncio.Condition()
+        async with self._async_condition:
+            await self._async_condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release_async(self):
+        """
+        Count a request as finished.
+        """
+        async with self._async_condition:
+            self._in_flight -= 1
+            self._async_condition.notify_all()
@@ -0,0 +1,181 @@
+from typing import Annotated, Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, Discriminator, Tag, TypeAdapter, ValidationError, ValidatorFunctionWrapHandler, \
+    WrapValidator
+
+from rss3_dsl_sdk.schemas.base import Action, Activities, Activity
+from rss3_dsl_sdk.schemas.enums import ActivityTag, ActivityType
+from rss3_dsl_sdk.schemas.collectible import (
+    CollectibleApprovalMetadata,
+    CollectibleBurnMetadata,
+    CollectibleMintMetadata,
+    CollectibleTradeMetadata,
+    CollectibleTransferMetadata
+)
+from rss3_dsl_sdk.schemas.exchange import (
+    ExchangeLiquidityMetadata,
+    ExchangeStakingMetadata,
+    ExchangeSwapMetadata
+)
+from rss3_dsl_sdk.schemas.metaverse import (
+    MetaverseBurnMetadata,
+    MetaverseMintMetadata,
+    MetaverseTradeMetadata,
+    MetaverseTransferMetadata
+)
+from rss3_dsl_sdk.schemas.rss import (
+    RssFeedMetadata
+)
+from rss3_dsl_sdk.schemas.social import (
+    SocialCommentMetadata,
+    SocialDeleteMetadata,
+    SocialMintMetadata,
+    SocialPostMetadata,
+    SocialReviseMetadata,
+    SocialRewardMetadata,
+    SocialShareMetadata,
+    SocialProfileMetadata,
+    SocialProxyMetadata
+)
+from rss3_dsl_sdk.schemas.transaction import (
+    TransactionApprovalMetadata,
+    TransactionBridgeMetadata,
+    TransactionBurnMetadata,
+    TransactionMintMetadata,
+    TransactionTransferMetadata
+)
+
+ActivityKind = Tuple[ActivityTag, ActivityType]
+
+METADATA_TYPES: Dict[ActivityKind, Type[BaseModel]] = {
+    (ActivityTag.COLLECTIBLE, ActivityType.APPROVAL): CollectibleApprovalMetadata,
+    (ActivityTag.COLLECTIBLE, ActivityType.BURN): CollectibleBurnMetadata,
+    (ActivityTag.COLLECTIBLE, ActivityType.MINT): CollectibleMintMetadata,
+    (ActivityTag.COLLECTIBLE, ActivityType.TRADE): CollectibleTradeMetadata,
+    (ActivityTag.COLLECTIBLE, ActivityType.TRANSFER): CollectibleTransferMetadata,
+    (ActivityTag.EXCHANGE, ActivityType.LIQUIDITY): ExchangeLiquidityMetadata,
+    (ActivityTag.EXCHANGE, ActivityType.STAKING): ExchangeStakingMetadata,
+    (ActivityTag.EXCHANGE, ActivityType.SWAP): ExchangeSwapMetadata,
+    (ActivityTag.METAVERSE, ActivityType.BURN): MetaverseBurnMetadata,
+    (ActivityTag.METAVERSE, ActivityType.MINT): MetaverseMintMetadata,
+    (ActivityTag.METAVERSE, ActivityType.TRADE): MetaverseTradeMetadata,
+    (ActivityTag.METAVERSE, ActivityType.TRANSFER): MetaverseTransferMetadata,
+    (ActivityTag.RSS, ActivityType.FEED): RssFeedMetadata,
+    (ActivityTag.SOCIAL, ActivityType.COMMENT): SocialCommentMetadata,
+    (ActivityTag.SOCIAL, ActivityType.DELETE): SocialDeleteMetadata,
+    (ActivityTag.SOCIAL, ActivityType.MINT): SocialMintMetadata,
+    (ActivityTag.SOCIAL, ActivityType.POST): SocialPostMetadata,
+    (ActivityTag.SOCIAL, ActivityType.REVISE): SocialReviseMetadata,
+    (ActivityTag.SOCIAL, ActivityType.REWARD): SocialRewardMetadata,
+    (ActivityTag.SOCIAL, ActivityType.SHARE): SocialShareMetadata,
+    (ActivityTag.SOCIAL, ActivityType.PROFILE): SocialProfileMetadata,
+    (ActivityTag.SOCIAL, ActivityType.PROXY): SocialProxyMetadata,
+    (ActivityTag.TRANSACTION, ActivityType.APPROVAL): TransactionApprovalMetadata,
+    (ActivityTag.TRANSACTION, ActivityType.BRIDGE): TransactionBridgeMetadata,
+    (ActivityTag.TRANSACTION, ActivityType.BURN): TransactionBurnMetadata,
+    (ActivityTag.TRANSACTION, ActivityType.MINT): TransactionMintMetadata,
+    (ActivityTag.TRANSACTION, ActivityType.TRANSFER): TransactionTransferMetadata,
+}
+
+
+_UNKNOWN = "unknown"
+_ACTION_TAGS: Dict[Tuple[str, str], str] = {
+    (tag.value, activity_type.value): f"{tag.value}.{activity_type.value}" for tag, activity_type in METADATA_TYPES
+}
+
+
+def _action_tag(action: Any) -> str:
+    if isinstance(action, dict):
+        kind = action.get("tag"), action.get("type")
+    else:
+        kind = getattr(action, "tag", None), getattr(action, "type", None)
+    try:
+        return _ACTION_TAGS.get(kind, _UNKNOWN)
+    except TypeError:
+        return _UNKNOWN
+
+
+_UNTYPED_ACTION = TypeAdapter(Action[Dict[str, Any]])
+
+
+def _untyped_fallback(action: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    try:
+        return handler(action)
+    except ValidationError:
+        if not isinstance(action, dict):
+            raise
+        return _UNTYPED_ACTION.validate_python(action)
+
+
+TypedAction = Annotated[
+    Union[tuple(
+        [Annotated[Action[metadata], Tag(_ACTION_TAGS[(tag.value, activity_type.value)])]
+         for (tag, activity_type), metadata in METADATA_TYPES.items()]
+        + [Annotated[Action[Dict[str, Any]], Tag(_UNKNOWN)]]
+    )],
+    Discriminator(_action_tag),
+    WrapValidator(_untyped_fallback)
+]
+"""
+An action whose metadata is parsed into the model of its tag and type, or kept as a dict for unknown combinations
+and for metadata that does not fit its model, e.g. a network the SDK does not know yet, so one such action does not
+fail the whole page.
+"""
+
+
+class TypedActivity(Activity):
+    actions: List[TypedAction]
+
+
+class TypedActivities(Activities):
+    """
+    Activities of mixed tags and types, with each action's metadata parsed by :data:`TypedAction`.
+    """
+
+    data: List[TypedActivity]
+
+
+def metadata_type(tag: ActivityTag, activity_type: ActivityType) -> Optional[Type[BaseModel]]:
+    """
+    Get the metadata model of an activity tag and type.
+
+    :param tag: The tag of the activity or action.
+    :param activity_type: The type of the activity or action.
+    :return: The metadata model, or ``None`` for unknown combinations.
+    """
+    return METADATA_TYPES.get((tag, activity_type))
+
+
+def activities_type(tag: ActivityTag, activity_type: ActivityType) -> Type[Activities]:
+    """
+    Get the typed activities model of an activity tag and type, e.g. ``SocialPostActivities`` for social posts.
+
+    :param tag: The tag of the activities.
+    :param activity_type: The type of the activities.
+    :return: The typed model, or the untyped ``Activities`` for unknown combinations.
+    """
+    metadata = metadata_type(tag, activity_type)
+    return Activities[metadata] if metadata is not None else Activities
+
+
+def split_by_type(payload: dict, activity_types: Iterable[ActivityKind]) -> Dict[ActivityKind, dict]:
+    """
+    Split a raw activities payload into one payload per activity tag and type.
+
+    Every requested pair gets a payload, empty if no activity matched, and each payload keeps the ``meta`` of the
+    whole response. Activities of pairs that were not requested are dropped.
+
+    :param payload: The decoded JSON payload of an activities response.
+    :param activity_types: The ``(tag, type)`` pairs to keep.
+    :return: A dictionary mapping each pair to its payload.
+    """
+    groups: Dict[Tuple[str, str], List[dict]] = {}
+    kinds: Dict[ActivityKind, List[dict]] = {}
+    for tag, activity_type in activity_types:
+        kinds[(tag, activity_type)] = groups.setdefault((tag.value, activity_type.value), [])
+    for activity in payload.get("data") or ():
+        group = groups.get((activity.get("tag"), activity.get("type")))
+        if group is not None:
+            group.append(activity)
+    meta = payload.get("meta")
+    return {kind: {"data": data, "meta": meta} for kind, data in kinds.items()}
@@ -0,0 +1,211 @@
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, FrozenSet, Iterable, NamedTuple, Optional
+
+
+class Watermark(NamedTuple):
+    """
+    The high-water mark of a synced feed: the newest timestamp seen and the ids of the activities at it.
+
+    A sync that stopped before reaching the watermark, because of its page limit, keeps the watermark and records
+    the ``cursor`` of the next page and the ``newest`` mark seen so far, to which the watermark advances once a later
+    sync walked the rest of the new activities.
+    """
+
+    timestamp: int
+    ids: FrozenSet[str] = frozenset()
+    cursor: Optional[str] = None
+    newest: Optional["Watermark"] = None
+
+    def advance(self, activities: Iterable[tuple]) -> "Watermark":
+        """
+        Move the watermark past newly seen activities.
+
+        :param activities: ``(timestamp, id)`` pairs of the new activities.
+        :return: The advanced watermark, or this one if no activity is newer.
+        """
+        timestamp, ids = self.timestamp, set(self.ids)
+        for activity_timestamp, activity_id in activities:
+            if activity_timestamp > timestamp:
+                timestamp, ids = activity_timestamp, {activity_id}
+            elif activity_timestamp == timestamp:
+                ids.add(activity_id)
+        return Watermark(timestamp, frozenset(ids))
+
+    def to_dict(self) -> dict:
+        data = {"timestamp": self.timestamp, "ids": sorted(self.ids)}
+        if self.cursor is not None:
+            data["cursor"] = self.cursor
+            data["newest"] = self.newest.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Watermark":
+        newest = data.get("newest")
+        return cls(data["timestamp"], frozenset(data["ids"]), data.get("cursor"),
+                   cls.from_dict(newest) if newest else None)
+
+
+class Checkpoint(NamedTuple):
+    """
+    The progress of a resumable crawl: the cursor of the next page, the ids of the last committed page and whether
+    the crawl reached the end of its feed. A crawl stopped in the middle of a page keeps the cursor of that page and
+    adds the ids it already yielded.
+    """
+
+    cursor: Optional[str] = None
+    ids: FrozenSet[str] = frozenset()
+    done: bool = False
+
+    def to_dict(self) -> dict:
+        return {"cursor": self.cursor, "ids": sorted(self.ids), "done": self.done}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Checkpoint":
+        return cls(data["cursor"], frozenset(data["ids"]), data["done"])
+
+
+class BaseStateStore:
+    """
+    The interface of the stores that keep the watermarks of :meth:`rss3_dsl_sdk.client.RSS3Client.sync_activities`
+    and the checkpoints of :meth:`rss3_dsl_sdk.client.RSS3Client.resume_activities`.
+
+    States are JSON-compatible dictionaries. Subclasses implement :meth:`get`, :meth:`set` and :meth:`delete`.
+    """
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Get the state of a feed.
+
+        :param key: The feed key.
+        :return: The state, or ``None`` if none was stored.
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, state: dict):
+        """
+        Store the state of a feed.
+
+        :param key: The feed key.
+        :param state: The new state.
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        """
+        Forget the state of a feed, so its next sync or crawl starts over.
+
+        :param key: The feed key.
+        """
+        raise NotImplementedError
+
+
+class MemoryStateStore(BaseStateStore):
+    """
+    A state store that lives as long as the process.
+    """
+
+    def __init__(self):
+        self._states: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            return self._states.get(key)
+
+    def set(self, key: str, state: dict):
+        with self._lock:
+            self._states[key] = state
+
+    def delete(self, key: str):
+        with self._lock:
+            self._states.pop(key, None)
+
+
+class FileStateStore(BaseStateStore):
+    """
+    A state store kept in a JSON file, which is rewritten atomically on every change.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open or create the state file.
+
+        :param path: The path of the JSON file.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._states: Dict[str, dict] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                self._states = json.load(file)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            return self._states.get(key)
+
+    def set(self, key: str, state: dict):
+        with self._lock:
+            self._states[key] = state
+            self._write()
+
+    def delete(self, key: str):
+        with self._lock:
+            if self._states.pop(key, None) is not None:
+                self._write()
+
+    def _write(self):
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(self._states, file, sort_keys=True)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.path)
+
+
+class SQLiteStateStore(BaseStateStore):
+    """
+    A state store kept in a SQLite database, which can be shared by several processes.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open or create the state database.
+
+        :param path: The path of the SQLite database file.
+        """
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS states (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM states").fetchone()[0]
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM states WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, state: dict):
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO states VALUES (?, ?)", (key, json.dumps(state)))
+
+    def delete(self, key: str):
+        with self._lock:
+            self._connection.execute("DELETE FROM states WHERE key = ?", (key,))
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        self._connection.close()
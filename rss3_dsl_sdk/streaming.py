@@ -0,0 +1,246 @@
+import json
+import re
+import time
+import typing
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Type
+
+from pydantic import BaseModel
+
+from rss3_dsl_sdk.metrics import RequestMetrics
+from rss3_dsl_sdk.views import LazyModel, ResultMode, get_field
+
+_STRUCTURAL = re.compile(rb'[\[\]{}",]')
+_STRING = re.compile(rb'["\\]')
+
+_SEEKING, _ITEMS, _DONE = range(3)
+
+
+class ArraySplitter:
+    """
+    Splits the items of an array member of a JSON object out of the object's bytes as they arrive in chunks.
+
+    Only the structure is scanned, a regular expression jumping from one bracket, brace, comma or quote to the next,
+    so strings such as hex call data are skipped at C speed. Each complete item is returned as its raw bytes, to be
+    parsed on its own, and only the bytes of the item being received are buffered. The rest of the object, with an
+    empty array, is returned by :meth:`close`.
+    """
+
+    def __init__(self, key: str = "data"):
+        """
+        Initialize the splitter.
+
+        :param key: The key of the array member of the top-level object.
+        """
+        self.key = json.dumps(key).encode()
+        self._buffer = bytearray()
+        self._rest = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._last_string: Optional[bytes] = None
+        self._last_string_end = 0
+        self._item_start = 0
+        self._state = _SEEKING
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """
+        Add the next chunk of the object.
+
+        :param chunk: The chunk.
+        :return: The raw bytes of the items completed by the chunk.
+        """
+        if self._state == _DONE:
+            self._rest += chunk
+            return []
+        buffer = self._buffer
+        buffer += chunk
+        items = []
+        pos = self._pos
+        while True:
+            if self._in_string:
+                match = _STRING.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                if buffer[match.start()] == 0x5C:  # backslash
+                    if match.end() >= len(buffer):
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                if self._state == _SEEKING and self._depth == 1:
+                    self._last_string = bytes(buffer[self._string_start:pos])
+                    self._last_string_end = pos
+                continue
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            start, pos = match.start(), match.end()
+            char = buffer[start]
+            if char == 0x22:  # quote
+                self._in_string = True
+                self._string_start = start
+            elif char == 0x5B or char == 0x7B:  # opening bracket or brace
+                if self._state == _SEEKING and self._depth == 1 and char == 0x5B and self.__is_member(start):
+                    self._state = _ITEMS
+                    self._rest += buffer[:pos]
+                    del buffer[:pos]
+                    pos = self._item_start = 0
+                self._depth += 1
+            elif char == 0x5D or char == 0x7D:  # closing bracket or brace
+                self._depth -= 1
+                if self._state == _ITEMS and self._depth == 1:
+                    self.__take_item(items, start)
+                    self._state = _DONE
+                    self._rest += buffer[start:]
+                    buffer.clear()
+                    return items
+            elif self._state == _ITEMS and self._depth == 2:  # comma between items
+                self.__take_item(items, start)
+                self._item_start = pos
+        if self._state == _ITEMS and self._item_start:
+            del buffer[:self._item_start]
+            pos -= self._item_start
+            self._item_start = 0
+        self._pos = pos
+        return items
+
+    def close(self) -> bytes:
+        """
+        Finish the object.
+
+        :return: The bytes of the object with an empty array, or of the whole object if it has no such array.
+        :raises ValueError: If the object ended inside the array.
+        """
+        if self._state == _ITEMS:
+            raise ValueError("the JSON document ended inside the streamed array")
+        if self._state == _SEEKING:
+            return bytes(self._buffer)
+        return bytes(self._rest)
+
+    def __is_member(self, bracket: int) -> bool:
+        return self._last_string == self.key and \
+            self._buffer[self._last_string_end:bracket].strip() == b":"
+
+    def __take_item(self, items: List[bytes], end: int):
+        item = bytes(self._buffer[self._item_start:end]).strip()
+        if item:
+            items.append(item)
+
+
+class ActivityStream:
+    """
+    The activities of one page, parsed and validated one by one while the response body is still being received.
+
+    Iterate over it once to get the activities. Once it is exhausted, :attr:`meta` and :attr:`cursor` hold the
+    pagination metadata of the page, which the node sends after the activities. Close it to stop reading early.
+    """
+
+    def __init__(
+            self,
+            chunks: Iterable[bytes],
+            model: Type[BaseModel],
+            result_mode: ResultMode = ResultMode.MODEL,
+            metrics: Optional[RequestMetrics] = None,
+            on_close: Optional[Callable[[RequestMetrics], None]] = None
+    ):
+        """
+        Wrap the body of a response.
+
+        :param chunks: The chunks of the decompressed response body.
+        :param model: The model of the page, whose ``data`` field is a list of activities.
+        :param result_mode: How the activities and the metadata are returned.
+        :param metrics: Optional metrics of the request, completed with the body size, counts and parsing times.
+        :param on_close: A function called with the metrics once the stream is exhausted or closed.
+        """
+        self.model = model
+        self.result_mode = ResultMode(result_mode)
+        self.meta: Any = None
+        self.cursor: Optional[str] = None
+        self.count = 0
+        self.metrics = metrics
+        self._chunks = chunks
+        self._item_model = _item_model(model)
+        self._on_close = on_close
+        self._iterator: Optional[Iterator[Any]] = None
+        self._closed = False
+        self._start = time.perf_counter()
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._iterator is None:
+            self._iterator = self.__activities()
+        return self._iterator
+
+    def __activities(self) -> Iterator[Any]:
+        splitter = ArraySplitter()
+        decode = self.__decoder()
+        metrics = self.metrics
+        try:
+            for chunk in self._chunks:
+                if metrics is not None:
+                    metrics.response_bytes += len(chunk)
+                    start = time.perf_counter()
+                    items = splitter.feed(chunk)
+                    metrics.decode = (metrics.decode or 0.0) + time.perf_counter() - start
+                else:
+                    items = splitter.feed(chunk)
+                for item in items:
+                    if metrics is not None:
+                        start = time.perf_counter()
+                        activity = decode(item)
+                        metrics.validate = (metrics.validate or 0.0) + time.perf_counter() - start
+                        metrics.actions += len(get_field(activity, "actions") or ())
+                    else:
+                        activity = decode(item)
+                    self.count += 1
+                    yield activity
+            self.meta = get_field(self.__decode_page(splitter.close()), "meta")
+            self.cursor = get_field(self.meta, "cursor") if self.meta else None
+        except Exception as error:
+            if metrics is not None:
+                metrics.error = error
+            raise
+        finally:
+            self.close()
+
+    def __decoder(self) -> Callable[[bytes], Any]:
+        if self.result_mode is ResultMode.MODEL:
+            return self._item_model.model_validate_json
+        if self.result_mode is ResultMode.LAZY:
+            return lambda item: LazyModel(self._item_model, json.loads(item))
+        return json.loads
+
+    def __decode_page(self, content: bytes) -> Any:
+        if self.result_mode is ResultMode.MODEL:
+            return self.model.model_validate_json(content)
+        payload = json.loads(content)
+        return LazyModel(self.model, payload) if self.result_mode is ResultMode.LAZY else payload
+
+    def close(self):
+        """
+        Stop reading the response and release its connection.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if hasattr(self._chunks, "close"):
+            self._chunks.close()
+        if self.metrics is not None:
+            self.metrics.activities = self.count
+            self.metrics.total = (self.metrics.total or 0.0) + time.perf_counter() - self._start
+            if self._on_close is not None:
+                self._on_close(self.metrics)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _item_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    return typing.get_args(model.model_fields["data"].annotation)[0]
@@ -0,0 +1,791 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.request import ACCEPT_ENCODING
+
+from rss3_dsl_sdk.balancer import Endpoint, EndpointPool
+from rss3_dsl_sdk.cache import cache_key
+from rss3_dsl_sdk.exceptions import APIError
+from rss3_dsl_sdk.hedge import HedgePolicy, Hedger
+from rss3_dsl_sdk.metrics import RequestMetrics, Timings
+from rss3_dsl_sdk.retry import THROTTLE_STATUSES, AIMDLimiter, AsyncAIMDLimiter, RetryPolicy, TokenBucket
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx is an optional dependency
+    httpx = None
+
+Timeout = Union[float, Tuple[float, float]]
+
+DEFAULT_RETRY = RetryPolicy()
+
+_IDENTITY = {"Accept-Encoding": "identity"}
+
+
+class BaseTransport:
+    """
+    The interface through which :class:`rss3_dsl_sdk.client.RSS3Client` sends every request.
+
+    Subclasses implement :meth:`send`, a single HTTP GET, and list the exceptions of failed connections in
+    ``retryable_errors``. :meth:`get` wraps it with the behavior shared by all transports: failed requests are
+    retried with jittered exponential backoff, requests can be rate limited with a token bucket, the number of
+    requests in flight adapts to throttling by the node, slow requests can be hedged and requests can be balanced
+    across several nodes. Error responses that are not retried, or still fail after the last retry, raise
+    :class:`~rss3_dsl_sdk.exceptions.APIError`.
+    """
+
+    retryable_errors: Tuple[Type[BaseException], ...] = ()
+
+    def __init__(
+            self,
+            max_concurrency: int = 10,
+            retry: Optional[RetryPolicy] = DEFAULT_RETRY,
+            rate_limit: Optional[TokenBucket] = None,
+            adaptive_concurrency: bool = True,
+            hedge: Optional[HedgePolicy] = None,
+            endpoints: Optional[EndpointPool] = None
+    ):
+        """
+        Initialize the shared request policies.
+
+        :param max_concurrency: The number of requests the transport serves at once, which bounds the adaptive
+            concurrency and sizes the pool of hedged requests.
+        :param retry: The retry policy, or ``None`` to never retry.
+        :param rate_limit: An optional token bucket shared by all requests.
+        :param adaptive_concurrency: Whether to adapt the number of requests in flight, up to ``max_concurrency``,
+            to throttling by the node. The limit is shared by all the nodes the transport sends to.
+        :param hedge: An optional policy for sending a duplicate of slow requests. Hedged requests are sent from a
+            pool of worker threads; a losing request is cancelled if it has not started and otherwise discarded.
+        :param endpoints: An optional pool of DSL nodes. Requested URLs are then paths, such as
+            ``/decentralized/{account}``, that each attempt resolves against the node chosen by the pool, so retries
+            fail over to healthy nodes.
+        """
+        self.pool_maxsize = max_concurrency
+        self.retry = retry
+        self.rate_limit = rate_limit
+        self.limiter = AIMDLimiter(max_concurrency) if adaptive_concurrency else None
+        self.hedger = Hedger(hedge) if hedge is not None else None
+        self.endpoints = endpoints
+        self._hedge_executor = ThreadPoolExecutor(max_workers=2 * max_concurrency, thread_name_prefix="rss3-hedge") \
+            if hedge is not None else None
+
+    def send(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+             timings: Optional[Timings] = None, stream: bool = False) -> Any:
+        """
+        Send a single GET request.
+
+        :param url: The URL to request.
+        :param params: The query parameters of the request.
+        :param headers: Additional headers of the request.
+        :param timings: If given, the transfer phases the transport can measure are stored in it.
+        :param stream: Whether to return once the headers are received and leave the body to
+            :meth:`iter_content`. The body of error responses is always read.
+        :return: The HTTP response, with ``status_code``, ``headers``, ``content``, ``text`` and ``url`` attributes.
+        """
+        raise NotImplementedError
+
+    def iter_content(self, response: Any, chunk_size: int = 65536) -> "Chunks":
+        """
+        Read the decompressed body of a streamed response chunk by chunk.
+
+        :param response: A response returned by :meth:`get` with ``stream`` set.
+        :param chunk_size: The number of bytes to read at a time.
+        :return: An iterable over the chunks, which must be closed to release the connection.
+        """
+        content = response.content
+        return Chunks((content[start:start + chunk_size] for start in range(0, len(content), chunk_size)),
+                      response.close if hasattr(response, "close") else None)
+
+    def wire_bytes(self, response: Any) -> int:
+        """
+        Get the number of body bytes of a response as transferred, before decompression.
+
+        :param response: A response returned by :meth:`send`.
+        :return: The number of bytes.
+        """
+        return len(response.content)
+
+    def get(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+            metrics: Optional[RequestMetrics] = None, stream: bool = False) -> Any:
+        """
+        Send a GET request, with retries, rate limiting, adaptive concurrency, hedging and balancing.
+
+        :param url: The URL to request.
+        :param params: The query parameters of the request.
+        :param headers: Additional headers of the request.
+        :param metrics: If given, the status, sizes, transfer phases and number of retries of the request are
+            stored in it. The phases are those of the response that was returned.
+        :param stream: Whether to return once the headers of a successful response are received, leaving its body
+            to :meth:`iter_content`. Streamed requests are never hedged.
+        :return: The HTTP response.
+        :raises APIError: If the node answered with an error status.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limit is not None:
+                self.rate_limit.acquire()
+            if self.limiter is not None:
+                self.limiter.acquire()
+            if metrics is not None:
+                metrics.retries = attempt
+            try:
+                response, timings = self.__send(url, params, headers, metrics is not None, stream)
+            except self.retryable_errors:
+                if self.retry is None or attempt >= self.retry.max_retries:
+                    raise
+                delay = self.retry.delay(attempt)
+            else:
+                if self.limiter is not None:
+                    _record(self.limiter, response.status_code)
+                if metrics is not None:
+                    _record_metrics(metrics, response, timings, None if stream else self.wire_bytes(response))
+                if response.status_code < 400:
+                    return response
+                if not _should_retry(self.retry, response.status_code, attempt):
+                    raise APIError.from_response(response)
+                delay = self.retry.delay(attempt, response.headers.get("Retry-After"))
+            finally:
+                if self.limiter is not None:
+                    self.limiter.release()
+            attempt += 1
+            time.sleep(delay)
+
+    def __send(self, url: str, params: Optional[dict], headers: Optional[dict], timed: bool,
+               stream: bool) -> Tuple[Any, Optional[Timings]]:
+        if self.hedger is None or stream:
+            return self.__request(url, params, headers, timed, stream)
+        delay = self.hedger.delay()
+        primary = self._hedge_executor.submit(self.__request, url, params, headers, timed, False)
+        if delay is None:
+            return primary.result()
+        done, _ = wait([primary], timeout=delay)
+        if done or not self.hedger.try_hedge():
+            return primary.result()
+        hedge = self._hedge_executor.submit(self.__request, url, params, headers, timed, False)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    if future is hedge:
+                        self.hedger.won()
+                    return future.result()
+        return primary.result()
+
+    def __request(self, url: str, params: Optional[dict], headers: Optional[dict], timed: bool,
+                  stream: bool) -> Tuple[Any, Optional[Timings]]:
+        timings = Timings() if timed else None
+        if self.endpoints is None and self.hedger is None:
+            return self.send(url, params=params, headers=headers, timings=timings, stream=stream), timings
+        endpoint = self.endpoints.choose() if self.endpoints is not None else None
+        start = time.perf_counter()
+        try:
+            response = self.send(endpoint.url + url if endpoint else url, params=params, headers=headers,
+                                 timings=timings, stream=stream)
+            latency = time.perf_counter() - start
+            if endpoint is not None:
+                _record_endpoint(self.endpoints, endpoint, response.status_code, latency)
+        except Exception:
+            if endpoint is not None:
+                self.endpoints.record_failure(endpoint)
+            raise
+        finally:
+            if endpoint is not None:
+                self.endpoints.release(endpoint)
+        if self.hedger is not None:
+            self.hedger.record(latency)
+        return response, timings
+
+    def close(self):
+        """
+        Release the resources of the transport.
+        """
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class PooledTransport(BaseTransport):
+    """
+    A keep-alive HTTP/1.1 transport backed by a pooled :class:`requests.Session`.
+
+    Connections are kept open between requests and reused, so consecutive calls to the same DSL node skip the
+    TCP and TLS handshakes.
+    """
+
+    retryable_errors = (requests.ConnectionError, requests.Timeout)
+
+    def __init__(
+            self,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            pool_block: bool = False,
+            keep_alive: bool = True,
+            timeout: Optional[Timeout] = None,
+            retry: Optional[RetryPolicy] = DEFAULT_RETRY,
+            rate_limit: Optional[TokenBucket] = None,
+            adaptive_concurrency: bool = True,
+            hedge: Optional[HedgePolicy] = None,
+            endpoints: Optional[EndpointPool] = None,
+            compression: bool = True
+    ):
+        """
+        Initialize the transport and its connection pool.
+
+        :param pool_connections: The number of per-host connection pools to keep.
+        :param pool_maxsize: The maximum number of connections kept open per host.
+        :param pool_block: Whether to block when all connections to a host are in use, instead of opening extra
+            connections that are discarded after use. With ``adaptive_concurrency`` the requests in flight never
+            exceed ``pool_maxsize`` in total, hedged duplicates aside, so this only matters when it is disabled.
+        :param keep_alive: Whether to keep connections open between requests.
+        :param timeout: The request timeout in seconds, either a single value or a ``(connect, read)`` tuple.
+        :param retry: The retry policy, or ``None`` to never retry.
+        :param rate_limit: An optional token bucket shared by all requests.
+        :param adaptive_concurrency: Whether to adapt the number of requests in flight to throttling by the node.
+            The limit starts at ``pool_maxsize`` and never exceeds it, and it counts the requests to all hosts and
+            nodes together, so with several nodes ``pool_maxsize`` caps the concurrency of the whole transport
+            rather than of each node. Disable it to allow ``pool_maxsize`` connections per host.
+        :param hedge: An optional policy for sending a duplicate of slow requests.
+        :param endpoints: An optional pool of DSL nodes to balance requests across.
+        :param compression: Whether to ask for compressed responses, with every encoding urllib3 can decode:
+            gzip and deflate, plus Brotli and Zstandard when the ``compression`` extra is installed. Bodies are
+            decompressed chunk by chunk as they are read.
+        """
+        super().__init__(max_concurrency=pool_maxsize, retry=retry, rate_limit=rate_limit,
+                         adaptive_concurrency=adaptive_concurrency, hedge=hedge, endpoints=endpoints)
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING if compression else "identity"
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def send(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+             timings: Optional[Timings] = None, stream: bool = False) -> requests.Response:
+        """
+        Send a GET request over a pooled connection.
+
+        :param url: The URL to request.
+        :param params: The query parameters of the request.
+        :param headers: Additional headers of the request.
+        :param timings: If given, the time to the response headers, including any connection setup, and the time
+            to read the body are stored in it.
+        :param stream: Whether to leave the body of a successful response unread.
+        :return: The HTTP response.
+        """
+        if timings is None and not stream:
+            return self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        start = time.perf_counter()
+        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout, stream=True)
+        headers_received = time.perf_counter()
+        if not stream or response.status_code >= 400:
+            response.content  # reads and caches the body
+        if timings is not None:
+            timings.ttfb = headers_received - start
+            if not stream:
+                timings.download = time.perf_counter() - headers_received
+        return response
+
+    def iter_content(self, response: requests.Response, chunk_size: int = 65536) -> "Chunks":
+        return Chunks(response.iter_content(chunk_size), response.close)
+
+    def wire_bytes(self, response: requests.Response) -> int:
+        return response.raw.tell() if response.raw is not None else len(response.content)
+
+    def close(self):
+        """
+        Close all pooled connections.
+        """
+        super().close()
+        self.session.close()
+
+
+class HTTP2Transport(BaseTransport):
+    """
+    An HTTP/2 transport backed by a pooled :class:`httpx.Client`, which multiplexes concurrent requests to a node
+    over a single connection.
+
+    Nodes that do not negotiate HTTP/2 are spoken to over HTTP/1.1. Requires the ``http2`` extra
+    (``pip install rss3-dsl-sdk[http2]``).
+    """
+
+    retryable_errors = (httpx.TransportError,) if httpx is not None else ()
+
+    def __init__(
+            self,
+            max_connections: int = 10,
+            max_keepalive_connections: int = 10,
+            keepalive_expiry: Optional[float] = 5.0,
+            max_concurrency: int = 100,
+            timeout: Optional[Timeout] = None,
+            retry: Optional[RetryPolicy] = DEFAULT_RETRY,
+            rate_limit: Optional[TokenBucket] = None,
+            adaptive_concurrency: bool = True,
+            hedge: Optional[HedgePolicy] = None,
+            endpoints: Optional[EndpointPool] = None,
+            compression: bool = True
+    ):
+        """
+        Initialize the transport and its connection pool.
+
+        :param max_connections: The maximum number of connections across all hosts.
+        :param max_keepalive_connections: The maximum number of idle connections kept open.
+        :param keepalive_expiry: The number of seconds an idle connection is kept open.
+        :param max_concurrency: The number of requests served at once. With HTTP/2 it may exceed
+            ``max_connections``, since each connection carries many streams.
+        :param timeout: The request timeout in seconds, either a single value or a ``(connect, read)`` tuple.
+        :param retry: The retry policy, or ``None`` to never retry.
+        :param rate_limit: An optional token bucket shared by all requests.
+        :param adaptive_concurrency: Whether to adapt the number of requests in flight, up to ``max_concurrency``,
+            to throttling by the node.
+        :param hedge: An optional policy for sending a duplicate of slow requests.
+        :param endpoints: An optional pool of DSL nodes to balance requests across.
+        :param compression: Whether to ask for compressed responses, with every encoding httpx can decode.
+        """
+        if httpx is None:
+            raise ImportError("HTTP2Transport requires httpx and h2, "
+                              "install them with `pip install rss3-dsl-sdk[http2]`")
+        super().__init__(max_concurrency=max_concurrency, retry=retry, rate_limit=rate_limit,
+                         adaptive_concurrency=adaptive_concurrency, hedge=hedge, endpoints=endpoints)
+        limits = httpx.Limits(max_connections=max_connections,
+                              max_keepalive_connections=max_keepalive_connections,
+                              keepalive_expiry=keepalive_expiry)
+        self.client = httpx.Client(http2=True, limits=limits, timeout=_httpx_timeout(timeout),
+                                   headers=None if compression else _IDENTITY)
+
+    def send(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+             timings: Optional[Timings] = None, stream: bool = False) -> "httpx.Response":
+        """
+        Send a GET request over a pooled, multiplexed connection.
+
+        :param url: The URL to request.
+        :param params: The query parameters of the request.
+        :param headers: Additional headers of the request.
+        :param timings: If given, the time to open a new connection, the time to the response headers and the time
+            to read the body are stored in it.
+        :param stream: Whether to leave the body of a successful response unread.
+        :return: The HTTP response.
+        """
+        if timings is None and not stream:
+            return self.client.get(url, params=params, headers=headers)
+        trace = _ConnectTrace() if timings is not None else None
+        request = self.client.build_request("GET", url, params=params, headers=headers,
+                                            extensions={"trace": trace} if trace is not None else None)
+        start = time.perf_counter()
+        response = self.client.send(request, stream=True)
+        headers_received = time.perf_counter()
+        if not stream or response.status_code >= 400:
+            try:
+                response.read()
+            finally:
+                response.close()
+        if timings is not None:
+            timings.connect = trace.duration
+            timings.ttfb = headers_received - start - (trace.duration or 0.0)
+            if not stream:
+                timings.download = time.perf_counter() - headers_received
+        return response
+
+    def iter_content(self, response: "httpx.Response", chunk_size: int = 65536) -> "Chunks":
+        return Chunks(response.iter_bytes(chunk_size), response.close)
+
+    def wire_bytes(self, response: "httpx.Response") -> int:
+        return response.num_bytes_downloaded
+
+    def close(self):
+        """
+        Close all pooled connections.
+        """
+        super().close()
+        self.client.close()
+
+
+class Chunks:
+    """
+    The chunks of a streamed response body, with a :meth:`close` method that releases the connection.
+    """
+
+    __slots__ = ("_chunks", "_close")
+
+    def __init__(self, chunks: Iterator[bytes], close: Optional[Callable[[], None]] = None):
+        self._chunks = chunks
+        self._close = close
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._chunks
+
+    def close(self):
+        """
+        Stop reading the body and release the connection.
+        """
+        if self._close is not None:
+            self._close()
+
+
+class _ConnectTrace:
+    """
+    An httpx trace callback measuring the time spent opening a new connection, including TLS.
+    """
+
+    __slots__ = ("started", "duration")
+
+    def __init__(self):
+        self.started: Optional[float] = None
+        self.duration: Optional[float] = None
+
+    def __call__(self, event: str, info: dict):
+        if event == "connection.connect_tcp.started":
+            self.started = time.perf_counter()
+        elif self.started is not None and event in ("connection.connect_tcp.complete",
+                                                    "connection.start_tls.complete"):
+            self.duration = time.perf_counter() - self.started
+
+
+class ReplayResponse:
+    """
+    A response served by :class:`ReplayTransport`.
+    """
+
+    __slots__ = ("status_code", "headers", "content", "url")
+
+    def __init__(self, status_code: int, headers: Optional[dict], content: bytes, url: str = ""):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.content = content
+        self.url = url
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+
+class ReplayTransport(BaseTransport):
+    """
+    An in-process transport that serves recorded responses without any network access, for tests and benchmarks.
+
+    Responses are matched on the URL path and the query parameters, so recordings replay against any base URL.
+    Requests without a recording are answered by ``fallback`` if given, and with a 404 otherwise. Retries are
+    disabled unless a policy is passed.
+    """
+
+    def __init__(
+            self,
+            recordings: Optional[List[dict]] = None,
+            fallback: Optional[Callable[[str, Optional[dict]], Tuple[int, dict, bytes]]] = None,
+            retry: Optional[RetryPolicy] = None,
+            max_concurrency: int = 10
+    ):
+        """
+        Initialize the transport.
+
+        :param recordings: Recorded exchanges, as saved by :meth:`RecordingTransport.save`.
+        :param fallback: An optional function answering unrecorded requests from their URL path and parameters with
+            a ``(status, headers, body)`` tuple.
+        :param retry: The retry policy, or ``None`` to never retry.
+        :param max_concurrency: The number of requests served at once.
+        """
+        super().__init__(max_concurrency=max_concurrency, retry=retry, adaptive_concurrency=False)
+        self.fallback = fallback
+        self.requests = 0
+        self._responses: Dict[str, Tuple[int, dict, bytes]] = {}
+        self._lock = threading.Lock()
+        for recording in recordings or ():
+            self.add(recording["url"], recording["body"].encode(), params=recording.get("params"),
+                     status=recording.get("status", 200), headers=recording.get("headers"))
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "ReplayTransport":
+        """
+        Create a transport serving the exchanges saved in a file by :meth:`RecordingTransport.save`.
+
+        :param path: The path of the recordings file.
+        :return: The transport.
+        """
+        with open(path, encoding="utf-8") as file:
+            return cls(json.load(file), **kwargs)
+
+    def add(self, url: str, body: bytes, params: Optional[dict] = None, status: int = 200,
+            headers: Optional[dict] = None):
+        """
+        Record a response.
+
+        :param url: The URL, or only the path, of the request.
+        :param body: The response body.
+        :param params: The query parameters of the request.
+        :param status: The HTTP status of the response.
+        :param headers: The headers of the response.
+        """
+        headers = dict(headers or {}, **{"Content-Type": "application/json"})
+        self._responses[_replay_key(url, params)] = (status, headers, body)
+
+    def send(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+             timings: Optional[Timings] = None, stream: bool = False) -> ReplayResponse:
+        """
+        Serve the recorded response of a request.
+
+        :param url: The URL to request.
+        :param params: The query parameters of the request.
+        :param headers: Additional headers of the request, which are ignored.
+        :param timings: If given, zero transfer phases are stored in it.
+        :param stream: Ignored, recorded responses are served from memory.
+        :return: The recorded response.
+        """
+        if timings is not None:
+            timings.ttfb = timings.download = 0.0
+        with self._lock:
+            self.requests += 1
+        recorded = self._responses.get(_replay_key(url, params))
+        if recorded is None:
+            recorded = self.fallback(urlsplit(url).path, params) if self.fallback is not None \
+                else (404, {}, b'{"error":"no recorded response"}')
+        status, response_headers, body = recorded
+        return ReplayResponse(status, response_headers, body, url=url)
+
+
+class RecordingTransport(BaseTransport):
+    """
+    A transport that forwards requests to another one and records the exchanges for :class:`ReplayTransport`.
+    """
+
+    def __init__(self, transport: BaseTransport):
+        """
+        Wrap a transport.
+
+        :param transport: The transport that sends the requests, with its own retries and policies.
+        """
+        super().__init__(max_concurrency=transport.pool_maxsize, retry=None, adaptive_concurrency=False)
+        self.transport = transport
+        self.recordings: List[dict] = []
+        self._lock = threading.Lock()
+
+    def send(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+             timings: Optional[Timings] = None, stream: bool = False) -> Any:
+        metrics = RequestMetrics(url, params) if timings is not None else None
+        response = self.transport.get(url, params=params, headers=headers, metrics=metrics)
+        if metrics is not None:
+            timings.connect, timings.ttfb, timings.download = metrics.connect, metrics.ttfb, metrics.download
+        with self._lock:
+            self.recordings.append({"url": urlsplit(url).path, "params": params, "status": response.status_code,
+                                    "headers": _decoded_headers(response.headers), "body": response.text})
+        return response
+
+    def save(self, path: str):
+        """
+        Save the recorded exchanges to a JSON file.
+
+        :param path: The path of the recordings file.
+        """
+        with self._lock:
+            recordings = list(self.recordings)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(recordings, file)
+
+    def close(self):
+        super().close()
+        self.transport.close()
+
+
+class AsyncPooledTransport:
+    """
+    A keep-alive asyncio HTTP transport backed by a pooled :class:`httpx.AsyncClient`.
+
+    Retries, rate limiting and adaptive concurrency work like in :class:`PooledTransport`. Requires the ``async``
+    extra (``pip install rss3-dsl-sdk[async]``).
+    """
+
+    def __init__(
+            self,
+            max_connections: int = 100,
+            max_keepalive_connections: int = 20,
+            keepalive_expiry: Optional[float] = 5.0,
+            timeout: Optional[Timeout] = None,
+            retry: Optional[RetryPolicy] = DEFAULT_RETRY,
+            rate_limit: Optional[TokenBucket] = None,
+            adaptive_concurrency: bool = True,
+            hedge: Optional[HedgePolicy] = None,
+            endpoints: Optional[EndpointPool] = None,
+            compression: bool = True
+    ):
+        """
+        Initialize the transport and its connection pool.
+
+        :param max_connections: The maximum number of concurrent connections across all hosts.
+        :param max_keepalive_connections: The maximum number of idle connections kept open.
+        :param keepalive_expiry: The number of seconds an idle connection is kept open.
+        :param timeout: The request timeout in seconds, either a single value or a ``(connect, read)`` tuple.
+        :param retry: The retry policy, or ``None`` to never retry.
+        :param rate_limit: An optional token bucket shared by all requests.
+        :param adaptive_concurrency: Whether to adapt the number of requests in flight, up to ``max_connections``,
+            to throttling by the node. The limit is shared by all the nodes the transport sends to.
+        :param hedge: An optional policy for sending a duplicate of slow requests. The losing request is cancelled.
+        :param endpoints: An optional pool of DSL nodes. Requested URLs are then paths, resolved against the node
+            chosen by the pool for each attempt.
+        :param compression: Whether to ask for compressed responses, with every encoding httpx can decode.
+        """
+        if httpx is None:
+            raise ImportError("AsyncPooledTransport requires httpx, install it with `pip install rss3-dsl-sdk[async]`")
+        limits = httpx.Limits(max_connections=max_connections,
+                              max_keepalive_connections=max_keepalive_connections,
+                              keepalive_expiry=keepalive_expiry)
+        self.client = httpx.AsyncClient(limits=limits, timeout=_httpx_timeout(timeout),
+                                        headers=None if compression else _IDENTITY)
+        self.retry = retry
+        self.rate_limit = rate_limit
+        self.limiter = AsyncAIMDLimiter(max_connections) if adaptive_concurrency else None
+        self.hedger = Hedger(hedge) if hedge is not None else None
+        self.endpoints = endpoints
+
+    async def get(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None) -> "httpx.Response":
+        """
+        Send a GET request over a pooled connection.
+
+        :param url: The URL to request.
+        :param params: The query parameters of the request.
+        :param headers: Additional headers of the request.
+        :return: The HTTP response.
+        :raises APIError: If the node answered with an error status.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limit is not None:
+                await self.rate_limit.acquire_async()
+            if self.limiter is not None:
+                await self.limiter.acquire_async()
+            try:
+                response = await self.__send(url, params, headers)
+            except httpx.TransportError:
+                if self.retry is None or attempt >= self.retry.max_retries:
+                    raise
+                delay = self.retry.delay(attempt)
+            else:
+                if self.limiter is not None:
+                    _record(self.limiter, response.status_code)
+                if response.status_code < 400:
+                    return response
+                if not _should_retry(self.retry, response.status_code, attempt):
+                    raise APIError.from_response(response)
+                delay = self.retry.delay(attempt, response.headers.get("Retry-After"))
+            finally:
+                if self.limiter is not None:
+                    await self.limiter.release_async()
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def __send(self, url: str, params: Optional[dict], headers: Optional[dict]) -> "httpx.Response":
+        if self.hedger is None:
+            return await self.__request(url, params, headers)
+        delay = self.hedger.delay()
+        primary = asyncio.ensure_future(self.__request(url, params, headers))
+        if delay is None:
+            return await primary
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not self.hedger.try_hedge():
+            return await primary
+        hedge = asyncio.ensure_future(self.__request(url, params, headers))
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedger.won()
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def __request(self, url: str, params: Optional[dict], headers: Optional[dict]) -> "httpx.Response":
+        if self.endpoints is None and self.hedger is None:
+            return await self.client.get(url, params=params, headers=headers)
+        endpoint = self.endpoints.choose() if self.endpoints is not None else None
+        start = time.perf_counter()
+        try:
+            response = await self.client.get(endpoint.url + url if endpoint else url, params=params, headers=headers)
+            latency = time.perf_counter() - start
+            if endpoint is not None:
+                _record_endpoint(self.endpoints, endpoint, response.status_code, latency)
+        except Exception:
+            if endpoint is not None:
+                self.endpoints.record_failure(endpoint)
+            raise
+        finally:
+            if endpoint is not None:
+                self.endpoints.release(endpoint)
+        if self.hedger is not None:
+            self.hedger.record(latency)
+        return response
+
+    async def aclose(self):
+        """
+        Close all pooled connections.
+        """
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+
+def _record(limiter: AIMDLimiter, status_code: int):
+    if status_code in THROTTLE_STATUSES:
+        limiter.on_throttle()
+    else:
+        limiter.on_success()
+
+
+def _should_retry(retry: Optional[RetryPolicy], status_code: int, attempt: int) -> bool:
+    return retry is not None and status_code in retry.statuses and attempt < retry.max_retries
+
+
+def _record_endpoint(endpoints: EndpointPool, endpoint: Endpoint, status_code: int, latency: float):
+    if status_code >= 500 or status_code in THROTTLE_STATUSES:
+        endpoints.record_failure(endpoint)
+    else:
+        endpoints.record_success(endpoint, latency)
+
+
+def _record_metrics(metrics: RequestMetrics, response: Any, timings: Optional[Timings], wire_bytes: Optional[int]):
+    metrics.status_code = response.status_code
+    if wire_bytes is not None:
+        metrics.response_bytes = len(response.content)
+        metrics.wire_bytes = wire_bytes
+    metrics.content_encoding = response.headers.get("Content-Encoding")
+    if timings is not None:
+        metrics.connect, metrics.ttfb, metrics.download = timings.connect, timings.ttfb, timings.download
+
+
+def _decoded_headers(headers) -> dict:
+    return {name: value for name, value in headers.items()
+            if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")}
+
+
+def _httpx_timeout(timeout: Optional[Timeout]) -> "httpx.Timeout":
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def _replay_key(url: str, params: Optional[dict]) -> str:
+    return cache_key(urlsplit(url).path, params)
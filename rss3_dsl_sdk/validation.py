@@ -0,0 +1,78 @@
+import functools
+import inspect
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union, get_args, get_origin, get_type_hints
+
+from pydantic import validate_call
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+def fast_validate_call(func: F) -> F:
+    """
+    Validate the arguments of a function like :func:`pydantic.validate_call`, skipping validation when every
+    argument already has exactly its annotated type.
+
+    Pydantic does not revalidate model instances and passes exact ``str``, ``int`` and ``None`` values through
+    unchanged, so for such calls the result is the same as with ``validate_call``. Tight loops that reuse validated
+    ``ActivityFilter`` and ``PaginationOptions`` objects skip building and running the validator. Any other
+    argument, such as a dict or a ``bool`` given for an ``int``, goes through full validation.
+
+    :param func: The function to wrap.
+    :return: The wrapped function.
+    """
+    validated = validate_call(func)
+    parameters = list(inspect.signature(func).parameters.values())
+    hints = get_type_hints(func)
+    accepted: Dict[str, Optional[Tuple[type, ...]]] = {
+        parameter.name: _exact_types(hints.get(parameter.name, Any)) for parameter in parameters
+    }
+    if any(parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD) for parameter in parameters):
+        return validated
+    positional = [accepted[parameter.name] for parameter in parameters]
+
+    def arguments_are_valid(args: tuple, kwargs: dict) -> bool:
+        if len(args) > len(positional):
+            return False
+        for types, value in zip(positional, args):
+            if types is not None and type(value) not in types:
+                return False
+        for name, value in kwargs.items():
+            types = accepted.get(name, ())
+            if types is not None and type(value) not in types:
+                return False
+        return True
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if arguments_are_valid(args, kwargs):
+                return await func(*args, **kwargs)
+            return await validated(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if arguments_are_valid(args, kwargs):
+            return func(*args, **kwargs)
+        return validated(*args, **kwargs)
+
+    return wrapper
+
+
+def _exact_types(annotation: Any) -> Optional[Tuple[type, ...]]:
+    """
+    Get the types whose instances pass validation unchanged, or ``None`` if any value does.
+    """
+    if annotation is Any or annotation is inspect.Parameter.empty:
+        return None
+    if get_origin(annotation) is Union:
+        groups = [_exact_types(arg) for arg in get_args(annotation)]
+        if any(group is None for group in groups):
+            return None
+        return tuple(t for group in groups for t in group)
+    if annotation is None or annotation is type(None):
+        return type(None),
+    if isinstance(annotation, type) and get_origin(annotation) is None:
+        return annotation,
+    return ()
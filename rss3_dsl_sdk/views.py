@@ -0,0 +1,142 @@
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+
+class ResultMode(str, Enum):
+    """
+    How :class:`rss3_dsl_sdk.client.RSS3Client` returns responses: as fully validated pydantic models, as
+    :class:`LazyModel` views that validate each field on first access, or as the raw decoded JSON payload.
+    """
+
+    MODEL = 'model'
+    LAZY = 'lazy'
+    RAW = 'raw'
+
+
+_MISSING = object()
+
+
+class LazyModel:
+    """
+    A read-only view over a raw JSON payload shaped like a pydantic model.
+
+    Fields are looked up by their attribute names, like on the model, and validated only when first accessed.
+    Nested models are returned as views as well, so reading ``activity.id`` never touches ``activity.actions``.
+    The view's own members use the ``model_`` prefix that pydantic reserves, so they never shadow a field.
+    """
+
+    __slots__ = ("_model", "_raw", "_values")
+
+    def __init__(self, model: Type[BaseModel], raw: dict):
+        """
+        Wrap a raw payload.
+
+        :param model: The model the payload is shaped like.
+        :param raw: The decoded JSON payload.
+        """
+        self._model = model
+        self._raw = raw
+        self._values = {}
+
+    @property
+    def model_payload(self) -> dict:
+        """
+        The underlying JSON payload.
+        """
+        return self._raw
+
+    def model_build(self) -> BaseModel:
+        """
+        Validate the whole payload into its model.
+
+        :return: The model instance.
+        """
+        return self._model.model_validate(self._raw)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            # Private and special names are never fields, and the slots are unset while copying or unpickling.
+            raise AttributeError(f"'LazyModel' object has no attribute {name!r}")
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        key, convert = _field_reader(self._model, name)
+        raw_value = self._raw.get(key, _MISSING)
+        value = convert(raw_value)
+        self._values[name] = value
+        return value
+
+    def __reduce__(self):
+        return LazyModel, (self._model, self._raw)
+
+    def __repr__(self) -> str:
+        return f"LazyModel[{self._model.__name__}]({self._raw!r})"
+
+
+@lru_cache(maxsize=None)
+def _field_reader(model: Type[BaseModel], name: str) -> Tuple[str, Callable[[Any], Any]]:
+    field = model.model_fields.get(name)
+    if field is None:
+        raise AttributeError(f"{model.__name__!r} object has no attribute {name!r}")
+    wrap = _wrapper(field.annotation)
+
+    def convert(value: Any) -> Any:
+        if value is _MISSING:
+            if field.is_required():
+                raise AttributeError(f"{model.__name__}.{name} is missing from the payload")
+            return field.get_default(call_default_factory=True)
+        return None if value is None else wrap(value)
+
+    return field.alias or name, convert
+
+
+def _wrapper(annotation: Any) -> Callable[[Any], Any]:
+    model = _model_of(annotation)
+    if model is not None:
+        return lambda value: LazyModel(model, value) if isinstance(value, dict) else model.model_validate(value)
+    item_model = _list_item_model_of(annotation)
+    if item_model is not None:
+        wrap_item = _wrapper(item_model)
+        validate = TypeAdapter(annotation).validate_python
+        return lambda value: [wrap_item(item) for item in value] if isinstance(value, list) else validate(value)
+    return TypeAdapter(annotation).validate_python
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _model_of(annotation: Any) -> Optional[Type[BaseModel]]:
+    annotation = _unwrap_optional(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+def _list_item_model_of(annotation: Any) -> Optional[Type[BaseModel]]:
+    annotation = _unwrap_optional(annotation)
+    if get_origin(annotation) is list:
+        return _model_of(get_args(annotation)[0])
+    return None
+
+
+def get_field(result: Any, name: str) -> Any:
+    """
+    Read a field from a result in any :class:`ResultMode`.
+
+    :param result: A model, a :class:`LazyModel` or a raw payload.
+    :param name: The field name, which must equal its JSON key.
+    :return: The field value, or ``None`` if a raw payload lacks it.
+    """
+    if isinstance(result, dict):
+        return result.get(name)
+    return getattr(result, name)
+
@@ -0,0 +1,10 @@
+import pytest
+
+from tests.fakes import FakeDSLServer
+
+
+@pytest.fixture
+def dsl_server():
+    server = FakeDSLServer().start()
+    yield server
+    server.stop()
@@ -0,0 +1,121 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+Response = Tuple[int, dict, bytes]
+
+
+def make_activity(index: int = 0, tag: str = "social", activity_type: str = "post", timestamp: int = 1700000000,
+                  metadata: Optional[dict] = None) -> dict:
+    return {
+        "id": f"0x{index:064x}",
+        "owner": "0xd8da6bf26964af9d7eed9e03e53415d37aa96045",
+        "network": "ethereum",
+        "index": 0,
+        "from": "0xd8da6bf26964af9d7eed9e03e53415d37aa96045",
+        "to": "0x0000000000000000000000000000000000000000",
+        "tag": tag,
+        "type": activity_type,
+        "platform": "Farcaster",
+        "total_actions": 1,
+        "actions": [{
+            "tag": tag,
+            "type": activity_type,
+            "platform": "Farcaster",
+            "from": "0xd8da6bf26964af9d7eed9e03e53415d37aa96045",
+            "to": "0x0000000000000000000000000000000000000000",
+            "metadata": metadata if metadata is not None else {"body": f"post {index}"},
+        }],
+        "direction": "out",
+        "success": True,
+        "timestamp": timestamp,
+    }
+
+
+def make_page(activities: List[dict], cursor: Optional[str] = None) -> dict:
+    return {"data": activities, "meta": {"cursor": cursor} if cursor else None}
+
+
+def json_response(payload, status: int = 200, headers: Optional[dict] = None) -> Response:
+    return status, dict(headers or {}, **{"Content-Type": "application/json"}), json.dumps(payload).encode()
+
+
+def feed_responder(feed: List[dict]) -> Callable[[str, dict], Response]:
+    """
+    Serve ``feed``, newest first, honoring ``since_timestamp``, ``until_timestamp``, ``limit`` and an offset cursor.
+    """
+
+    def respond(path: str, query: dict) -> Response:
+        since = int(query.get("since_timestamp", ["0"])[0])
+        until = int(query.get("until_timestamp", [str(2 ** 63)])[0])
+        matching = [activity for activity in feed if since <= activity["timestamp"] <= until]
+        start = int(query.get("cursor", ["0"])[0])
+        end = start + int(query.get("limit", ["10"])[0])
+        return json_response(make_page(matching[start:end], cursor=str(end) if end < len(matching) else None))
+
+    return respond
+
+
+class FakeDSLServer:
+    """
+    A local HTTP/1.1 stand-in for a DSL node that records the requests and connections it receives.
+
+    Responders return the body as bytes, or as an iterable of chunks sent with chunked transfer encoding.
+    """
+
+    def __init__(self, respond: Optional[Callable[[str, dict], Response]] = None):
+        self.respond = respond or (lambda path, query: json_response(make_page([])))
+        self.requests: List[Tuple[str, dict]] = []
+        self.request_headers: List[dict] = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                query = parse_qs(parts.query)
+                with server._lock:
+                    server.requests.append((parts.path, query))
+                    server.request_headers.append(dict(self.headers))
+                status, headers, body = server.respond(parts.path, query)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if isinstance(body, bytes):
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                for chunk in body:
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                    self.wfile.flush()
+                self.wfile.write(b"0\r\n\r\n")
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,78 @@
+import json
+import tracemalloc
+
+import pytest
+
+from rss3_dsl_sdk.activity_store import ActivityStore
+from rss3_dsl_sdk.schemas.enums import ActivityTag, Network
+from rss3_dsl_sdk.schemas.registry import TypedActivities
+from rss3_dsl_sdk.views import LazyModel
+from tests.fakes import make_activity, make_page
+
+TRANSFER = {"address": "0x" + "ab" * 20, "value": "1000000000000000000", "name": "Tether", "symbol": "USDT",
+            "decimals": 6, "standard": "ERC-20"}
+
+
+def make_transfers(count: int) -> dict:
+    return make_page([make_activity(index, tag="transaction", activity_type="transfer", timestamp=1700000000 + index,
+                                    metadata=TRANSFER) for index in range(count)])
+
+
+@pytest.mark.parametrize("result_mode", ["model", "lazy", "raw"])
+def test_rows_read_columns_and_materialize_models(result_mode):
+    payload = make_transfers(3)
+    payload["data"][1]["fee"] = {"amount": "21000", "decimal": 18}
+    page = TypedActivities.model_validate(payload)
+    store = ActivityStore()
+    if result_mode == "model":
+        store.add_page(page)
+    elif result_mode == "lazy":
+        store.add_page(LazyModel(TypedActivities, json.loads(json.dumps(payload))))
+    else:
+        store.add_page(json.loads(json.dumps(payload)))
+    assert len(store) == 3
+    row = store[-2]
+    assert (row.id, row.network, row.tag, row.from_, row.status) == \
+           (page.data[1].id, Network.ETHEREUM, ActivityTag.TRANSACTION, page.data[1].from_, True)
+    assert row.actions[0].metadata.symbol == "USDT"
+    assert row.fee.decimal == 18
+    assert [row.model_build() for row in store] == page.data
+    assert store.column("timestamp") == [1700000000, 1700000001, 1700000002]
+    assert store.column("tag") == [ActivityTag.TRANSACTION] * 3
+    with pytest.raises(IndexError):
+        store[3]
+
+
+def test_addresses_and_enums_are_interned():
+    store = ActivityStore()
+    store.add_page(make_transfers(100))
+    assert store._addresses.values == [None, make_activity()["owner"], make_activity()["to"]]
+    assert len(store._tags.values) == 2
+    assert store.column("from_")[0] is store.column("from_")[99]
+
+
+def test_malformed_activity_leaves_store_consistent():
+    store = ActivityStore()
+    store.add(make_activity(1))
+    with pytest.raises(TypeError):
+        store.add(dict(make_activity(2), index=None))
+    store.add(make_activity(3))
+    assert len(store) == 2
+    assert store.column("id") == [make_activity(1)["id"], make_activity(3)["id"]]
+    assert [row.timestamp for row in store] == [make_activity(1)["timestamp"], make_activity(3)["timestamp"]]
+    assert store.materialize(1).id == make_activity(3)["id"]
+
+
+def test_store_is_much_smaller_than_models():
+    document = json.dumps(make_transfers(2000))
+    tracemalloc.start()
+    try:
+        page = TypedActivities.model_validate_json(document)
+        models = tracemalloc.get_traced_memory()[0]
+        store = ActivityStore()
+        store.extend(page.data)
+        stored = tracemalloc.get_traced_memory()[0] - models
+    finally:
+        tracemalloc.stop()
+    assert stored < models / 4
+    assert store.nbytes() <= stored
@@ -0,0 +1,51 @@
+import asyncio
+
+from rss3_dsl_sdk.async_client import AsyncRSS3Client
+from rss3_dsl_sdk.schemas.base import ActivityFilter, PaginationOptions
+from rss3_dsl_sdk.schemas.enums import Platform
+from tests.fakes import json_response, make_activity, make_page
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+
+
+def test_fetch_social_post_activities(dsl_server):
+    dsl_server.respond = lambda path, query: json_response(make_page([make_activity()], cursor="next"))
+
+    async def main():
+        async with AsyncRSS3Client(base_url=dsl_server.url) as client:
+            return await client.fetch_social_post_activities(
+                ACCOUNT,
+                filters=ActivityFilter(platform=[Platform.FARCASTER], success=True),
+                pagination=PaginationOptions(limit=5)
+            )
+
+    activities = asyncio.run(main())
+    assert activities.data[0].actions[0].metadata.body == "post 0"
+    assert activities.meta.cursor == "next"
+    _, query = dsl_server.requests[0]
+    assert query["platform"] == ["Farcaster"]
+    assert query["success"] == ["true"]
+    assert query["limit"] == ["5"]
+
+
+def test_gather_bounds_concurrency(dsl_server):
+    async def main():
+        async with AsyncRSS3Client(base_url=dsl_server.url) as client:
+            in_flight = 0
+            peak = 0
+
+            async def task(i):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                result = await client.fetch_activities(f"0x{i:040x}")
+                in_flight -= 1
+                return result
+
+            results = await client.gather(*(task(i) for i in range(20)), limit=4)
+            return results, peak
+
+    results, peak = asyncio.run(main())
+    assert len(results) == 20
+    assert peak <= 4
+    assert len(dsl_server.requests) == 20
@@ -0,0 +1,107 @@
+import time
+
+import pytest
+import requests
+
+from rss3_dsl_sdk.balancer import CLOSED, HALF_OPEN, OPEN, EndpointPool
+from rss3_dsl_sdk.client import RSS3Client
+from rss3_dsl_sdk.retry import RetryPolicy
+from rss3_dsl_sdk.transport import PooledTransport
+from tests.fakes import FakeDSLServer, json_response, make_activity, make_page
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+
+
+def page(delay: float = 0.0, status: int = 200):
+    def respond(path, query):
+        time.sleep(delay)
+        return json_response(make_page([make_activity()]), status=status)
+
+    return respond
+
+
+def test_requests_prefer_the_fastest_node():
+    fast, slow = FakeDSLServer(page()).start(), FakeDSLServer(page(delay=0.05)).start()
+    try:
+        with RSS3Client(base_url=[slow.url, fast.url]) as client:
+            for _ in range(20):
+                client.fetch_social_post_activities(ACCOUNT)
+    finally:
+        fast.stop()
+        slow.stop()
+    assert len(slow.requests) <= 2
+    assert len(fast.requests) >= 18
+    assert fast.requests[0][0] == f"/decentralized/{ACCOUNT}"
+
+
+def test_failing_node_is_ejected_and_probed_back():
+    broken, healthy = FakeDSLServer(page(status=500)).start(), FakeDSLServer(page(delay=0.01)).start()
+    pool = EndpointPool([broken.url, healthy.url], failure_threshold=1, cooldown=0.2)
+    try:
+        with RSS3Client(base_url=pool, retry=RetryPolicy(backoff_factor=0.001)) as client:
+            for _ in range(5):
+                assert len(client.fetch_social_post_activities(ACCOUNT).data) == 1
+            assert pool.endpoints[0].state == OPEN
+            assert len(broken.requests) == 1
+            broken.respond = page()
+            time.sleep(0.25)
+            client.fetch_social_post_activities(ACCOUNT)
+    finally:
+        broken.stop()
+        healthy.stop()
+    assert len(broken.requests) == 2
+    assert pool.endpoints[0].state == CLOSED
+
+
+def test_throttling_node_is_avoided():
+    throttling, healthy = FakeDSLServer(page(status=429)).start(), FakeDSLServer(page(delay=0.05)).start()
+    pool = EndpointPool([throttling.url, healthy.url])
+    try:
+        with RSS3Client(base_url=pool, retry=RetryPolicy(backoff_factor=0.001)) as client:
+            for _ in range(10):
+                assert len(client.fetch_social_post_activities(ACCOUNT).data) == 1
+    finally:
+        throttling.stop()
+        healthy.stop()
+    assert len(healthy.requests) == 10
+    assert len(throttling.requests) <= 2
+
+
+class BrokenBodyTransport(PooledTransport):
+    def __init__(self, broken_url: str):
+        super().__init__()
+        self.broken_url = broken_url
+
+    def send(self, url, params=None, headers=None, timings=None, stream=False):
+        if url.startswith(self.broken_url):
+            raise requests.exceptions.ChunkedEncodingError("connection broken mid-body")
+        return super().send(url, params=params, headers=headers, timings=timings, stream=stream)
+
+
+def test_probe_failing_with_any_error_reopens_the_circuit():
+    healthy = FakeDSLServer(page()).start()
+    broken_url = "http://127.0.0.1:9"
+    pool = EndpointPool([broken_url, healthy.url], failure_threshold=1, cooldown=0.05)
+    try:
+        with RSS3Client(base_url=pool, transport=BrokenBodyTransport(broken_url)) as client:
+            with pytest.raises(requests.exceptions.ChunkedEncodingError):
+                client.fetch_social_post_activities(ACCOUNT)
+            assert pool.endpoints[0].state == OPEN
+            time.sleep(0.1)
+            with pytest.raises(requests.exceptions.ChunkedEncodingError):
+                client.fetch_social_post_activities(ACCOUNT)
+            assert pool.endpoints[0].state == OPEN
+            client.fetch_social_post_activities(ACCOUNT)
+    finally:
+        healthy.stop()
+    assert pool.endpoints[0].errors == 2
+    assert pool.endpoints[1].state == CLOSED
+
+
+def test_unresolved_probe_reopens_the_circuit():
+    pool = EndpointPool(["http://a", "http://b"], failure_threshold=1, cooldown=0.0)
+    pool.record_failure(pool.endpoints[0])
+    probe = pool.choose()
+    assert probe is pool.endpoints[0] and probe.state == HALF_OPEN
+    pool.release(probe)
+    assert probe.state == OPEN and probe.in_flight == 0
@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+from rss3_dsl_sdk.async_client import AsyncRSS3Client
+from rss3_dsl_sdk.client import RSS3Client
+from rss3_dsl_sdk.exceptions import APIError
+from tests.fakes import json_response, make_activity, make_page
+
+SLOW = "0x" + "1" * 40
+BROKEN = "0x" + "2" * 40
+ACCOUNTS = [SLOW, BROKEN] + [f"0x{i:040x}" for i in range(10)]
+
+
+def respond(path, query):
+    account = path.rsplit("/", 1)[-1]
+    if account == SLOW:
+        time.sleep(0.5)
+    if account == BROKEN:
+        return 500, {}, b"internal error"
+    return json_response(make_page([make_activity()]))
+
+
+def test_fetch_activities_bulk_isolates_errors_and_slow_accounts(dsl_server):
+    dsl_server.respond = respond
+    with RSS3Client(base_url=dsl_server.url, retry=None) as client:
+        results = list(client.fetch_activities_bulk(iter(ACCOUNTS), max_workers=4))
+    assert sorted(account for account, _ in results) == sorted(ACCOUNTS)
+    assert results[-1][0] == SLOW
+    errors = {account: result for account, result in results if isinstance(result, Exception)}
+    assert list(errors) == [BROKEN]
+    assert isinstance(errors[BROKEN], APIError) and errors[BROKEN].status_code == 500
+    assert all(len(result.data) == 1 for account, result in results if account not in errors)
+
+
+def test_async_fetch_activities_bulk(dsl_server):
+    dsl_server.respond = respond
+
+    async def main():
+        async with AsyncRSS3Client(base_url=dsl_server.url, retry=None) as client:
+            return [pair async for pair in client.fetch_activities_bulk(ACCOUNTS, limit=4)]
+
+    results = asyncio.run(main())
+    assert sorted(account for account, _ in results) == sorted(ACCOUNTS)
+    assert results[-1][0] == SLOW
+    assert [account for account, result in results if isinstance(result, Exception)] == [BROKEN]
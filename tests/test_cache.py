@@ -0,0 +1,105 @@
+import time
+
+from rss3_dsl_sdk.cache import ResponseCache, SQLiteCache, cache_key
+from rss3_dsl_sdk.client import RSS3Client
+from rss3_dsl_sdk.schemas.base import ActivityFilter, PaginationOptions
+from tests.fakes import json_response, make_activity, make_page
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+
+
+def test_cache_key_ignores_param_order():
+    assert cache_key("u", {"a": 1, "b": [2]}) == cache_key("u", {"b": [2], "a": 1})
+    assert cache_key("u", {"a": 1}) != cache_key("v", {"a": 1})
+
+
+def test_ttl_expiry():
+    cache = ResponseCache(ttl=0.05)
+    cache.set("k", b"v", size=1)
+    assert cache.get("k") == b"v"
+    time.sleep(0.1)
+    assert cache.get("k") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.size_bytes == 0
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = ResponseCache(ttl=None, max_entries=2)
+    cache.set("a", 1, size=1)
+    cache.set("b", 2, size=1)
+    cache.get("a")
+    cache.set("c", 3, size=1)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.evictions == 1
+
+    cache = ResponseCache(ttl=None, max_entries=None, max_bytes=10)
+    cache.set("a", 1, size=6)
+    cache.set("b", 2, size=6)
+    assert len(cache) == 1
+    assert cache.size_bytes == 6
+    cache.set("huge", 3, size=11)
+    assert cache.get("huge") is None
+
+
+def test_client_serves_repeated_queries_from_cache(dsl_server):
+    dsl_server.respond = lambda path, query: json_response(make_page([make_activity()]))
+    cache = ResponseCache(ttl=60)
+    with RSS3Client(base_url=dsl_server.url, cache=cache) as client:
+        first = client.fetch_social_post_activities(ACCOUNT, filters=ActivityFilter(success=True))
+        second = client.fetch_social_post_activities(ACCOUNT, filters=ActivityFilter(success=True))
+        client.fetch_social_post_activities(ACCOUNT, pagination=PaginationOptions(limit=20))
+    assert len(dsl_server.requests) == 2
+    assert first == second and first is not second
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_client_can_cache_parsed_models(dsl_server):
+    dsl_server.respond = lambda path, query: json_response(make_page([make_activity()]))
+    with RSS3Client(base_url=dsl_server.url, cache=ResponseCache(store_models=True)) as client:
+        first = client.fetch_social_post_activities(ACCOUNT)
+        assert client.fetch_social_post_activities(ACCOUNT) is first
+        generic = client.fetch_activities(ACCOUNT, tag=first.data[0].tag, activity_type=first.data[0].type)
+    assert generic is not first
+    assert len(dsl_server.requests) == 2
+
+
+def test_sqlite_cache_survives_restarts(dsl_server, tmp_path):
+    dsl_server.respond = lambda path, query: json_response(make_page([make_activity()]))
+    path = str(tmp_path / "cache.sqlite")
+    with RSS3Client(base_url=dsl_server.url, cache=SQLiteCache(path)) as client:
+        first = client.fetch_social_post_activities(ACCOUNT)
+    cache = SQLiteCache(path)
+    with RSS3Client(base_url=dsl_server.url, cache=cache) as client:
+        assert client.fetch_social_post_activities(ACCOUNT) == first
+    assert len(dsl_server.requests) == 1
+    assert cache.hits == 1
+
+
+def test_historical_pages_never_expire(dsl_server):
+    recent = int(time.time())
+    dsl_server.respond = lambda path, query: json_response(make_page([make_activity(timestamp=1700000000)]))
+    cache = ResponseCache(ttl=0)
+    with RSS3Client(base_url=dsl_server.url, cache=cache) as client:
+        for _ in range(2):
+            client.fetch_activities(ACCOUNT, pagination=PaginationOptions(cursor="old"))
+            client.fetch_activities(ACCOUNT)
+            client.fetch_activities(ACCOUNT, filters=ActivityFilter(until_timestamp=1700000000))
+            client.fetch_activities(ACCOUNT, filters=ActivityFilter(until_timestamp=recent))
+    assert [query.get("cursor", query.get("until_timestamp")) for _, query in dsl_server.requests] == [
+        ["old"], None, ["1700000000"], [str(recent)], None, [str(recent)]
+    ]
+
+
+def test_stale_entries_are_revalidated(dsl_server):
+    def respond(path, query):
+        return json_response(make_page([make_activity()]), headers={"ETag": '"v1"'})
+
+    dsl_server.respond = respond
+    cache = ResponseCache(ttl=0)
+    with RSS3Client(base_url=dsl_server.url, cache=cache) as client:
+        first = client.fetch_social_post_activities(ACCOUNT)
+        dsl_server.respond = lambda path, query: (304, {"ETag": '"v1"'}, b"")
+        assert client.fetch_social_post_activities(ACCOUNT) == first
+    assert cache.revalidations == 1
+    assert len(dsl_server.requests) == 2
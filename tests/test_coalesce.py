@@ -0,0 +1,51 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from rss3_dsl_sdk.client import RSS3Client
+from rss3_dsl_sdk.coalesce import SingleFlight
+from tests.fakes import json_response, make_activity, make_page
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+
+
+def slow_page(path, query):
+    time.sleep(0.3)
+    return json_response(make_page([make_activity()]))
+
+
+def test_identical_requests_share_one_round_trip(dsl_server):
+    dsl_server.respond = slow_page
+    with RSS3Client(base_url=dsl_server.url, coalesce=True) as client:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: client.fetch_social_post_activities(ACCOUNT), range(8)))
+            other = executor.submit(client.fetch_social_comment_activities, ACCOUNT)
+            post = executor.submit(client.fetch_social_post_activities, ACCOUNT)
+            other.result(), post.result()
+    assert all(result is results[0] for result in results)
+    assert len(dsl_server.requests) == 3
+    assert client.single_flight.calls == 10
+    assert client.single_flight.coalesced == 7
+    assert client.single_flight.in_flight == 0
+
+
+def test_followers_receive_the_leader_error():
+    single_flight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.2)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, "key", fail)
+        started.wait()
+        follower = executor.submit(single_flight.do, "key", lambda: "not run")
+        for future in (leader, follower):
+            with pytest.raises(ValueError):
+                future.result()
+    assert single_flight.coalesced == 1
+    assert single_flight.do("key", lambda: "fresh") == "fresh"
@@ -0,0 +1,42 @@
+import pytest
+
+from rss3_dsl_sdk.client import RSS3Client
+from rss3_dsl_sdk.schemas.base import PaginationOptions
+from tests.fakes import feed_responder, make_activity
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+
+
+def test_crawl_merges_shards_newest_first(dsl_server):
+    dense = [make_activity(index, timestamp=100000 - index) for index in range(40)]
+    sparse = [make_activity(100 + index, timestamp=50000 - index * 5000) for index in range(5)]
+    feed = dense + sparse
+    dsl_server.respond = feed_responder(feed)
+    with RSS3Client(base_url=dsl_server.url) as client:
+        activities = client.crawl_activities(ACCOUNT, since_timestamp=0, until_timestamp=100000, shards=4,
+                                             max_workers=4, min_shard_seconds=5, pagination=PaginationOptions(limit=5))
+    assert [activity.id for activity in activities] == [activity["id"] for activity in feed]
+    shard_starts = {query["since_timestamp"][0] for _, query in dsl_server.requests}
+    assert len(shard_starts) > 4
+
+
+def test_crawl_walks_small_shards_sequentially(dsl_server):
+    feed = [make_activity(index, timestamp=1000 - index) for index in range(12)]
+    dsl_server.respond = feed_responder(feed)
+    with RSS3Client(base_url=dsl_server.url) as client:
+        activities = client.crawl_activities(ACCOUNT, since_timestamp=900, until_timestamp=1000,
+                                             min_shard_seconds=3600, pagination=PaginationOptions(limit=5))
+    assert [activity.id for activity in activities] == [activity["id"] for activity in feed]
+    assert [query.get("cursor") for _, query in dsl_server.requests] == [None, ["5"], ["10"]]
+
+
+def test_crawl_walks_a_busy_second_at_the_top_of_a_shard(dsl_server):
+    feed = [make_activity(index, timestamp=1700000100) for index in range(10)]
+    dsl_server.respond = feed_responder(feed)
+    with RSS3Client(base_url=dsl_server.url) as client:
+        activities = client.crawl_activities(ACCOUNT, since_timestamp=1700000000, until_timestamp=1700000200,
+                                             shards=1, min_shard_seconds=1, pagination=PaginationOptions(limit=3))
+        with pytest.raises(ValueError):
+            client.crawl_activities(ACCOUNT, since_timestamp=0, until_timestamp=10, min_shard_seconds=0)
+    assert sorted(activity.id for activity in activities) == sorted(activity["id"] for activity in feed)
+    assert len(dsl_server.requests) < 30
@@ -0,0 +1,67 @@
+import asyncio
+import itertools
+import time
+
+from rss3_dsl_sdk.async_client import AsyncRSS3Client
+from rss3_dsl_sdk.client import RSS3Client
+from rss3_dsl_sdk.hedge import HedgePolicy, Hedger
+from tests.fakes import json_response, make_activity, make_page
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+POLICY = HedgePolicy(percentile=90, budget=0.5, min_samples=5)
+
+
+def slow_request(number: int):
+    """
+    Answer the ``number``-th request after a second and all others at once.
+    """
+    counter = itertools.count()
+
+    def respond(path, query):
+        if next(counter) == number:
+            time.sleep(1)
+        return json_response(make_page([make_activity()]))
+
+    return respond
+
+
+def test_slow_request_is_hedged(dsl_server):
+    dsl_server.respond = slow_request(5)
+    with RSS3Client(base_url=dsl_server.url, hedge=POLICY) as client:
+        for _ in range(5):
+            client.fetch_social_post_activities(ACCOUNT)
+        start = time.monotonic()
+        activities = client.fetch_social_post_activities(ACCOUNT)
+        elapsed = time.monotonic() - start
+        hedger = client.transport.hedger
+    assert len(activities.data) == 1
+    assert elapsed < 0.5
+    assert (hedger.requests, hedger.hedges, hedger.hedge_wins) == (6, 1, 1)
+    assert len(dsl_server.requests) == 7
+
+
+def test_async_slow_request_is_hedged(dsl_server):
+    dsl_server.respond = slow_request(5)
+
+    async def main():
+        async with AsyncRSS3Client(base_url=dsl_server.url, hedge=POLICY) as client:
+            for _ in range(5):
+                await client.fetch_social_post_activities(ACCOUNT)
+            start = time.monotonic()
+            await client.fetch_social_post_activities(ACCOUNT)
+            return time.monotonic() - start, client.transport.hedger
+
+    elapsed, hedger = asyncio.run(main())
+    assert elapsed < 0.5
+    assert hedger.hedge_wins == 1
+
+
+def test_hedge_budget_bounds_extra_requests():
+    hedger = Hedger(HedgePolicy(budget=0.1, min_samples=1))
+    hedger.record(0.01)
+    allowed = 0
+    for _ in range(100):
+        assert hedger.delay() == 0.01
+        allowed += hedger.try_hedge()
+    assert allowed == 10
+    assert hedger.percentile(50) == 0.01
@@ -0,0 +1,69 @@
+import pytest
+
+from rss3_dsl_sdk.cache import ResponseCache
+from rss3_dsl_sdk.client import RSS3Client
+from rss3_dsl_sdk.exceptions import APIError
+from rss3_dsl_sdk.metrics import Histogram, MetricsAggregator
+from rss3_dsl_sdk.retry import RetryPolicy
+from rss3_dsl_sdk.transport import HTTP2Transport
+from rss3_dsl_sdk.views import ResultMode
+from tests.fakes import json_response, make_activity, make_page
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+
+
+def test_callbacks_receive_phases_sizes_and_counts(dsl_server):
+    dsl_server.respond = lambda path, query: json_response(make_page([make_activity(1), make_activity(2)]))
+    seen = []
+    with RSS3Client(base_url=dsl_server.url, observers=[seen.append]) as client:
+        client.fetch_activities(ACCOUNT)
+        client.with_result_mode(ResultMode.RAW).fetch_activities(ACCOUNT)
+    model, raw = seen
+    assert model.status_code == 200
+    assert model.response_bytes > 0
+    assert (model.activities, model.actions) == (2, 2)
+    assert model.ttfb > 0 and model.download >= 0 and model.validate > 0 and model.decode is None
+    assert raw.decode > 0 and raw.validate is None
+    assert model.total >= model.ttfb + model.download + model.validate
+
+
+def test_cache_hits_retries_and_errors_are_aggregated(dsl_server):
+    statuses = iter([503, 200, 404])
+    dsl_server.respond = lambda path, query: json_response(make_page([make_activity()]), status=next(statuses))
+    aggregator = MetricsAggregator()
+    with RSS3Client(base_url=dsl_server.url, observers=[aggregator], cache=ResponseCache(ttl=60),
+                    retry=RetryPolicy(backoff_factor=0.001)) as client:
+        client.fetch_activities(ACCOUNT)
+        client.fetch_activities(ACCOUNT)
+        with pytest.raises(APIError):
+            client.fetch_social_post_activities(ACCOUNT)
+    snapshot = aggregator.snapshot()
+    expected = {"requests": 3, "errors": 1, "cache_hits": 1, "revalidations": 0, "retries": 1, "activities": 2,
+                "actions": 2}
+    assert {name: snapshot["counters"][name] for name in expected} == expected
+    assert snapshot["phases"]["total"]["count"] == 3
+    assert snapshot["phases"]["ttfb"]["count"] == 2
+    assert snapshot["response_bytes"]["count"] == 2
+
+
+def test_http2_transport_measures_connect(dsl_server):
+    pytest.importorskip("h2")
+    seen = []
+    with RSS3Client(base_url=dsl_server.url, transport=HTTP2Transport(), observers=[seen.append]) as client:
+        client.fetch_activities(ACCOUNT)
+        client.fetch_activities(ACCOUNT)
+    assert seen[0].connect > 0
+    assert seen[1].connect is None
+
+
+def test_histogram_quantiles_and_buckets():
+    histogram = Histogram([1, 2, 4])
+    for value in (0.5, 1.5, 1.5, 3, 10):
+        histogram.observe(value)
+    exported = histogram.to_dict()
+    assert exported["count"] == 5
+    assert exported["sum"] == 16.5
+    assert exported["buckets"] == {1: 1, 2: 3, 4: 4, "+Inf": 5}
+    assert 1 < exported["p50"] <= 2
+    assert exported["p99"] == 4
+    assert Histogram([1]).quantile(0.5) is None
@@ -0,0 +1,79 @@
+import time
+
+import pytest
+
+from rss3_dsl_sdk.client import RSS3Client
+from rss3_dsl_sdk.schemas.base import PaginationOptions
+from tests.fakes import json_response, make_activity, make_page
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+
+
+def paged_feed(pages: int, per_page: int = 3):
+    def respond(path, query):
+        page = int(query.get("cursor", ["0"])[0])
+        activities = [make_activity(page * per_page + i, timestamp=1700000000 - page * per_page - i)
+                      for i in range(per_page)]
+        cursor = str(page + 1) if page + 1 < pages else None
+        return json_response(make_page(activities, cursor=cursor))
+    return respond
+
+
+@pytest.fixture
+def client(dsl_server):
+    dsl_server.respond = paged_feed(pages=4)
+    with RSS3Client(base_url=dsl_server.url) as client:
+        yield client
+
+
+def test_iter_activities_follows_cursor(client, dsl_server):
+    activities = list(client.iter_activities(ACCOUNT, pagination=PaginationOptions(limit=3)))
+    assert len(activities) == 12
+    assert len(dsl_server.requests) == 4
+    assert [query.get("cursor") for _, query in dsl_server.requests] == [None, ["1"], ["2"], ["3"]]
+
+
+def test_iter_activities_is_lazy(client, dsl_server):
+    iterator = client.iter_social_post_activities(ACCOUNT)
+    assert dsl_server.requests == []
+    first = next(iterator)
+    assert first.actions[0].metadata.body == "post 0"
+    assert len(dsl_server.requests) == 1
+
+
+def test_iter_activities_limits(client, dsl_server):
+    assert len(list(client.iter_activities(ACCOUNT, max_items=5))) == 5
+    assert len(dsl_server.requests) == 2
+    assert len(list(client.iter_activities(ACCOUNT, max_pages=3))) == 9
+    activities = list(client.iter_transaction_transfer_activities(ACCOUNT, stop_before_timestamp=1700000000 - 6))
+    assert [activity.timestamp for activity in activities][-1] == 1700000000 - 6
+    assert len(activities) == 7
+
+
+def test_prefetch_fetches_next_page_in_background(client, dsl_server):
+    iterator = client.iter_activities(ACCOUNT, prefetch=1)
+    first = next(iterator)
+    deadline = time.monotonic() + 5
+    while len(dsl_server.requests) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(dsl_server.requests) == 2
+    time.sleep(0.2)
+    assert len(dsl_server.requests) == 2
+    rest = list(iterator)
+    assert [first.id] + [activity.id for activity in rest] == [
+        activity.id for activity in client.iter_activities(ACCOUNT)
+    ]
+
+
+def test_prefetch_propagates_errors(dsl_server):
+    def respond(path, query):
+        if "cursor" in query:
+            return 200, {"Content-Type": "application/json"}, b"not json"
+        return json_response(make_page([make_activity()], cursor="1"))
+
+    dsl_server.respond = respond
+    with RSS3Client(base_url=dsl_server.url) as client:
+        iterator = client.iter_activities(ACCOUNT, prefetch=2)
+        next(iterator)
+        with pytest.raises(ValueError):
+            next(iterator)
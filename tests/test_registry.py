@@ -0,0 +1,79 @@
+import json
+
+from rss3_dsl_sdk.client import RSS3Client
+from rss3_dsl_sdk.schemas.base import Activities
+from rss3_dsl_sdk.schemas.enums import ActivityTag, ActivityType
+from rss3_dsl_sdk.schemas.exchange import ExchangeSwapActivities, ExchangeSwapMetadata
+from rss3_dsl_sdk.schemas.registry import METADATA_TYPES, TypedActivities, activities_type
+from rss3_dsl_sdk.schemas.social import SocialCommentActivities, SocialPostActivities, SocialPostMetadata
+from rss3_dsl_sdk.views import LazyModel, ResultMode
+from tests.fakes import json_response, make_activity, make_page
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+SWAP = {"from": {"symbol": "WETH", "value": "1.5"}, "to": {"symbol": "USDC", "value": "3000"}}
+POST = (ActivityTag.SOCIAL, ActivityType.POST)
+COMMENT = (ActivityTag.SOCIAL, ActivityType.COMMENT)
+SWAP_KIND = (ActivityTag.EXCHANGE, ActivityType.SWAP)
+
+
+def test_registry_maps_to_typed_models():
+    assert len(METADATA_TYPES) == 27
+    assert activities_type(*POST) is SocialPostActivities
+    assert activities_type(*SWAP_KIND) is ExchangeSwapActivities
+    assert activities_type(ActivityTag.SOCIAL, ActivityType.SWAP) is Activities
+
+
+def test_fetch_activities_by_types_sends_one_request(dsl_server):
+    dsl_server.respond = lambda path, query: json_response(make_page([
+        make_activity(0),
+        make_activity(1, tag="exchange", activity_type="swap", metadata=SWAP),
+        make_activity(2),
+        make_activity(3, tag="social", activity_type="swap", metadata=SWAP),
+    ], cursor="next"))
+    with RSS3Client(base_url=dsl_server.url) as client:
+        result = client.fetch_activities_by_types(ACCOUNT, [POST, ("exchange", "swap"), COMMENT, POST])
+        lazy = client.with_result_mode(ResultMode.LAZY).fetch_activities_by_types(ACCOUNT, [SWAP_KIND])
+    assert len(dsl_server.requests) == 2
+    _, query = dsl_server.requests[0]
+    assert query["tag"] == ["social", "exchange"]
+    assert query["type"] == ["post", "swap", "comment"]
+    assert list(result) == [POST, SWAP_KIND, COMMENT]
+    assert isinstance(result[POST], SocialPostActivities)
+    assert [activity.id for activity in result[POST].data] == [make_activity(0)["id"], make_activity(2)["id"]]
+    assert isinstance(result[SWAP_KIND], ExchangeSwapActivities)
+    assert result[SWAP_KIND].data[0].actions[0].metadata.from_.symbol == "WETH"
+    assert isinstance(result[COMMENT], SocialCommentActivities)
+    assert result[COMMENT].data == []
+    assert result[COMMENT].meta.cursor == "next"
+    assert isinstance(lazy[SWAP_KIND], LazyModel)
+    assert lazy[SWAP_KIND].data[0].actions[0].metadata.to.symbol == "USDC"
+
+
+def test_fetch_activities_parses_metadata_by_type(dsl_server):
+    dsl_server.respond = lambda path, query: json_response(make_page([
+        make_activity(0),
+        make_activity(1, tag="exchange", activity_type="swap", metadata=SWAP),
+        make_activity(2, tag="social", activity_type="swap", metadata={"custom": 1}),
+    ]))
+    with RSS3Client(base_url=dsl_server.url) as client:
+        activities = client.fetch_activities(ACCOUNT)
+        lazy = client.with_result_mode(ResultMode.LAZY).fetch_activities(ACCOUNT)
+    post, swap, unknown = (activity.actions[0].metadata for activity in activities.data)
+    assert isinstance(post, SocialPostMetadata) and post.body == "post 0"
+    assert isinstance(swap, ExchangeSwapMetadata) and swap.to.symbol == "USDC"
+    assert unknown == {"custom": 1}
+    assert isinstance(lazy.data[1].actions[0].metadata, ExchangeSwapMetadata)
+    assert TypedActivities.model_validate(activities.model_dump(by_alias=True)) == activities
+
+
+def test_action_failing_its_model_keeps_the_metadata_as_a_dict():
+    bridge = {"action": "deposit", "source_network": "unknown-chain", "target_network": "ethereum",
+              "token": {"value": "1", "name": "Ether", "symbol": "ETH", "decimals": 18, "standard": "ERC-20"}}
+    page = json.dumps(make_page([
+        make_activity(0),
+        make_activity(1, tag="transaction", activity_type="bridge", metadata=bridge),
+    ]))
+    post, unknown = (activity.actions[0].metadata for activity in TypedActivities.model_validate_json(page).data)
+    assert isinstance(post, SocialPostMetadata)
+    assert unknown == bridge
+    assert TypedActivities.model_validate(json.loads(page)).data[1].actions[0].metadata == bridge
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from rss3_dsl_sdk.async_client import AsyncRSS3Client
+from rss3_dsl_sdk.client import RSS3Client
+from rss3_dsl_sdk.exceptions import APIError
+from rss3_dsl_sdk.retry import AIMDLimiter, RetryPolicy, TokenBucket, parse_retry_after
+from tests.fakes import json_response, make_activity, make_page
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+FAST_RETRY = RetryPolicy(max_retries=3, backoff_factor=0.01)
+
+
+def failing(statuses, headers=None):
+    """
+    Answer with each status of ``statuses`` in turn, then with a page.
+    """
+    remaining = list(statuses)
+    lock = threading.Lock()
+
+    def respond(path, query):
+        with lock:
+            status = remaining.pop(0) if remaining else None
+        if status is not None:
+            return json_response({"error": "busy"}, status=status, headers=headers)
+        return json_response(make_page([make_activity()]))
+
+    return respond
+
+
+def test_retries_throttled_requests_honoring_retry_after(dsl_server):
+    dsl_server.respond = failing([429, 503], headers={"Retry-After": "0.2"})
+    with RSS3Client(base_url=dsl_server.url, retry=FAST_RETRY) as client:
+        start = time.monotonic()
+        activities = client.fetch_social_post_activities(ACCOUNT)
+        elapsed = time.monotonic() - start
+        limit = client.transport.limiter.limit
+    assert len(activities.data) == 1
+    assert len(dsl_server.requests) == 3
+    assert elapsed >= 0.4
+    assert limit < client.transport.pool_maxsize
+
+
+def test_raises_api_error_after_last_retry(dsl_server):
+    dsl_server.respond = failing([500] * 10)
+    with RSS3Client(base_url=dsl_server.url, retry=FAST_RETRY) as client:
+        with pytest.raises(APIError) as error:
+            client.fetch_activities(ACCOUNT)
+    assert error.value.status_code == 500
+    assert len(dsl_server.requests) == 4
+
+
+def test_client_errors_are_not_retried(dsl_server):
+    dsl_server.respond = failing([404])
+    with RSS3Client(base_url=dsl_server.url, retry=FAST_RETRY) as client:
+        with pytest.raises(APIError):
+            client.fetch_activities(ACCOUNT)
+    assert len(dsl_server.requests) == 1
+
+
+def test_async_client_retries(dsl_server):
+    dsl_server.respond = failing([502, 429])
+
+    async def main():
+        async with AsyncRSS3Client(base_url=dsl_server.url, retry=FAST_RETRY) as client:
+            return await client.fetch_social_post_activities(ACCOUNT)
+
+    assert len(asyncio.run(main()).data) == 1
+    assert len(dsl_server.requests) == 3
+
+
+def test_token_bucket_bounds_the_rate():
+    bucket = TokenBucket(rate=50, burst=5)
+    start = time.monotonic()
+    for _ in range(15):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.18
+
+
+def test_aimd_limiter_adapts():
+    limiter = AIMDLimiter(maximum=8)
+    limiter.on_throttle()
+    for _ in range(3):
+        limiter.on_throttle()
+    assert limiter.limit == 4
+    limiter.on_throttle()
+    assert limiter.limit == 2
+    for _ in range(20):
+        limiter.on_success()
+    assert 2 < limiter.limit <= 8
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
@@ -0,0 +1,86 @@
+import json
+import threading
+
+import pytest
+
+from rss3_dsl_sdk.client import RSS3Client
+from rss3_dsl_sdk.schemas.base import PaginationOptions
+from rss3_dsl_sdk.streaming import ArraySplitter
+from rss3_dsl_sdk.views import ResultMode
+from tests.fakes import feed_responder, json_response, make_activity, make_page
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 20])
+def test_splitter_yields_items_and_keeps_the_rest(chunk_size):
+    page = {"meta": None, "note": "data", "data": [{"body": 'quoted \\" ], and {'}, [1, {}], "x,]", None, 2],
+            "tail": {"cursor": "c"}}
+    document = json.dumps(page).encode()
+    splitter = ArraySplitter()
+    items = []
+    for start in range(0, len(document), chunk_size):
+        items += splitter.feed(document[start:start + chunk_size])
+    assert [json.loads(item) for item in items] == page["data"]
+    assert json.loads(splitter.close()) == dict(page, data=[])
+
+
+def test_splitter_rejects_truncated_documents():
+    splitter = ArraySplitter()
+    splitter.feed(b'{"data": [{"a": 1}, {"a"')
+    with pytest.raises(ValueError):
+        splitter.close()
+
+
+def test_activities_are_yielded_before_the_body_ends(dsl_server):
+    body = json.dumps(make_page([make_activity(1), make_activity(2)], cursor="next")).encode()
+    split = body.index(b'}, {"id"') + 3
+    first_received = threading.Event()
+    waited = []
+
+    def chunks():
+        yield body[:split]
+        waited.append(first_received.wait(2))
+        yield body[split:]
+
+    dsl_server.respond = lambda path, query: (200, {"Content-Type": "application/json"}, chunks())
+    with RSS3Client(base_url=dsl_server.url) as client:
+        with client.stream_activities(ACCOUNT) as stream:
+            activities = []
+            for activity in stream:
+                activities.append(activity)
+                first_received.set()
+    assert waited == [True]
+    assert [activity.id for activity in activities] == [make_activity(1)["id"], make_activity(2)["id"]]
+    assert stream.cursor == "next"
+    assert stream.count == 2
+
+
+@pytest.mark.parametrize("result_mode", list(ResultMode))
+def test_streamed_iteration_matches_pages(dsl_server, result_mode):
+    feed = [make_activity(index, timestamp=1700000000 - index) for index in range(7)]
+    dsl_server.respond = feed_responder(feed)
+    seen = []
+    with RSS3Client(base_url=dsl_server.url, result_mode=result_mode, observers=[seen.append]) as client:
+        pagination = PaginationOptions(limit=3)
+        streamed = list(client.iter_activities(ACCOUNT, pagination=pagination, stream=True))
+        paged = list(client.iter_activities(ACCOUNT, pagination=pagination))
+        with pytest.raises(ValueError):
+            client.iter_activities(ACCOUNT, stream=True, prefetch=1)
+    get = (lambda activity: activity["id"]) if result_mode is ResultMode.RAW else (lambda activity: activity.id)
+    assert [get(activity) for activity in streamed] == [get(activity) for activity in paged] == \
+           [activity["id"] for activity in feed]
+    assert [metrics.activities for metrics in seen[:3]] == [3, 3, 1]
+    assert all(metrics.response_bytes == metrics.wire_bytes > 0 for metrics in seen[:3])
+
+
+def test_closing_a_stream_early_releases_the_connection(dsl_server):
+    dsl_server.respond = lambda path, query: json_response(make_page([make_activity(index) for index in range(50)]))
+    with RSS3Client(base_url=dsl_server.url) as client:
+        stream = client.stream_activities(ACCOUNT)
+        next(iter(stream))
+        stream.close()
+        assert stream.cursor is None
+        unread = client.stream_activities(ACCOUNT)
+        unread.close()
+        assert len(client.fetch_activities(ACCOUNT).data) == 50
@@ -0,0 +1,132 @@
+import pytest
+
+from rss3_dsl_sdk.client import RSS3Client
+from rss3_dsl_sdk.schemas.base import PaginationOptions
+from rss3_dsl_sdk.schemas.enums import ActivityTag, ActivityType
+from rss3_dsl_sdk.schemas.transaction import TransactionTransferMetadata
+from rss3_dsl_sdk.stores import (
+    Checkpoint,
+    FileStateStore,
+    MemoryStateStore,
+    SQLiteStateStore,
+    Watermark
+)
+from tests.fakes import feed_responder, make_activity
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+
+
+@pytest.fixture(params=["memory", "file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryStateStore()
+    elif request.param == "file":
+        yield FileStateStore(str(tmp_path / "state.json"))
+    else:
+        store = SQLiteStateStore(str(tmp_path / "state.db"))
+        yield store
+        store.close()
+
+
+def test_sync_returns_only_new_activities(dsl_server, store):
+    feed = [make_activity(index, timestamp=1000 - index // 2) for index in range(6)]
+    dsl_server.respond = feed_responder(feed)
+    with RSS3Client(base_url=dsl_server.url) as client:
+        first = client.sync_activities(ACCOUNT, store)
+        assert [activity.id for activity in first] == [activity["id"] for activity in feed]
+        assert client.sync_activities(ACCOUNT, store) == []
+        assert dsl_server.requests[-1][1]["since_timestamp"] == ["1000"]
+
+        feed[:0] = [make_activity(7, timestamp=1001), make_activity(6, timestamp=1000)]
+        requests = len(dsl_server.requests)
+        second = client.sync_activities(ACCOUNT, store)
+        assert [activity.id for activity in second] == [feed[0]["id"], feed[1]["id"]]
+        assert len(dsl_server.requests) == requests + 1
+    assert len(store) == 1
+
+
+def test_sync_with_page_limit_resumes_from_cursor(dsl_server, store):
+    feed = [make_activity(index, timestamp=1000) for index in range(2)]
+    dsl_server.respond = feed_responder(feed)
+    with RSS3Client(base_url=dsl_server.url) as client:
+        assert len(client.sync_activities(ACCOUNT, store, key="feed")) == 2
+        feed[:0] = [make_activity(index, timestamp=2000 - index) for index in range(10, 20)]
+        pagination = PaginationOptions(limit=4)
+        first = client.sync_activities(ACCOUNT, store, pagination=pagination, max_pages=1, key="feed")
+        assert [activity.id for activity in first] == [activity["id"] for activity in feed[:4]]
+        assert Watermark.from_dict(store.get("feed")).cursor == "4"
+        rest = client.sync_activities(ACCOUNT, store, pagination=pagination, key="feed")
+        assert [activity.id for activity in rest] == [activity["id"] for activity in feed[4:10]]
+        assert client.sync_activities(ACCOUNT, store, key="feed") == []
+        assert dsl_server.requests[-1][1]["since_timestamp"] == ["1990"]
+        assert "cursor" not in dsl_server.requests[-1][1]
+
+
+def test_states_persist(tmp_path):
+    watermark = Watermark(1000, frozenset({"a"})).advance([(1000, "b"), (999, "c")])
+    assert watermark == Watermark(1000, frozenset({"a", "b"}))
+    assert watermark.advance([(1001, "d")]) == Watermark(1001, frozenset({"d"}))
+
+    path = str(tmp_path / "state.json")
+    FileStateStore(path).set("feed", watermark.to_dict())
+    assert Watermark.from_dict(FileStateStore(path).get("feed")) == watermark
+    store = SQLiteStateStore(str(tmp_path / "state.db"))
+    store.set("feed", Checkpoint("3", frozenset({"a"})).to_dict())
+    assert Checkpoint.from_dict(store.get("feed")) == Checkpoint("3", frozenset({"a"}), done=False)
+    store.delete("feed")
+    assert store.get("feed") is None
+    store.close()
+
+
+def test_resume_continues_from_the_committed_cursor(dsl_server, store):
+    transfer = {"from": "0x1", "to": "0x2", "value": "1"}
+    feed = [make_activity(index, tag="transaction", activity_type="transfer", timestamp=1000 - index,
+                          metadata=transfer) for index in range(7)]
+    ids = [activity["id"] for activity in feed]
+    dsl_server.respond = feed_responder(feed)
+    options = dict(tag=ActivityTag.TRANSACTION, activity_type=ActivityType.TRANSFER,
+                   pagination=PaginationOptions(limit=3))
+    with RSS3Client(base_url=dsl_server.url) as client:
+        crawl = client.resume_activities(ACCOUNT, store, **options)
+        first = [next(crawl) for _ in range(4)]
+        crawl.close()
+        assert isinstance(first[0].actions[0].metadata, TransactionTransferMetadata)
+
+        feed.insert(0, make_activity(99, tag="transaction", activity_type="transfer", timestamp=1001,
+                                     metadata=transfer))
+        rest = list(client.resume_activities(ACCOUNT, store, **options))
+        assert list(client.resume_activities(ACCOUNT, store, **options)) == []
+    assert [activity.id for activity in first] == ids[:4]
+    assert [activity.id for activity in rest] == ids[4:]
+
+
+def test_leaving_the_loop_commits_the_yielded_activities(dsl_server, store):
+    feed = [make_activity(index, timestamp=1000 - index) for index in range(5)]
+    ids = [activity["id"] for activity in feed]
+    dsl_server.respond = feed_responder(feed)
+    with RSS3Client(base_url=dsl_server.url) as client:
+        first = []
+        for activity in client.resume_activities(ACCOUNT, store, key="crawl"):
+            first.append(activity.id)
+            if len(first) == 2:
+                break
+        assert Checkpoint.from_dict(store.get("crawl")) == Checkpoint(None, frozenset(ids[:2]))
+        rest = [activity.id for activity in client.resume_activities(ACCOUNT, store, key="crawl")]
+    assert first == ids[:2]
+    assert rest == ids[2:]
+
+
+@pytest.mark.parametrize("limit", [3, 4])
+def test_resume_after_a_stop_in_a_shifted_head_page_emits_nothing_twice(dsl_server, store, limit):
+    feed = [make_activity(index, timestamp=1000 - index) for index in range(1, 8)]
+    ids = [activity["id"] for activity in feed]
+    dsl_server.respond = feed_responder(feed)
+    with RSS3Client(base_url=dsl_server.url) as client:
+        crawl = client.resume_activities(ACCOUNT, store, pagination=PaginationOptions(limit=3), key="crawl")
+        first = [next(crawl).id for _ in range(2)]
+        crawl.close()
+        feed[:0] = [make_activity(index, timestamp=1100 - index) for index in (100, 101)]
+        rest = [activity.id for activity in client.resume_activities(ACCOUNT, store, key="crawl",
+                                                                     pagination=PaginationOptions(limit=limit))]
+    assert first == ids[:2]
+    assert rest == [feed[0]["id"], feed[1]["id"]] + ids[2:]
@@ -0,0 +1,109 @@
+import gzip
+
+import pytest
+
+from rss3_dsl_sdk.client import RSS3Client, build_activity_params
+from rss3_dsl_sdk.exceptions import APIError
+from rss3_dsl_sdk.metrics import MetricsAggregator
+from rss3_dsl_sdk.schemas.base import ActivityTag, ActivityType
+from rss3_dsl_sdk.transport import HTTP2Transport, PooledTransport, RecordingTransport, ReplayTransport
+from tests.fakes import json_response, make_activity, make_page
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+
+
+def test_connections_are_reused_across_fetch_methods(dsl_server):
+    dsl_server.respond = lambda path, query: json_response(make_page([make_activity()]))
+    with RSS3Client(base_url=dsl_server.url) as client:
+        client.fetch_social_post_activities(ACCOUNT)
+        client.fetch_transaction_transfer_activities(ACCOUNT)
+        client.fetch_activities(ACCOUNT)
+    assert len(dsl_server.requests) == 3
+    assert dsl_server.connections == 1
+
+
+def test_keep_alive_disabled_opens_a_connection_per_request(dsl_server):
+    with RSS3Client(base_url=dsl_server.url, keep_alive=False) as client:
+        client.fetch_activities(ACCOUNT)
+        client.fetch_activities(ACCOUNT)
+    assert dsl_server.connections == 2
+
+
+def test_params_are_sent(dsl_server):
+    with RSS3Client(base_url=dsl_server.url, timeout=(1, 5)) as client:
+        client.fetch_social_post_activities(ACCOUNT)
+    path, query = dsl_server.requests[0]
+    assert path == f"/decentralized/{ACCOUNT}"
+    assert query["tag"] == ["social"]
+    assert query["type"] == ["post"]
+
+
+def test_replay_transport_serves_recordings_without_network():
+    transport = ReplayTransport()
+    transport.add(f"/decentralized/{ACCOUNT}", json_response(make_page([make_activity(1)]))[2],
+                  params=build_activity_params(ActivityTag.SOCIAL, ActivityType.POST))
+    with RSS3Client(base_url="http://dsl.invalid", transport=transport) as client:
+        activities = client.fetch_social_post_activities(ACCOUNT)
+        assert activities.data[0].id == make_activity(1)["id"]
+        with pytest.raises(APIError) as error:
+            client.fetch_activities(ACCOUNT)
+    assert error.value.status_code == 404
+    assert transport.requests == 2
+
+
+def test_replay_transport_fallback_and_balancing():
+    transport = ReplayTransport(fallback=lambda path, params: json_response(make_page([make_activity(2)])))
+    with RSS3Client(base_url=["http://a.invalid", "http://b.invalid"], transport=transport) as client:
+        assert client.fetch_activities(ACCOUNT).data[0].id == make_activity(2)["id"]
+    assert transport.endpoints is client.endpoints
+
+
+def test_recorded_exchanges_replay(dsl_server, tmp_path):
+    dsl_server.respond = lambda path, query: json_response(make_page([make_activity(3)]))
+    path = str(tmp_path / "recordings.json")
+    recorder = RecordingTransport(PooledTransport())
+    with RSS3Client(base_url=dsl_server.url, transport=recorder) as client:
+        recorded = client.fetch_social_post_activities(ACCOUNT)
+    recorder.save(path)
+    with RSS3Client(base_url="http://dsl.invalid", transport=ReplayTransport.load(path)) as client:
+        assert client.fetch_social_post_activities(ACCOUNT) == recorded
+    assert len(dsl_server.requests) == 1
+
+
+def test_http2_transport_falls_back_to_http1(dsl_server):
+    pytest.importorskip("h2")
+    dsl_server.respond = lambda path, query: json_response(make_page([make_activity(4)]))
+    with RSS3Client(base_url=dsl_server.url, transport=HTTP2Transport(max_connections=2)) as client:
+        client.fetch_activities(ACCOUNT)
+        client.fetch_social_post_activities(ACCOUNT)
+    assert len(dsl_server.requests) == 2
+    assert dsl_server.connections == 1
+
+
+def gzip_response(payload) -> tuple:
+    status, headers, body = json_response(payload)
+    return status, dict(headers, **{"Content-Encoding": "gzip"}), gzip.compress(body)
+
+
+@pytest.mark.parametrize("transport", [PooledTransport, HTTP2Transport])
+def test_compressed_responses_are_decoded_and_measured(dsl_server, transport):
+    if transport is HTTP2Transport:
+        pytest.importorskip("h2")
+    page = make_page([make_activity(index, metadata={"body": "0x" + "00" * 4096}) for index in range(5)])
+    dsl_server.respond = lambda path, query: gzip_response(page)
+    metrics = MetricsAggregator()
+    with RSS3Client(base_url=dsl_server.url, transport=transport(), observers=[metrics]) as client:
+        assert len(client.fetch_activities(ACCOUNT).data) == 5
+    assert "gzip" in dsl_server.request_headers[0]["Accept-Encoding"]
+    counters = metrics.snapshot()["counters"]
+    assert counters["response_bytes"] == len(json_response(page)[2])
+    assert counters["wire_bytes"] < counters["response_bytes"] / 10
+
+
+def test_compression_can_be_disabled(dsl_server):
+    seen = []
+    with RSS3Client(base_url=dsl_server.url, compression=False, observers=[seen.append]) as client:
+        client.fetch_activities(ACCOUNT)
+    assert dsl_server.request_headers[0]["Accept-Encoding"] == "identity"
+    assert seen[0].wire_bytes == seen[0].response_bytes
+    assert seen[0].content_encoding is None
@@ -0,0 +1,41 @@
+import asyncio
+from typing import Optional
+
+import pytest
+from pydantic import ValidationError
+
+from rss3_dsl_sdk.schemas.base import ActivityFilter, PaginationOptions
+from rss3_dsl_sdk.validation import fast_validate_call
+
+
+@fast_validate_call
+def fetch(account: str, filters: Optional[ActivityFilter] = None, pagination: Optional[PaginationOptions] = None,
+          max_items: Optional[int] = None):
+    return account, filters, pagination, max_items
+
+
+def test_valid_arguments_are_passed_through():
+    filters = ActivityFilter(success=True)
+    pagination = PaginationOptions(limit=5)
+    result = fetch("0x1", filters, pagination=pagination, max_items=3)
+    assert result[1] is filters and result[2] is pagination
+
+
+def test_other_arguments_are_validated():
+    _, filters, pagination, max_items = fetch("0x1", {"success": True}, pagination={"limit": 5}, max_items=True)
+    assert filters == ActivityFilter(success=True)
+    assert pagination == PaginationOptions(limit=5)
+    assert max_items == 1 and type(max_items) is int
+    with pytest.raises(ValidationError):
+        fetch("0x1", pagination={"limit": 0})
+    with pytest.raises(ValidationError):
+        fetch(1)
+
+
+def test_coroutine_functions():
+    @fast_validate_call
+    async def fetch_async(account: str, pagination: Optional[PaginationOptions] = None):
+        return pagination
+
+    assert asyncio.run(fetch_async("0x1")) is None
+    assert asyncio.run(fetch_async("0x1", {"limit": 2})) == PaginationOptions(limit=2)
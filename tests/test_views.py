@@ -0,0 +1,73 @@
+import copy
+import pickle
+
+import pytest
+
+from rss3_dsl_sdk.client import RSS3Client
+from rss3_dsl_sdk.schemas.enums import Network
+from rss3_dsl_sdk.schemas.exchange import ExchangeSwapActivities
+from rss3_dsl_sdk.schemas.registry import TypedActivities
+from rss3_dsl_sdk.views import LazyModel, ResultMode
+from tests.fakes import json_response, make_activity, make_page
+
+ACCOUNT = "0xd8da6bf26964af9d7eed9e03e53415d37aa96045"
+SWAP = {"from": {"symbol": "WETH", "value": "1.5"}, "to": {"symbol": "USDC", "value": "3000"}}
+
+
+def test_lazy_view_validates_fields_on_access():
+    payload = make_page([make_activity(tag="exchange", activity_type="swap", metadata=SWAP)])
+    payload["data"][0]["actions"][0]["metadata"] = {"from": "not a token"}
+    activities = LazyModel(ExchangeSwapActivities, payload)
+    activity = activities.data[0]
+    assert activity.network is Network.ETHEREUM
+    assert activity.status is True
+    assert activity.from_ == ACCOUNT
+    assert activity.fee is None
+    with pytest.raises(ValueError):
+        activity.actions[0].metadata.from_
+
+
+def test_lazy_view_matches_model():
+    payload = make_page([make_activity(tag="exchange", activity_type="swap", metadata=SWAP)], cursor="next")
+    view = LazyModel(ExchangeSwapActivities, payload)
+    model = ExchangeSwapActivities.model_validate(payload)
+    assert view.data[0].actions[0].metadata.to.value == model.data[0].actions[0].metadata.to.value
+    assert view.meta.cursor == "next"
+    assert view.model_build() == model
+    assert view.data[0].model_payload is payload["data"][0]
+    with pytest.raises(AttributeError):
+        view.missing
+
+
+def test_client_result_modes(dsl_server):
+    dsl_server.respond = lambda path, query: json_response(make_page([make_activity()]))
+    with RSS3Client(base_url=dsl_server.url, result_mode=ResultMode.LAZY) as client:
+        lazy = client.fetch_social_post_activities(ACCOUNT)
+        raw_client = client.with_result_mode(ResultMode.RAW)
+        raw = raw_client.fetch_social_post_activities(ACCOUNT)
+        assert raw_client.transport is client.transport
+        assert [activity["id"] for activity in raw_client.iter_activities(ACCOUNT)] == [raw["data"][0]["id"]]
+        assert [activity.id for activity in client.iter_social_post_activities(ACCOUNT)] == [lazy.data[0].id]
+    assert isinstance(lazy, LazyModel)
+    assert lazy.data[0].actions[0].metadata.body == "post 0"
+    assert raw["data"][0]["actions"][0]["metadata"]["body"] == "post 0"
+
+
+def test_lazy_view_does_not_shadow_fields():
+    activity = make_activity()
+    activity["calldata"] = {"raw": "0xa9059cbb"}
+    view = LazyModel(ExchangeSwapActivities, make_page([activity]))
+    assert view.data[0].calldata.raw == "0xa9059cbb"
+
+
+def test_lazy_view_copies_and_pickles():
+    activities = LazyModel(TypedActivities, make_page([make_activity(1)]))
+    assert activities.data[0].id == make_activity(1)["id"]
+    for clone in (copy.copy(activities), copy.deepcopy(activities), pickle.loads(pickle.dumps(activities))):
+        assert isinstance(clone, LazyModel)
+        assert clone.model_payload == activities.model_payload
+        assert clone.data[0].actions[0].metadata.body == "post 1"
+        assert clone.model_build() == activities.model_build()
+    assert copy.deepcopy(activities).model_payload is not activities.model_payload
+    with pytest.raises(AttributeError):
+        activities._missing